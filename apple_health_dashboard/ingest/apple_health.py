@@ -1,13 +1,15 @@
 from __future__ import annotations
 
-import xml.etree.ElementTree as ET
+import string
 from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
+from apple_health_dashboard.ingest.xml_stream import XmlSource, iter_elements
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class HealthRecord:
     """A normalized representation of an Apple Health <Record/>."""
 
@@ -21,25 +23,81 @@ class HealthRecord:
     value_str: str | None
 
 
+# type / unit / sourceName repeat across millions of records but only take a
+# few dozen distinct values; share one str object per distinct value.
+_INTERNED: dict[str, str] = {}
+
+
+def _intern(value: str | None) -> str | None:
+    if value is None:
+        return None
+    return _INTERNED.setdefault(value, value)
+
+
 def _parse_apple_datetime(value: str) -> datetime:
     """Parse Apple Health datetime strings.
 
     Typical format: '2020-01-01 12:34:56 +0100'
+
+    Since Python 3.11 datetime.fromisoformat accepts this layout directly and
+    parses it in C, roughly 10x faster than slicing the fields out by hand
+    (this runs three times per record). Anything it rejects, or that comes
+    back without an offset, goes through strptime so errors stay the same.
     """
-    return datetime.strptime(value, "%Y-%m-%d %H:%M:%S %z")
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        parsed = None
+    if parsed is None or parsed.tzinfo is None:
+        return datetime.strptime(value, "%Y-%m-%d %H:%M:%S %z")
+    return parsed
+
+
+def _apple_datetime_isoformat(value: str) -> str:
+    """Return _parse_apple_datetime(value).isoformat() without building the datetime.
+
+    isoformat() on an offset-aware datetime is the bulk of the cost of the
+    record/workout hashes, and the hashes are keyed on that exact string, so
+    rearrange the raw text instead. "-0000" normalises to "+00:00" in
+    isoformat(), so it (and anything off the fixed layout) takes the slow path.
+    """
+    if len(value) != 25 or value[20] not in "+-" or value[20:] == "-0000":
+        return _parse_apple_datetime(value).isoformat()
+    return f"{value[0:10]}T{value[11:19]}{value[20:23]}:{value[23:25]}"
 
 
-def iter_health_records_from_export_xml(export_xml_path: Path) -> Iterator[HealthRecord]:
-    """Stream records from an Apple Health export.xml.
+# Category records carry symbolic values ("HKCategoryValueSleepAnalysis...").
+# Spotting them by their first character skips raising and catching a
+# ValueError per row; n/i/N/I still go through float() so "nan"/"inf" parse
+# exactly as before.
+_NON_NUMERIC_FIRST_CHARS = frozenset(string.ascii_letters) - frozenset("nNiI")
 
-    This uses iterparse to avoid loading the full XML into memory.
-    """
-    context = ET.iterparse(export_xml_path, events=("end",))
 
-    for _event, elem in context:
-        if elem.tag != "Record":
-            continue
+def _to_float(value: str | None) -> float | None:
+    if value is None or value[:1] in _NON_NUMERIC_FIRST_CHARS:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
 
+
+def _raw_date(value: str) -> str:
+    return value
+
+
+def iter_health_record_rows(
+    export_xml_path: XmlSource, *, parse_dates: bool = True
+) -> Iterator[tuple]:
+    """Stream records as plain tuples in HealthRecord field order.
+
+    stats.to_dataframe takes these directly, so building a DataFrame from an
+    export skips the frozen dataclass per record (~1.3 us each to construct).
+    With parse_dates=False the three dates are left as Apple's raw strings,
+    for callers that convert them a whole column at a time.
+    """
+    parse_date = _parse_apple_datetime if parse_dates else _raw_date
+    for elem in iter_elements(export_xml_path, "Record"):
         attrib = elem.attrib
         record_type = attrib.get("type")
         start = attrib.get("startDate")
@@ -47,39 +105,30 @@ def iter_health_records_from_export_xml(export_xml_path: Path) -> Iterator[Healt
         creation = attrib.get("creationDate")
 
         if not record_type or not start or not end:
-            elem.clear()
             continue
 
-        unit = attrib.get("unit")
-        source_name = attrib.get("sourceName")
-
         raw_value = attrib.get("value")
-        value: float | None
-        value_str: str | None
-        if raw_value is None:
-            value = None
-            value_str = None
-        else:
-            try:
-                value = float(raw_value)
-                value_str = None
-            except ValueError:
-                value = None
-                value_str = raw_value
-
-        rec = HealthRecord(
-            type=record_type,
-            start_at=_parse_apple_datetime(start),
-            end_at=_parse_apple_datetime(end),
-            creation_at=_parse_apple_datetime(creation) if creation else None,
-            source_name=source_name,
-            unit=unit,
-            value=value,
-            value_str=value_str,
+        value = _to_float(raw_value)
+
+        yield (
+            _intern(record_type),
+            parse_date(start),
+            parse_date(end),
+            parse_date(creation) if creation else None,
+            _intern(attrib.get("sourceName")),
+            _intern(attrib.get("unit")),
+            value,
+            raw_value if value is None else None,
         )
 
-        yield rec
-        elem.clear()
+
+def iter_health_records_from_export_xml(export_xml_path: XmlSource) -> Iterator[HealthRecord]:
+    """Stream records from an Apple Health export.xml.
+
+    This uses iterparse to avoid loading the full XML into memory.
+    """
+    for row in iter_health_record_rows(export_xml_path):
+        yield HealthRecord(*row)
 
 
 def load_export_xml_from_path(export_xml_path: Path) -> list[HealthRecord]:
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-import xml.etree.ElementTree as ET
 from collections.abc import Iterator
 from dataclasses import dataclass
 from datetime import date
-from pathlib import Path
+
+from apple_health_dashboard.ingest.xml_stream import XmlSource, iter_elements
 
 
 def _to_int(value: str | None) -> int | None:
@@ -21,7 +21,7 @@ def _parse_apple_date(value: str) -> date:
     return date.fromisoformat(value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ActivitySummary:
     day: date
     active_energy_burned_kcal: int | None
@@ -32,28 +32,30 @@ class ActivitySummary:
     apple_stand_hours_goal: int | None
 
 
-def iter_activity_summaries_from_export_xml(export_xml_path: Path) -> Iterator[ActivitySummary]:
+def iter_activity_summaries_from_export_xml(
+    export_xml_path: XmlSource,
+) -> Iterator[ActivitySummary]:
     """Stream <ActivitySummary/> rows from an Apple Health export.xml."""
 
-    context = ET.iterparse(export_xml_path, events=("end",))
-    for _event, elem in context:
-        if elem.tag != "ActivitySummary":
-            continue
-
-        attrib = elem.attrib
-        day = attrib.get("dateComponents")
-        if not day:
-            elem.clear()
-            continue
-
-        yield ActivitySummary(
-            day=_parse_apple_date(day),
-            active_energy_burned_kcal=_to_int(attrib.get("activeEnergyBurned")),
-            active_energy_burned_goal_kcal=_to_int(attrib.get("activeEnergyBurnedGoal")),
-            apple_exercise_time_min=_to_int(attrib.get("appleExerciseTime")),
-            apple_exercise_time_goal_min=_to_int(attrib.get("appleExerciseTimeGoal")),
-            apple_stand_hours=_to_int(attrib.get("appleStandHours")),
-            apple_stand_hours_goal=_to_int(attrib.get("appleStandHoursGoal")),
-        )
-
-        elem.clear()
+    for elem in iter_elements(export_xml_path, "ActivitySummary"):
+        summary = activity_summary_from_element(elem)
+        if summary is not None:
+            yield summary
+
+
+def activity_summary_from_element(elem) -> ActivitySummary | None:
+    """Build an ActivitySummary from an <ActivitySummary/> element (None without a day)."""
+    attrib = elem.attrib
+    day = attrib.get("dateComponents")
+    if not day:
+        return None
+
+    return ActivitySummary(
+        day=_parse_apple_date(day),
+        active_energy_burned_kcal=_to_int(attrib.get("activeEnergyBurned")),
+        active_energy_burned_goal_kcal=_to_int(attrib.get("activeEnergyBurnedGoal")),
+        apple_exercise_time_min=_to_int(attrib.get("appleExerciseTime")),
+        apple_exercise_time_goal_min=_to_int(attrib.get("appleExerciseTimeGoal")),
+        apple_stand_hours=_to_int(attrib.get("appleStandHours")),
+        apple_stand_hours_goal=_to_int(attrib.get("appleStandHoursGoal")),
+    )
@@ -0,0 +1,42 @@
+"""Single-pass reader for everything the importer stores from an export.xml.
+
+Records, workouts and activity summaries are interleaved in one document, so
+the importer walks it once and dispatches on the element tag instead of
+re-parsing (and, for zips, re-inflating) the whole file per entity type.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Any
+
+from apple_health_dashboard.ingest.apple_health_activity_summary import (
+    activity_summary_from_element,
+)
+from apple_health_dashboard.ingest.apple_health_records import record_from_element
+from apple_health_dashboard.ingest.apple_health_workouts import workout_from_element
+from apple_health_dashboard.ingest.xml_stream import XmlSource, iter_elements
+
+_BUILDERS = {
+    "Record": record_from_element,
+    "Workout": workout_from_element,
+    "ActivitySummary": activity_summary_from_element,
+}
+
+EXPORT_TAGS = tuple(_BUILDERS)
+
+
+def iter_export_items_from_export_xml(export_xml_path: XmlSource) -> Iterator[tuple[str, Any]]:
+    """Stream (tag, item) pairs for every Record, Workout and ActivitySummary.
+
+    item is what the matching per-type iterator would yield:
+    - "Record": (Record, record_hash, list[RecordMetadata])
+    - "Workout": (Workout, list[WorkoutMetadata])
+    - "ActivitySummary": ActivitySummary
+
+    Elements missing required attributes are skipped, as in the per-type iterators.
+    """
+    for elem in iter_elements(export_xml_path, EXPORT_TAGS):
+        tag = elem.tag
+        item = _BUILDERS[tag](elem)
+        if item is not None:
+            yield tag, item
@@ -1,26 +1,21 @@
 from __future__ import annotations
 
-import xml.etree.ElementTree as ET
 from collections.abc import Iterator
 from dataclasses import dataclass
 from datetime import datetime
-from pathlib import Path
+from hashlib import sha256
+from typing import NamedTuple
 
+from apple_health_dashboard.ingest.apple_health import (
+    _NON_NUMERIC_FIRST_CHARS,
+    _apple_datetime_isoformat,
+    _intern,
+    _parse_apple_datetime,
+)
+from apple_health_dashboard.ingest.xml_stream import XmlSource, iter_elements
 
-def _parse_apple_datetime(value: str) -> datetime:
-    return datetime.strptime(value, "%Y-%m-%d %H:%M:%S %z")
 
-
-def _to_float(value: str | None) -> float | None:
-    if value is None:
-        return None
-    try:
-        return float(value)
-    except ValueError:
-        return None
-
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Record:
     """Normalized representation of an Apple Health <Record/>."""
 
@@ -34,76 +29,131 @@ class Record:
     value_str: str | None
 
 
-@dataclass(frozen=True)
-class RecordMetadata:
+class RecordMetadata(NamedTuple):
+    """One <MetadataEntry/>; a plain tuple, so batches go straight to executemany."""
+
     record_hash: str
     key: str
     value: str
 
 
-def stable_record_hash(record: Record) -> str:
-    import hashlib
-
+def stable_record_hash_str(
+    record_type: str,
+    start_iso: str,
+    end_iso: str,
+    creation_iso: str | None,
+    source_name: str | None,
+    unit: str | None,
+    value: float | None,
+    value_str: str | None,
+) -> str:
+    """Hash a record from its primitive fields.
+
+    Lets callers that already hold plain values (rows, DataFrame columns) get
+    the same hash as stable_record_hash without building a Record first.
+    """
+    # "|".join over the eight fields in this order; one f-string skips
+    # building the intermediate tuple, which matters once per record.
+    value_repr = "" if value is None else repr(value)
     payload = (
+        f"{record_type}|{start_iso}|{end_iso}|{creation_iso or ''}|"
+        f"{source_name or ''}|{unit or ''}|{value_repr}|{value_str or ''}"
+    )
+    return sha256(payload.encode()).hexdigest()
+
+
+def stable_record_hash(record: Record) -> str:
+    return stable_record_hash_str(
         record.record_type,
         record.start_at.isoformat(),
         record.end_at.isoformat(),
-        record.creation_at.isoformat() if record.creation_at else "",
-        record.source_name or "",
-        record.unit or "",
-        "" if record.value is None else repr(record.value),
-        record.value_str or "",
+        record.creation_at.isoformat() if record.creation_at else None,
+        record.source_name,
+        record.unit,
+        record.value,
+        record.value_str,
     )
-    return hashlib.sha256("|".join(payload).encode("utf-8")).hexdigest()
 
 
 def iter_records_from_export_xml(
-    export_xml_path: Path,
+    export_xml_path: XmlSource,
 ) -> Iterator[tuple[Record, list[RecordMetadata]]]:
     """Stream records (and their metadata) from an Apple Health export.xml."""
+    for record, _r_hash, metadata in iter_hashed_records_from_export_xml(export_xml_path):
+        yield record, metadata
 
-    context = ET.iterparse(export_xml_path, events=("end",))
-    for _event, elem in context:
-        if elem.tag != "Record":
-            continue
-
-        attrib = elem.attrib
-        record_type = attrib.get("type")
-        start = attrib.get("startDate")
-        end = attrib.get("endDate")
-
-        if not record_type or not start or not end:
-            elem.clear()
-            continue
-
-        raw_value = attrib.get("value")
-        value = _to_float(raw_value)
-        value_str = None if value is not None else raw_value
-
-        record = Record(
-            record_type=record_type,
-            start_at=_parse_apple_datetime(start),
-            end_at=_parse_apple_datetime(end),
-            creation_at=_parse_apple_datetime(attrib.get("creationDate"))
-            if attrib.get("creationDate")
-            else None,
-            source_name=attrib.get("sourceName"),
-            unit=attrib.get("unit"),
-            value=value,
-            value_str=value_str,
-        )
-
-        r_hash = stable_record_hash(record)
-
-        metadata: list[RecordMetadata] = []
-        for child in list(elem):
-            if child.tag != "MetadataEntry":
-                continue
+
+def iter_hashed_records_from_export_xml(
+    export_xml_path: XmlSource,
+) -> Iterator[tuple[Record, str, list[RecordMetadata]]]:
+    """Like iter_records_from_export_xml, but also yield each record's hash.
+
+    The hash is computed here anyway (metadata rows are keyed on it), so the
+    importer can store it instead of hashing every record a second time.
+    """
+
+    for elem in iter_elements(export_xml_path, "Record"):
+        parsed = record_from_element(elem)
+        if parsed is not None:
+            yield parsed
+
+
+def record_from_element(elem) -> tuple[Record, str, list[RecordMetadata]] | None:
+    """Build (record, record_hash, metadata) from a <Record/> element.
+
+    Returns None for records missing their type or dates.
+    """
+    # This runs once per record; bind the getter and inline _to_float.
+    get = elem.attrib.get
+    record_type = get("type")
+    start = get("startDate")
+    end = get("endDate")
+
+    if not record_type or not start or not end:
+        return None
+
+    raw_value = get("value")
+    value = None
+    if raw_value is not None and raw_value[:1] not in _NON_NUMERIC_FIRST_CHARS:
+        try:
+            value = float(raw_value)
+        except ValueError:
+            pass
+    value_str = None if value is not None else raw_value
+
+    creation = get("creationDate")
+    record_type = _intern(record_type)
+    record = Record(
+        record_type=record_type,
+        start_at=_parse_apple_datetime(start),
+        end_at=_parse_apple_datetime(end),
+        creation_at=_parse_apple_datetime(creation) if creation else None,
+        source_name=_intern(get("sourceName")),
+        unit=_intern(get("unit")),
+        value=value,
+        value_str=value_str,
+    )
+
+    # Same digest as stable_record_hash(record), minus three isoformat() calls.
+    r_hash = stable_record_hash_str(
+        record_type,
+        _apple_datetime_isoformat(start),
+        _apple_datetime_isoformat(end),
+        _apple_datetime_isoformat(creation) if creation else None,
+        record.source_name,
+        record.unit,
+        value,
+        value_str,
+    )
+
+    metadata: list[RecordMetadata] = []
+    # Most elements have no children; len() is far cheaper than findall().
+    if len(elem):
+        for child in elem.findall("MetadataEntry"):
             key = child.attrib.get("key")
             m_value = child.attrib.get("value")
             if key is None or m_value is None:
                 continue
-            metadata.append(RecordMetadata(record_hash=r_hash, key=key, value=m_value))
+            metadata.append(RecordMetadata(record_hash=r_hash, key=_intern(key), value=m_value))
 
-        yield record, metadata
-        elem.clear()
+    return record, r_hash, metadata
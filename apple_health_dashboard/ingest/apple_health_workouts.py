@@ -1,14 +1,16 @@
 from __future__ import annotations
 
-import xml.etree.ElementTree as ET
 from collections.abc import Iterator
 from dataclasses import dataclass
 from datetime import datetime
-from pathlib import Path
+from hashlib import sha256
+from typing import NamedTuple
 
-
-def _parse_apple_datetime(value: str) -> datetime:
-    return datetime.strptime(value, "%Y-%m-%d %H:%M:%S %z")
+from apple_health_dashboard.ingest.apple_health import (
+    _apple_datetime_isoformat,
+    _parse_apple_datetime,
+)
+from apple_health_dashboard.ingest.xml_stream import XmlSource, iter_elements
 
 
 def _to_float(value: str | None) -> float | None:
@@ -20,7 +22,7 @@ def _to_float(value: str | None) -> float | None:
         return None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Workout:
     """Normalized representation of an Apple Health <Workout/>."""
 
@@ -35,74 +37,111 @@ class Workout:
     total_distance_m: float | None
 
 
-@dataclass(frozen=True)
-class WorkoutMetadata:
+class WorkoutMetadata(NamedTuple):
+    """One <MetadataEntry/>; a plain tuple, so batches go straight to executemany."""
+
     workout_hash: str
     key: str
     value: str
 
 
-def stable_workout_hash(workout: Workout) -> str:
-    import hashlib
-
+def stable_workout_hash_str(
+    workout_activity_type: str,
+    start_iso: str,
+    end_iso: str,
+    creation_iso: str | None,
+    source_name: str | None,
+    device: str | None,
+    duration_s: float | None,
+    total_energy_kcal: float | None,
+    total_distance_m: float | None,
+) -> str:
+    """Hash a workout from its primitive fields (same digest as stable_workout_hash)."""
     payload = (
+        workout_activity_type,
+        start_iso,
+        end_iso,
+        creation_iso or "",
+        source_name or "",
+        device or "",
+        "" if duration_s is None else repr(duration_s),
+        "" if total_energy_kcal is None else repr(total_energy_kcal),
+        "" if total_distance_m is None else repr(total_distance_m),
+    )
+    return sha256("|".join(payload).encode()).hexdigest()
+
+
+def stable_workout_hash(workout: Workout) -> str:
+    return stable_workout_hash_str(
         workout.workout_activity_type,
         workout.start_at.isoformat(),
         workout.end_at.isoformat(),
-        workout.creation_at.isoformat() if workout.creation_at else "",
-        workout.source_name or "",
-        workout.device or "",
-        "" if workout.duration_s is None else repr(workout.duration_s),
-        "" if workout.total_energy_kcal is None else repr(workout.total_energy_kcal),
-        "" if workout.total_distance_m is None else repr(workout.total_distance_m),
+        workout.creation_at.isoformat() if workout.creation_at else None,
+        workout.source_name,
+        workout.device,
+        workout.duration_s,
+        workout.total_energy_kcal,
+        workout.total_distance_m,
     )
-    return hashlib.sha256("|".join(payload).encode("utf-8")).hexdigest()
 
 
 def iter_workouts_from_export_xml(
-    export_xml_path: Path,
+    export_xml_path: XmlSource,
 ) -> Iterator[tuple[Workout, list[WorkoutMetadata]]]:
     """Stream workouts (and their metadata) from an Apple Health export.xml."""
 
-    context = ET.iterparse(export_xml_path, events=("end",))
-    for _event, elem in context:
-        if elem.tag != "Workout":
-            continue
-
-        attrib = elem.attrib
-        workout_type = attrib.get("workoutActivityType")
-        start = attrib.get("startDate")
-        end = attrib.get("endDate")
-
-        if not workout_type or not start or not end:
-            elem.clear()
-            continue
-
-        workout = Workout(
-            workout_activity_type=workout_type,
-            start_at=_parse_apple_datetime(start),
-            end_at=_parse_apple_datetime(end),
-            creation_at=_parse_apple_datetime(attrib.get("creationDate"))
-            if attrib.get("creationDate")
-            else None,
-            source_name=attrib.get("sourceName"),
-            device=attrib.get("device"),
-            duration_s=_to_float(attrib.get("duration")),
-            total_energy_kcal=_to_float(attrib.get("totalEnergyBurned")),
-            total_distance_m=_to_float(attrib.get("totalDistance")),
-        )
-
-        w_hash = stable_workout_hash(workout)
-
-        metadata: list[WorkoutMetadata] = []
-        for child in list(elem):
-            if child.tag != "MetadataEntry":
-                continue
+    for elem in iter_elements(export_xml_path, "Workout"):
+        parsed = workout_from_element(elem)
+        if parsed is not None:
+            yield parsed
+
+
+def workout_from_element(elem) -> tuple[Workout, list[WorkoutMetadata]] | None:
+    """Build (workout, metadata) from a <Workout/> element.
+
+    Returns None for workouts missing their activity type or dates.
+    """
+    attrib = elem.attrib
+    workout_type = attrib.get("workoutActivityType")
+    start = attrib.get("startDate")
+    end = attrib.get("endDate")
+
+    if not workout_type or not start or not end:
+        return None
+
+    creation = attrib.get("creationDate")
+    workout = Workout(
+        workout_activity_type=workout_type,
+        start_at=_parse_apple_datetime(start),
+        end_at=_parse_apple_datetime(end),
+        creation_at=_parse_apple_datetime(creation) if creation else None,
+        source_name=attrib.get("sourceName"),
+        device=attrib.get("device"),
+        duration_s=_to_float(attrib.get("duration")),
+        total_energy_kcal=_to_float(attrib.get("totalEnergyBurned")),
+        total_distance_m=_to_float(attrib.get("totalDistance")),
+    )
+
+    w_hash = stable_workout_hash_str(
+        workout_type,
+        _apple_datetime_isoformat(start),
+        _apple_datetime_isoformat(end),
+        _apple_datetime_isoformat(creation) if creation else None,
+        workout.source_name,
+        workout.device,
+        workout.duration_s,
+        workout.total_energy_kcal,
+        workout.total_distance_m,
+    )
+
+    metadata: list[WorkoutMetadata] = []
+    # Most elements have no children; len() is far cheaper than findall().
+    if len(elem):
+        for child in elem.findall("MetadataEntry"):
             key = child.attrib.get("key")
             value = child.attrib.get("value")
             if key is None or value is None:
                 continue
             metadata.append(WorkoutMetadata(workout_hash=w_hash, key=key, value=value))
 
-        yield workout, metadata
-        elem.clear()
+    return workout, metadata
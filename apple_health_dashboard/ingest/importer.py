@@ -1,24 +1,56 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from contextlib import closing, contextmanager
 from pathlib import Path
 
-from apple_health_dashboard.ingest.apple_health_activity_summary import (
-    iter_activity_summaries_from_export_xml,
-)
+from apple_health_dashboard.ingest.apple_health_export import iter_export_items_from_export_xml
 from apple_health_dashboard.ingest.apple_health_records import (
-    iter_records_from_export_xml,
+    Record,
+    RecordMetadata,
+    iter_hashed_records_from_export_xml,
 )
-from apple_health_dashboard.ingest.apple_health_workouts import iter_workouts_from_export_xml
+from apple_health_dashboard.ingest.xml_shards import iter_export_items_sharded
+from apple_health_dashboard.ingest.xml_stream import open_export_xml
 from apple_health_dashboard.storage.duckdb_store import (
+    bulk_import,
+    get_ingest_counters,
     init_db,
     open_db,
+    record_ingest,
     upsert_activity_summaries,
     upsert_record_metadata,
-    upsert_records,
+    upsert_record_rows,
     upsert_workouts,
 )
 
+
+def _record_row(rec: Record, r_hash: str) -> tuple:
+    """health_record row for a parsed Record, in upsert_record_rows column order."""
+    return (
+        rec.record_type,
+        rec.start_at,
+        rec.end_at,
+        rec.creation_at,
+        rec.source_name,
+        rec.unit,
+        rec.value,
+        rec.value_str,
+        r_hash,
+    )
+
+
+@contextmanager
+def _open_export_items(export_xml_path: Path, parse_workers: int) -> Iterator[Iterator[tuple]]:
+    """Stream (tag, item) pairs, sharding plain export.xml files across processes."""
+    if parse_workers > 1 and Path(export_xml_path).suffix.lower() != ".zip":
+        with closing(iter_export_items_sharded(export_xml_path, workers=parse_workers)) as items:
+            yield items
+    else:
+        with open_export_xml(export_xml_path) as fh:
+            yield iter_export_items_from_export_xml(fh)
+
+
 # Backwards-compatible helper: imports only records (no metadata, no workouts).
 # Kept for earlier callers, but the app uses import_export_xml_to_duckdb_all.
 
@@ -26,45 +58,30 @@ def import_export_xml_to_duckdb(
     export_xml_path: Path,
     db_path: Path,
     *,
-    batch_size: int = 2000,
+    batch_size: int = 5000,
     on_progress: Callable[[int], None] | None = None,
 ) -> int:
     processed = 0
     inserted_total = 0
 
-    con = open_db(db_path)
+    con = open_db(db_path, for_import=True)
     try:
         init_db(con)
-
-        batch: list = []
-        for rec, _meta in iter_records_from_export_xml(export_xml_path):
-            # Convert to legacy HealthRecord shape by reusing existing DuckDB writer.
-            # (We keep the storage layer stable by continuing to write HealthRecord rows.)
-            from apple_health_dashboard.ingest.apple_health import HealthRecord
-
-            batch.append(
-                HealthRecord(
-                    type=rec.record_type,
-                    start_at=rec.start_at,
-                    end_at=rec.end_at,
-                    creation_at=rec.creation_at,
-                    source_name=rec.source_name,
-                    unit=rec.unit,
-                    value=rec.value,
-                    value_str=rec.value_str,
-                )
-            )
-            processed += 1
-
-            if on_progress and processed % 250 == 0:
-                on_progress(processed)
-
-            if len(batch) >= batch_size:
-                inserted_total += upsert_records(con, batch)
-                batch.clear()
-
-        if batch:
-            inserted_total += upsert_records(con, batch)
+        with bulk_import(con):
+            batch: list[tuple] = []
+            with open_export_xml(export_xml_path) as fh:
+                for rec, r_hash, _meta in iter_hashed_records_from_export_xml(fh):
+                    batch.append(_record_row(rec, r_hash))
+                    processed += 1
+
+                    if len(batch) >= batch_size:
+                        inserted_total += upsert_record_rows(con, batch)
+                        batch.clear()
+                        if on_progress:
+                            on_progress(processed)
+
+            if batch:
+                inserted_total += upsert_record_rows(con, batch)
 
         if on_progress:
             on_progress(processed)
@@ -78,121 +95,143 @@ def import_export_xml_to_duckdb_all(
     export_xml_path: Path,
     db_path: Path,
     *,
-    record_batch_size: int = 2000,
+    record_batch_size: int = 5000,
     workout_batch_size: int = 300,
     on_progress: Callable[[str, int], None] | None = None,
+    force: bool = False,
+    parse_workers: int = 1,
 ) -> dict[str, int]:
-    """Import Records (+metadata) + Workouts (+metadata) + ActivitySummary into DuckDB."""
-
-    con = open_db(db_path)
-    try:
-        init_db(con)
-
-        # Records (+ metadata)
-        from apple_health_dashboard.ingest.apple_health import HealthRecord
-
-        records_processed = 0
-        records_inserted = 0
-        record_metadata_inserted = 0
-
-        record_batch: list[HealthRecord] = []
-        record_meta_rows: list[tuple[str, str, str]] = []
-
-        for rec, meta in iter_records_from_export_xml(export_xml_path):
-            record_batch.append(
-                HealthRecord(
-                    type=rec.record_type,
-                    start_at=rec.start_at,
-                    end_at=rec.end_at,
-                    creation_at=rec.creation_at,
-                    source_name=rec.source_name,
-                    unit=rec.unit,
-                    value=rec.value,
-                    value_str=rec.value_str,
-                )
-            )
-            record_meta_rows.extend([(m.record_hash, m.key, m.value) for m in meta])
+    """Import Records (+metadata) + Workouts (+metadata) + ActivitySummary into DuckDB.
 
-            records_processed += 1
-            if on_progress and records_processed % 500 == 0:
-                on_progress("records", records_processed)
+    export_xml_path may point at export.xml or directly at Apple's export.zip.
+    The document is parsed once for all three entity types, the whole import
+    runs in one transaction, and on_progress fires once per flushed batch
+    rather than per row.
 
-            if len(record_batch) >= record_batch_size:
-                records_inserted += upsert_records(con, record_batch)
-                record_metadata_inserted += upsert_record_metadata(con, record_meta_rows)
-                record_batch.clear()
-                record_meta_rows.clear()
-
-        if record_batch or record_meta_rows:
-            records_inserted += upsert_records(con, record_batch)
-            record_metadata_inserted += upsert_record_metadata(con, record_meta_rows)
+    Each finished import is logged with the file's mtime and size. Importing
+    the same, unchanged file again skips it without re-parsing, unless
+    force=True: every counter is 0 and "skipped" is True (False otherwise).
 
-        if on_progress:
-            on_progress("records", records_processed)
+    With parse_workers > 1 an uncompressed export.xml is parsed in that many
+    worker processes (see xml_shards); the DuckDB writes stay in this process.
+    """
+    source = Path(export_xml_path)
+    source_key = str(source.resolve())
+    source_stat = source.stat()
 
-        # ActivitySummary (rings)
-        activity_processed = 0
-        activity_inserted = 0
-        activity_rows = []
-
-        for s in iter_activity_summaries_from_export_xml(export_xml_path):
-            activity_rows.append(
-                (
-                    s.day.isoformat(),
-                    s.active_energy_burned_kcal,
-                    s.active_energy_burned_goal_kcal,
-                    s.apple_exercise_time_min,
-                    s.apple_exercise_time_goal_min,
-                    s.apple_stand_hours,
-                    s.apple_stand_hours_goal,
-                )
+    con = open_db(db_path, for_import=True)
+    try:
+        init_db(con)
+        if not force:
+            cached = get_ingest_counters(
+                con, source_key, mtime_ns=source_stat.st_mtime_ns, size=source_stat.st_size
             )
-            activity_processed += 1
+            if cached is not None:
+                return {**dict.fromkeys(cached, 0), "skipped": True}
+
+        with bulk_import(con):
+            records_processed = 0
+            records_inserted = 0
+            record_metadata_inserted = 0
+
+            record_batch: list[tuple] = []
+            record_meta_rows: list[RecordMetadata] = []
+
+            activity_processed = 0
+            activity_inserted = 0
+            activity_rows = []
+
+            workouts_processed = 0
+            workouts_inserted_total = 0
+            workout_meta_inserted_total = 0
+
+            workout_batch = []
+            meta_batch = []
+
+            # One pass over the document; each entity type keeps its own batch.
+            with _open_export_items(export_xml_path, parse_workers) as items:
+                for tag, item in items:
+                    if tag == "Record":
+                        rec, r_hash, meta = item
+                        record_batch.append(_record_row(rec, r_hash))
+                        record_meta_rows += meta
+
+                        records_processed += 1
+
+                        if len(record_batch) >= record_batch_size:
+                            records_inserted += upsert_record_rows(con, record_batch)
+                            record_metadata_inserted += upsert_record_metadata(
+                                con, record_meta_rows
+                            )
+                            record_batch.clear()
+                            record_meta_rows.clear()
+                            if on_progress:
+                                on_progress("records", records_processed)
+
+                    elif tag == "ActivitySummary":
+                        activity_rows.append(
+                            (
+                                item.day.isoformat(),
+                                item.active_energy_burned_kcal,
+                                item.active_energy_burned_goal_kcal,
+                                item.apple_exercise_time_min,
+                                item.apple_exercise_time_goal_min,
+                                item.apple_stand_hours,
+                                item.apple_stand_hours_goal,
+                            )
+                        )
+                        activity_processed += 1
+
+                        if len(activity_rows) >= 365:
+                            activity_inserted += upsert_activity_summaries(con, activity_rows)
+                            activity_rows.clear()
+
+                    else:
+                        workout, metadata = item
+                        workout_batch.append(workout)
+                        meta_batch.extend(metadata)
+                        workouts_processed += 1
+
+                        if len(workout_batch) >= workout_batch_size:
+                            w_i, m_i = upsert_workouts(con, workout_batch, meta_batch)
+                            workouts_inserted_total += w_i
+                            workout_meta_inserted_total += m_i
+                            workout_batch.clear()
+                            meta_batch.clear()
+                            if on_progress:
+                                on_progress("workouts", workouts_processed)
+
+            if record_batch or record_meta_rows:
+                records_inserted += upsert_record_rows(con, record_batch)
+                record_metadata_inserted += upsert_record_metadata(con, record_meta_rows)
 
-            if len(activity_rows) >= 365:
+            if activity_rows:
                 activity_inserted += upsert_activity_summaries(con, activity_rows)
-                activity_rows.clear()
 
-        if activity_rows:
-            activity_inserted += upsert_activity_summaries(con, activity_rows)
-
-        # Workouts (+ metadata)
-        workouts_processed = 0
-        workouts_inserted_total = 0
-        workout_meta_inserted_total = 0
-
-        workout_batch = []
-        meta_batch = []
-
-        for workout, metadata in iter_workouts_from_export_xml(export_xml_path):
-            workout_batch.append(workout)
-            meta_batch.extend(metadata)
-            workouts_processed += 1
-
-            if on_progress and workouts_processed % 50 == 0:
-                on_progress("workouts", workouts_processed)
-
-            if len(workout_batch) >= workout_batch_size:
+            if workout_batch or meta_batch:
                 w_i, m_i = upsert_workouts(con, workout_batch, meta_batch)
                 workouts_inserted_total += w_i
                 workout_meta_inserted_total += m_i
-                workout_batch.clear()
-                meta_batch.clear()
 
-        if workout_batch or meta_batch:
-            w_i, m_i = upsert_workouts(con, workout_batch, meta_batch)
-            workouts_inserted_total += w_i
-            workout_meta_inserted_total += m_i
+            counters = {
+                "records_inserted": records_inserted,
+                "record_metadata_inserted": record_metadata_inserted,
+                "activity_summaries_inserted": activity_inserted,
+                "workouts_inserted": workouts_inserted_total,
+                "workout_metadata_inserted": workout_meta_inserted_total,
+            }
+            record_ingest(
+                con,
+                source_key,
+                mtime_ns=source_stat.st_mtime_ns,
+                size=source_stat.st_size,
+                counters=counters,
+            )
 
         if on_progress:
+            on_progress("records", records_processed)
             on_progress("workouts", workouts_processed)
 
-        return {
-            "records_inserted": records_inserted,
-            "record_metadata_inserted": record_metadata_inserted,
-            "activity_summaries_inserted": activity_inserted,
-            "workouts_inserted": workouts_inserted_total,
-            "workout_metadata_inserted": workout_meta_inserted_total,
-        }
+        return {**counters, "skipped": False}
     finally:
         con.close()
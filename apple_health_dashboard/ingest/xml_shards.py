@@ -0,0 +1,118 @@
+"""Parse an uncompressed export.xml in parallel byte-range shards.
+
+export.xml is a flat list of elements under <HealthData>, so it can be cut at
+element start tags into independent fragments. Each fragment is parsed in a
+worker process (wrapped in a synthetic <HealthData> root) and the parent
+yields the results shard by shard, in document order, exactly as the serial
+iter_export_items_from_export_xml would.
+
+Only Correlation elements nest Records, so cuts are never placed inside one.
+Zipped exports can't be sliced without inflating them first; callers fall back
+to the serial parser for those.
+"""
+from __future__ import annotations
+
+import mmap
+import multiprocessing
+import os
+import re
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from io import BytesIO
+from typing import Any
+
+from apple_health_dashboard.ingest.apple_health_export import iter_export_items_from_export_xml
+
+DEFAULT_SHARD_SIZE = 32 << 20
+
+_CUT_CANDIDATE = re.compile(rb"<(?:Record|Workout|ActivitySummary)[\s/>]")
+_ROOT_OPEN = re.compile(rb"<HealthData[\s>]")
+_ROOT_CLOSE = b"</HealthData>"
+_CORRELATION_OPEN = b"<Correlation"
+_CORRELATION_CLOSE = b"</Correlation>"
+
+
+def shard_ranges(buf: Any, shard_size: int = DEFAULT_SHARD_SIZE) -> list[tuple[int, int]]:
+    """Split the body of <HealthData> into [lo, hi) byte ranges of about shard_size.
+
+    Returns an empty list when the document doesn't look like an export.xml.
+    """
+    root = _ROOT_OPEN.search(buf)
+    body_end = buf.rfind(_ROOT_CLOSE)
+    if root is None or body_end < 0:
+        return []
+    body_start = buf.find(b">", root.start()) + 1
+
+    ranges: list[tuple[int, int]] = []
+    lo = body_start
+    while True:
+        cut = _next_cut(buf, lo, lo + shard_size, body_end)
+        if cut is None:
+            ranges.append((lo, body_end))
+            return ranges
+        ranges.append((lo, cut))
+        lo = cut
+
+
+def _next_cut(buf: Any, lo: int, pos: int, end: int) -> int | None:
+    """First element start at or after pos that is not inside a Correlation."""
+    while pos < end:
+        m = _CUT_CANDIDATE.search(buf, pos, end)
+        if m is None:
+            return None
+        cut = m.start()
+        # lo is itself outside any Correlation, so an enclosing one opens after it.
+        if buf.rfind(_CORRELATION_OPEN, lo, cut) <= buf.rfind(_CORRELATION_CLOSE, lo, cut):
+            return cut
+        close = buf.find(_CORRELATION_CLOSE, cut, end)
+        if close < 0:
+            return None
+        pos = close + len(_CORRELATION_CLOSE)
+    return None
+
+
+def _parse_shard(path: str, lo: int, hi: int) -> list[tuple[str, Any]]:
+    with open(path, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        fragment = b"<HealthData>" + mm[lo:hi] + _ROOT_CLOSE
+    return list(iter_export_items_from_export_xml(BytesIO(fragment)))
+
+
+def iter_export_items_sharded(
+    export_xml_path: str | os.PathLike[str],
+    *,
+    workers: int,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+) -> Iterator[tuple[str, Any]]:
+    """Like iter_export_items_from_export_xml, parsing shards in worker processes.
+
+    At most 2 * workers shards are in flight, so memory stays bounded even
+    when the consumer (the DuckDB writer) is slower than the parsers. Files
+    that yield fewer than two shards are parsed serially in-process.
+    """
+    path = os.fspath(export_xml_path)
+    if os.path.getsize(path) == 0:
+        yield from iter_export_items_from_export_xml(path)
+        return
+    with open(path, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        ranges = shard_ranges(mm, shard_size)
+
+    if workers < 2 or len(ranges) < 2:
+        yield from iter_export_items_from_export_xml(path)
+        return
+
+    # spawn rather than fork: the importer runs inside Streamlit's threaded server.
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+        todo = iter(ranges)
+        pending: deque[Future] = deque()
+        for lo, hi in todo:
+            pending.append(pool.submit(_parse_shard, path, lo, hi))
+            if len(pending) >= 2 * workers:
+                break
+        while pending:
+            items = pending.popleft().result()
+            nxt = next(todo, None)
+            if nxt is not None:
+                pending.append(pool.submit(_parse_shard, path, *nxt))
+            yield from items
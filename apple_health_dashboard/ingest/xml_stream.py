@@ -0,0 +1,90 @@
+"""Shared streaming helpers for the Apple Health export.xml parsers.
+
+lxml is preferred: its iterparse filters on tag names inside libxml2, so the
+Python loop only ever sees the elements we care about. The stdlib parser is
+kept as a fallback so the ingest modules keep working without lxml.
+"""
+from __future__ import annotations
+
+import os
+import zipfile
+from collections.abc import Collection, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Any
+
+try:
+    from lxml import etree as ET
+
+    HAVE_LXML = True
+except ImportError:  # pragma: no cover - exercised only without lxml installed
+    import xml.etree.ElementTree as ET
+
+    HAVE_LXML = False
+
+XmlSource = str | os.PathLike[str] | IO[bytes]
+
+
+def find_export_xml_member(zf: zipfile.ZipFile) -> str:
+    """Return the name of the export.xml member inside an Apple Health export.zip."""
+    candidates = [n for n in zf.namelist() if n.endswith("export.xml")]
+    if not candidates:
+        raise ValueError("No export.xml found in the zip.")
+    return min(candidates, key=len)
+
+
+@contextmanager
+def open_export_xml(path: str | os.PathLike[str]) -> Iterator[IO[bytes]]:
+    """Open an export.xml, or the export.xml inside an export.zip, for reading.
+
+    Zip members are decompressed on the fly, so an upload never has to be
+    extracted to disk before it can be parsed.
+    """
+    if Path(path).suffix.lower() == ".zip":
+        with zipfile.ZipFile(path) as zf, zf.open(find_export_xml_member(zf)) as fh:
+            yield fh
+    else:
+        with open(path, "rb") as fh:
+            yield fh
+
+
+def iter_elements(source: XmlSource, tag: str | Collection[str]) -> Iterator[Any]:
+    """Yield every completed <tag/> element from an export.xml.
+
+    ``tag`` may also be a collection of tag names, so a single pass can feed
+    several consumers; dispatch on ``elem.tag``.
+
+    The element is cleared (and detached from the tree together with any
+    already-processed siblings) once the caller advances the iterator, so
+    memory stays flat on multi-GB exports. Callers must read what they need
+    from the element before moving on.
+    """
+    if isinstance(source, os.PathLike):
+        source = os.fspath(source)
+    tags = (tag,) if isinstance(tag, str) else tuple(tag)
+
+    if HAVE_LXML:
+        # huge_tree lifts libxml2's text-node and depth limits, which very
+        # large exports (long workout routes, years of records) can hit.
+        context = ET.iterparse(source, events=("end",), tag=tags, huge_tree=True)
+        for _event, elem in context:
+            yield elem
+            elem.clear(keep_tail=True)
+            parent = elem.getparent()
+            while elem.getprevious() is not None:
+                del parent[0]
+        return
+
+    # ElementTree has no parent pointers; grab the root from the first start
+    # event and empty it instead, so cleared elements don't pile up under it.
+    # It also has no tag filter, so every event reaches this loop; keep the
+    # per-event test to a frozenset lookup.
+    wanted = frozenset(tags)
+    context = ET.iterparse(source, events=("start", "end"))
+    _event, root = next(context)
+    for event, elem in context:
+        if event != "end" or elem.tag not in wanted:
+            continue
+        yield elem
+        elem.clear()
+        root.clear()
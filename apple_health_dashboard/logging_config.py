@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from logging.handlers import MemoryHandler
 from pathlib import Path
 
 
@@ -8,21 +9,22 @@ def configure_logging(log_dir: Path | None = None) -> None:
     """Configure basic local logging.
 
     - Logs to console
-    - Logs to a local file (default: ./.tmp/app.log)
+    - Logs to a local file (default: ./.tmp/app.log), buffered in batches of
+      up to 100 lines; warnings and errors flush the buffer straight away
 
     This is intentionally simple and local-only.
     """
+    root = logging.getLogger()
+    if root.handlers:
+        # Avoid duplicate handlers on Streamlit reruns.
+        return
+
     if log_dir is None:
         log_dir = Path.cwd() / ".tmp"
     log_dir.mkdir(parents=True, exist_ok=True)
 
     log_path = log_dir / "app.log"
 
-    root = logging.getLogger()
-    if root.handlers:
-        # Avoid duplicate handlers on Streamlit reruns.
-        return
-
     root.setLevel(logging.INFO)
 
     fmt = logging.Formatter("%(asctime)s %(levelname)s %(name)s - %(message)s")
@@ -31,9 +33,14 @@ def configure_logging(log_dir: Path | None = None) -> None:
     ch.setLevel(logging.INFO)
     ch.setFormatter(fmt)
 
-    fh = logging.FileHandler(log_path, encoding="utf-8")
+    fh = logging.FileHandler(log_path, encoding="utf-8", delay=True)
     fh.setLevel(logging.INFO)
     fh.setFormatter(fmt)
 
+    # One write per batch instead of a flush per line. logging's own atexit
+    # shutdown closes (and so flushes) the buffer.
+    mh = MemoryHandler(capacity=100, flushLevel=logging.WARNING, target=fh)
+    mh.setLevel(logging.INFO)
+
     root.addHandler(ch)
-    root.addHandler(fh)
+    root.addHandler(mh)
@@ -20,6 +20,8 @@ def activity_summaries_to_dataframe(rows: Iterable[dict]) -> pd.DataFrame:
             ]
         )
 
-    df["day"] = pd.to_datetime(df["day"], errors="coerce")
+    # Days arrive as datetime.date (from DuckDB) or "YYYY-MM-DD" strings; the
+    # ISO8601 path parses both without per-value format inference.
+    df["day"] = pd.to_datetime(df["day"], format="ISO8601", errors="coerce")
     df = df.sort_values("day")
     return df
@@ -16,8 +16,16 @@ def apply_date_filter(df: pd.DataFrame, date_filter: DateFilter) -> pd.DataFrame
         return df
 
     start_at = df["start_at"]
+    if start_at.is_monotonic_increasing:
+        # records_dataframe sorts by start_at (and row subsets keep that
+        # order): binary-search the bounds instead of building two masks.
+        lo = start_at.searchsorted(date_filter.start, side="left")
+        hi = start_at.searchsorted(date_filter.end, side="right")
+        return df.iloc[lo:hi]
+
     mask = (start_at >= date_filter.start) & (start_at <= date_filter.end)
-    return df.loc[mask].copy()
+    # Boolean indexing already returns a new frame; no extra .copy() needed.
+    return df.loc[mask]
 
 
 def infer_date_filter(df: pd.DataFrame, *, preset: str) -> DateFilter | None:
@@ -177,7 +177,7 @@ def hr_zone_distribution(df: pd.DataFrame, *, max_hr: int = 185) -> pd.DataFrame
     if hr.empty or "value" not in hr.columns:
         return pd.DataFrame(columns=["zone", "minutes", "pct"])
 
-    hr = hr[hr["value"].notna() & hr["start_at"].notna() & hr["end_at"].notna()].copy()
+    hr = hr[hr["value"].notna() & hr["start_at"].notna() & hr["end_at"].notna()]
     if hr.empty:
         return pd.DataFrame(columns=["zone", "minutes", "pct"])
 
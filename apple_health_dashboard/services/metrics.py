@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cache
 
 
 @dataclass(frozen=True)
@@ -529,6 +530,9 @@ CATEGORY_EMOJI: dict[str, str] = {
 }
 
 
+# Pages label the same few hundred types on every rerun (search filters,
+# selectbox format_funcs); memoise so the fallback split runs once per type.
+@cache
 def metric_label(record_type: str) -> str:
     m = _METRIC_BY_TYPE.get(record_type)
     if m:
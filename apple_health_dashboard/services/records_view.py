@@ -13,21 +13,23 @@ def split_numeric_categorical(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFr
         return df, df
 
     numeric_value = pd.to_numeric(df.get("value"), errors="coerce")
-    numeric = df.copy()
-    numeric["value_num"] = numeric_value
-    numeric = numeric[numeric["value_num"].notna()].copy()
-
-    categorical = df.copy()
-    categorical = categorical[categorical.get("value_str").notna()].copy()
-
-    # Also include rows where numeric couldn't be parsed but 'value' exists as a string.
-    if "value" in df.columns:
-        value_as_obj = df["value"].astype("string")
-        categorical_extra = df[numeric_value.isna() & value_as_obj.notna()].copy()
-        if not categorical_extra.empty:
-            mask = numeric_value.isna() & value_as_obj.notna()
-            categorical_extra["value_str"] = value_as_obj[mask]
-            categorical = pd.concat([categorical, categorical_extra], ignore_index=True)
+    has_number = numeric_value.notna()
+    numeric = df.loc[has_number].assign(value_num=numeric_value[has_number])
+
+    categorical = df.loc[df.get("value_str").notna()]
+
+    # Also include rows where numeric couldn't be parsed but 'value' exists as a
+    # string. A numeric 'value' column parses wherever it is non-null, so only
+    # object/string columns can contribute such rows.
+    if "value" in df.columns and not pd.api.types.is_numeric_dtype(df["value"]):
+        value_as_str = df["value"].astype("string")
+        extra_mask = ~has_number & value_as_str.notna()
+        if extra_mask.any():
+            categorical_extra = df.loc[extra_mask].assign(value_str=value_as_str[extra_mask])
+            # Skip an empty frame rather than concat it; pandas is deprecating
+            # how empty entries affect the result dtypes.
+            frames = [f for f in (categorical, categorical_extra) if not f.empty]
+            categorical = pd.concat(frames, ignore_index=True)
 
     categorical = categorical.drop_duplicates()
     return numeric, categorical
@@ -41,12 +43,10 @@ def top_value_counts(df: pd.DataFrame, *, limit: int = 25) -> pd.DataFrame:
     if s is None:
         return pd.DataFrame(columns=["value", "count"])
 
-    out = (
-        s.astype("string")
-        .fillna("(null)")
-        .value_counts(dropna=False)
-        .head(limit)
-        .reset_index()
-    )
+    # Count first, then label the few distinct values, rather than casting every row.
+    # Raw values that print the same (1 and "1") re-sum into one label.
+    counts = s.value_counts(dropna=False, sort=False)
+    labels = counts.index.astype(object).fillna("(null)").astype("string")
+    out = counts.groupby(labels, sort=False).sum().nlargest(limit).reset_index()
     out.columns = ["value", "count"]
     return out
@@ -52,14 +52,12 @@ def sleep_value_counts(df: pd.DataFrame, *, limit: int = 20) -> pd.DataFrame:
     if s is None:
         return pd.DataFrame(columns=["stage", "count"])
 
-    out = (
-        s.astype("string")
-        .fillna("(null)")
-        .map(lambda v: SLEEP_STAGES.get(v, v))
-        .value_counts(dropna=False)
-        .head(limit)
-        .reset_index()
-    )
+    # Count first, then map the few distinct values to stage names; distinct
+    # raw values can share a label, so re-sum by label before ranking.
+    counts = s.value_counts(dropna=False, sort=False)
+    raw = counts.index.astype(object).fillna("(null)").astype(str)
+    labels = [SLEEP_STAGES.get(v, v) for v in raw]
+    out = counts.groupby(labels, sort=False).sum().nlargest(limit).reset_index()
     out.columns = ["stage", "count"]
     return out
 
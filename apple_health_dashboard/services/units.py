@@ -3,30 +3,50 @@ from __future__ import annotations
 import pandas as pd
 
 
+def _single_unit(unit: pd.Series) -> str | None:
+    """Return the one distinct non-null unit in *unit*, or None if there are 0 or 2+.
+
+    Categorical columns are checked on their integer codes. Their categories
+    can't be used directly, since a filtered frame still carries every unit
+    of the full table.
+    """
+    if isinstance(unit.dtype, pd.CategoricalDtype):
+        codes = unit.cat.codes.to_numpy()
+        codes = codes[codes >= 0]
+        if codes.size == 0 or (codes != codes[0]).any():
+            return None
+        return unit.cat.categories[codes[0]]
+
+    present = unit.dropna()
+    if present.empty:
+        return None
+    first = present.iloc[0]
+    return first if (present == first).all() else None
+
+
+def _numeric(value: pd.Series) -> pd.Series:
+    # record frames already hold float64 values; skip the parse for those.
+    return value if value.dtype == "float64" else pd.to_numeric(value, errors="coerce")
+
+
 def normalize_units(df: pd.DataFrame, *, record_type: str) -> pd.DataFrame:
     """Normalize common units for nicer display.
 
     This is intentionally conservative: only convert when we're confident.
+    Frames that need no conversion are returned as-is rather than copied;
+    conversions return a new frame via assign().
     """
-    if df.empty or "value" not in df.columns:
+    if df.empty or "value" not in df.columns or "unit" not in df.columns:
         return df
 
-    out = df.copy()
-
     # Distance: m -> km
-    if record_type in {"HKQuantityTypeIdentifierDistanceWalkingRunning"}:
-        if "unit" in out.columns:
-            unit = out["unit"].dropna().unique().tolist()
-            if len(unit) == 1 and unit[0] in {"m"}:
-                out["value"] = pd.to_numeric(out["value"], errors="coerce") / 1000.0
-                out["unit"] = "km"
+    if record_type == "HKQuantityTypeIdentifierDistanceWalkingRunning":
+        if _single_unit(df["unit"]) == "m":
+            return df.assign(value=_numeric(df["value"]) / 1000.0, unit="km")
 
     # Height: m -> cm
-    if record_type in {"HKQuantityTypeIdentifierHeight"}:
-        if "unit" in out.columns:
-            unit = out["unit"].dropna().unique().tolist()
-            if len(unit) == 1 and unit[0] in {"m"}:
-                out["value"] = pd.to_numeric(out["value"], errors="coerce") * 100.0
-                out["unit"] = "cm"
-
-    return out
+    if record_type == "HKQuantityTypeIdentifierHeight":
+        if _single_unit(df["unit"]) == "m":
+            return df.assign(value=_numeric(df["value"]) * 100.0, unit="cm")
+
+    return df
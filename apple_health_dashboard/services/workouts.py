@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
-from dataclasses import asdict
 
 import pandas as pd
 
 from apple_health_dashboard.ingest.apple_health_workouts import Workout
+from apple_health_dashboard.services.stats import TIMESTAMP_COLUMNS, utc_timestamps, week_start
 
 # Mapping from Apple workout type identifier suffix to human label
 _WORKOUT_LABELS: dict[str, str] = {
@@ -65,29 +65,52 @@ def workout_label(activity_type: str) -> str:
     return activity_type
 
 
-def workouts_to_dataframe(workouts: Iterable[Workout]) -> pd.DataFrame:
-    rows = [asdict(w) for w in workouts]
-    if not rows:
-        return pd.DataFrame(
-            columns=[
-                "workout_activity_type",
-                "start_at",
-                "end_at",
-                "creation_at",
-                "source_name",
-                "device",
-                "duration_s",
-                "total_energy_kcal",
-                "total_distance_m",
-            ]
+WORKOUT_COLUMNS = [
+    "workout_activity_type",
+    "start_at",
+    "end_at",
+    "creation_at",
+    "source_name",
+    "device",
+    "duration_s",
+    "total_energy_kcal",
+    "total_distance_m",
+]
+
+
+def workouts_to_dataframe(workouts: Iterable[Workout] | Iterable[tuple]) -> pd.DataFrame:
+    rows = [
+        w
+        if isinstance(w, tuple)
+        else (
+            w.workout_activity_type,
+            w.start_at,
+            w.end_at,
+            w.creation_at,
+            w.source_name,
+            w.device,
+            w.duration_s,
+            w.total_energy_kcal,
+            w.total_distance_m,
         )
-
-    df = pd.DataFrame(rows)
-    for col in ["start_at", "end_at", "creation_at"]:
-        df[col] = pd.to_datetime(df[col], utc=True, errors="coerce")
-
-    # Add human-readable type label
-    df["activity_label"] = df["workout_activity_type"].map(workout_label)
+        for w in workouts
+    ]
+    if not rows:
+        return pd.DataFrame(columns=WORKOUT_COLUMNS)
+
+    # Column-wise, like stats.to_dataframe: one list per column, and a single
+    # vectorised UTC conversion per timestamp column.
+    data = {}
+    for col, values in zip(WORKOUT_COLUMNS, zip(*rows, strict=True), strict=True):
+        if col in TIMESTAMP_COLUMNS:
+            data[col] = utc_timestamps(list(values))
+        else:
+            data[col] = list(values)
+    df = pd.DataFrame(data)
+
+    # Add human-readable type label, computed once per distinct type
+    types = df["workout_activity_type"]
+    df["activity_label"] = types.map({t: workout_label(t) for t in types.unique()})
     return df
 
 
@@ -95,9 +118,15 @@ def summarize_workouts_by_week(df: pd.DataFrame) -> pd.DataFrame:
     if df.empty:
         return pd.DataFrame(columns=["week", "count", "duration_hours", "energy_kcal"])
 
-    tmp = df.copy()
-    tmp["week"] = tmp["start_at"].dt.to_period("W").dt.start_time
-    tmp["duration_hours"] = tmp["duration_s"].fillna(0.0) / 3600.0
+    # Only the columns the rollup reads, rather than a copy of the frame.
+    tmp = pd.DataFrame(
+        {
+            "week": week_start(df["start_at"]),
+            "workout_activity_type": df["workout_activity_type"],
+            "duration_hours": df["duration_s"].fillna(0.0) / 3600.0,
+            "total_energy_kcal": df["total_energy_kcal"],
+        }
+    )
 
     out = (
         tmp.groupby("week", as_index=False)
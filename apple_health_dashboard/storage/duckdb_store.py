@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import duckdb
-from dataclasses import asdict
-from datetime import datetime
+import pandas as pd
+from datetime import UTC, datetime
 from pathlib import Path
 from collections.abc import Iterator
+from contextlib import contextmanager
 
 from apple_health_dashboard.ingest.apple_health import HealthRecord
+from apple_health_dashboard.ingest.apple_health_records import stable_record_hash_str
 from apple_health_dashboard.ingest.apple_health_workouts import (
     Workout,
     WorkoutMetadata,
@@ -62,18 +64,46 @@ CREATE TABLE IF NOT EXISTS workout_metadata (
     value VARCHAR NOT NULL,
     UNIQUE(workout_hash, key, value)
 );
+
+CREATE TABLE IF NOT EXISTS ingest_log (
+    path VARCHAR PRIMARY KEY,
+    mtime_ns BIGINT NOT NULL,
+    size BIGINT NOT NULL,
+    records_inserted BIGINT NOT NULL,
+    record_metadata_inserted BIGINT NOT NULL,
+    activity_summaries_inserted BIGINT NOT NULL,
+    workouts_inserted BIGINT NOT NULL,
+    workout_metadata_inserted BIGINT NOT NULL
+);
 """
 
+_INGEST_LOG_COUNTERS = (
+    "records_inserted",
+    "record_metadata_inserted",
+    "activity_summaries_inserted",
+    "workouts_inserted",
+    "workout_metadata_inserted",
+)
 
-def _dt_to_iso(dt: datetime | None) -> str | None:
-    if dt is None:
-        return None
-    return dt.isoformat()
 
+def open_db(db_path: Path, *, for_import: bool = False) -> duckdb.DuckDBPyConnection:
+    """Open (and create if needed) the DuckDB database.
+
+    With for_import=True the connection is tuned for one large bulk load:
+    insertion order is not preserved (lets DuckDB append in parallel with less
+    buffering) and the WAL is only checkpointed after ~1 GB instead of every
+    16 MB. Browse connections keep the defaults.
 
-def open_db(db_path: Path) -> duckdb.DuckDBPyConnection:
+    Every connection runs with TimeZone=UTC: the TIMESTAMP columns hold naive
+    UTC, and DuckDB converts a bound tz-aware datetime using the session time
+    zone, which otherwise follows the host's.
+    """
     db_path.parent.mkdir(parents=True, exist_ok=True)
     con = duckdb.connect(str(db_path))
+    con.execute("SET TimeZone = 'UTC'")
+    if for_import:
+        con.execute("SET preserve_insertion_order = false")
+        con.execute("SET checkpoint_threshold = '1GB'")
     return con
 
 
@@ -83,78 +113,237 @@ def init_db(con: duckdb.DuckDBPyConnection) -> None:
             con.execute(stmt)
 
 
-def stable_record_hash(record: HealthRecord) -> str:
-    import hashlib
+@contextmanager
+def bulk_import(con: duckdb.DuckDBPyConnection) -> Iterator[None]:
+    """Run a block of upserts as one transaction.
+
+    The upserts never commit themselves, so a whole import commits once and
+    a failure part-way through leaves the database as it was.
+    """
+    con.begin()
+    try:
+        yield
+    except BaseException:
+        con.rollback()
+        raise
+    con.commit()
+
+
+def _naive_utc(values: tuple) -> pd.Series:
+    """Timestamps as naive UTC, the way open_db's UTC session stores a bound datetime."""
+    naive = [
+        v if v is None or v.tzinfo is None else v.astimezone(UTC).replace(tzinfo=None)
+        for v in values
+    ]
+    return pd.Series(naive, dtype="datetime64[us]")
 
-    payload = (
+
+def _insert_new_rows(
+    con: duckdb.DuckDBPyConnection,
+    table: str,
+    columns: tuple[str, ...],
+    rows: list[tuple],
+    *,
+    key: tuple[str, ...],
+    timestamps: tuple[str, ...] = (),
+) -> None:
+    """INSERT rows into table, skipping any whose key is already stored.
+
+    executemany runs the INSERT once per row, which made it the bulk of import
+    time (~3 ms a row). Handing DuckDB the whole batch as a DataFrame turns it
+    into one set-based INSERT ... SELECT. Rows repeating a key within the
+    batch keep the first one, as they did with executemany.
+    """
+    data = {}
+    for col, values in zip(columns, zip(*rows, strict=True), strict=True):
+        data[col] = _naive_utc(values) if col in timestamps else pd.Series(values, dtype=object)
+    batch = pd.DataFrame(data).drop_duplicates(subset=list(key))
+
+    column_sql = ", ".join(columns)
+    con.register("_insert_batch", batch)
+    try:
+        con.execute(
+            f"""
+            INSERT INTO {table}({column_sql})
+            SELECT {column_sql} FROM _insert_batch
+            ON CONFLICT ({", ".join(key)}) DO NOTHING
+            """
+        )
+    finally:
+        con.unregister("_insert_batch")
+
+
+_TIMESTAMPS = ("start_at", "end_at", "creation_at")
+
+
+def stable_record_hash(record: HealthRecord) -> str:
+    return stable_record_hash_str(
         record.type,
         record.start_at.isoformat(),
         record.end_at.isoformat(),
-        record.creation_at.isoformat() if record.creation_at else "",
-        record.source_name or "",
-        record.unit or "",
-        "" if record.value is None else repr(record.value),
-        record.value_str or "",
+        record.creation_at.isoformat() if record.creation_at else None,
+        record.source_name,
+        record.unit,
+        record.value,
+        record.value_str,
     )
-    raw = "|".join(payload).encode("utf-8")
-    return hashlib.sha256(raw).hexdigest()
 
 
-def upsert_records(con: duckdb.DuckDBPyConnection, records: list[HealthRecord]) -> int:
+def upsert_records(
+    con: duckdb.DuckDBPyConnection,
+    records: list[HealthRecord],
+    *,
+    record_hashes: list[str] | None = None,
+) -> int:
+    """Insert records, skipping ones already stored.
+
+    record_hashes, when given, must line up with records; it saves recomputing
+    stable_record_hash for callers that already have it.
+    """
     if not records:
         return 0
 
-    rows = []
-    for r in records:
-        d = asdict(r)
-        rows.append(
-            (
-                d["type"],
-                d["start_at"],
-                d["end_at"],
-                d["creation_at"],
-                d["source_name"],
-                d["unit"],
-                d["value"],
-                d["value_str"],
-                stable_record_hash(r),
-            )
+    # Hash lazily, alongside building each row, rather than as a separate list.
+    hashes = map(stable_record_hash, records) if record_hashes is None else record_hashes
+
+    rows = [
+        (
+            r.type,
+            r.start_at,
+            r.end_at,
+            r.creation_at,
+            r.source_name,
+            r.unit,
+            r.value,
+            r.value_str,
+            r_hash,
         )
+        for r, r_hash in zip(records, hashes, strict=True)
+    ]
+    return upsert_record_rows(con, rows)
 
-    con.executemany(
-        """
-        INSERT INTO health_record(
-            type, start_at, end_at, creation_at, source_name, unit, value, value_str, record_hash
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ON CONFLICT (record_hash) DO NOTHING
-        """,
+
+def upsert_record_rows(con: duckdb.DuckDBPyConnection, rows: list[tuple]) -> int:
+    """Insert pre-built health_record rows, skipping ones already stored.
+
+    Each row is (type, start_at, end_at, creation_at, source_name, unit, value,
+    value_str, record_hash), so the importer can go straight from the parser to
+    the database without a HealthRecord per row.
+    """
+    if not rows:
+        return 0
+
+    _insert_new_rows(
+        con,
+        "health_record",
+        (
+            "type", "start_at", "end_at", "creation_at", "source_name", "unit", "value",
+            "value_str", "record_hash",
+        ),
         rows,
+        key=("record_hash",),
+        timestamps=_TIMESTAMPS,
     )
     return len(rows)
 
 
+def get_ingest_counters(
+    con: duckdb.DuckDBPyConnection, path: str, *, mtime_ns: int, size: int
+) -> dict[str, int] | None:
+    """Counters from an earlier import of path, if the file is unchanged since."""
+    row = con.execute(
+        f"""
+        SELECT {", ".join(_INGEST_LOG_COUNTERS)}
+        FROM ingest_log
+        WHERE path = ? AND mtime_ns = ? AND size = ?
+        """,
+        [path, mtime_ns, size],
+    ).fetchone()
+    if row is None:
+        return None
+    return dict(zip(_INGEST_LOG_COUNTERS, row, strict=True))
+
+
+def record_ingest(
+    con: duckdb.DuckDBPyConnection,
+    path: str,
+    *,
+    mtime_ns: int,
+    size: int,
+    counters: dict[str, int],
+) -> None:
+    con.execute(
+        f"""
+        INSERT OR REPLACE INTO ingest_log(path, mtime_ns, size, {", ".join(_INGEST_LOG_COUNTERS)})
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        [path, mtime_ns, size, *(counters[c] for c in _INGEST_LOG_COUNTERS)],
+    )
+
+
+def _timestamps_to_utc(df: pd.DataFrame, columns: tuple[str, ...]) -> pd.DataFrame:
+    for col in columns:
+        if col in df.columns:
+            df[col] = pd.to_datetime(df[col], utc=True, errors="coerce")
+    return df
+
+
+def _as_categories(df: pd.DataFrame, columns: tuple[str, ...]) -> pd.DataFrame:
+    for col in columns:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+    return df
+
+
+def records_dataframe(con: duckdb.DuckDBPyConnection) -> pd.DataFrame:
+    """Fetch all records as a DataFrame in one columnar read.
+
+    Unlike iter_records this never builds per-row Python objects, and it leaves
+    out record_hash, which the dashboards don't need. The low-cardinality text
+    columns come back as categoricals: a few hundred distinct strings shared by
+    millions of rows, so filtering on type compares integer codes.
+
+    Rows are sorted by start_at so apply_date_filter can binary-search its
+    bounds instead of scanning every row.
+    """
+    df = con.execute(
+        """
+        SELECT type, start_at, end_at, creation_at, source_name, unit, value, value_str
+        FROM health_record
+        ORDER BY start_at, record_hash
+        """
+    ).df()
+    df = _as_categories(df, ("type", "source_name", "unit"))
+    return _timestamps_to_utc(df, ("start_at", "end_at", "creation_at"))
+
+
+def _iter_rows(
+    con: duckdb.DuckDBPyConnection,
+    sql: str,
+    *,
+    chunk_size: int = 10_000,
+) -> Iterator[tuple]:
+    """Stream result rows in fetchmany chunks instead of materialising fetchall()."""
+    cur = con.execute(sql)
+    while True:
+        chunk = cur.fetchmany(chunk_size)
+        if not chunk:
+            return
+        yield from chunk
+
+
 def iter_records(con: duckdb.DuckDBPyConnection) -> Iterator[HealthRecord]:
-    # Keeping this for backwards compatibility with tests or old code, 
-    # but new code should use Polars direct query
-    res = con.execute(
+    # Keeping this for backwards compatibility with tests or old code,
+    # but new code should use records_dataframe
+    for row in _iter_rows(
+        con,
         """
         SELECT type, start_at, end_at, creation_at, source_name, unit, value, value_str
         FROM health_record
         ORDER BY start_at
-        """
-    ).fetchall()
-    
-    for row in res:
-        yield HealthRecord(
-            type=row[0],
-            start_at=row[1],
-            end_at=row[2],
-            creation_at=row[3],
-            source_name=row[4],
-            unit=row[5],
-            value=row[6],
-            value_str=row[7],
-        )
+        """,
+    ):
+        yield HealthRecord(*row)
 
 
 def upsert_workouts(
@@ -165,90 +354,77 @@ def upsert_workouts(
     if not workouts and not metadata:
         return 0, 0
 
-    workout_rows = []
-    for w in workouts:
-        d = asdict(w)
-        workout_rows.append(
-            (
-                d["workout_activity_type"],
-                d["start_at"],
-                d["end_at"],
-                d["creation_at"],
-                d["source_name"],
-                d["device"],
-                d["duration_s"],
-                d["total_energy_kcal"],
-                d["total_distance_m"],
-                stable_workout_hash(w),
-            )
+    workout_rows = [
+        (
+            w.workout_activity_type,
+            w.start_at,
+            w.end_at,
+            w.creation_at,
+            w.source_name,
+            w.device,
+            w.duration_s,
+            w.total_energy_kcal,
+            w.total_distance_m,
+            stable_workout_hash(w),
         )
+        for w in workouts
+    ]
 
     workouts_inserted = 0
     if workout_rows:
-        con.executemany(
-            """
-            INSERT INTO workout(
-                workout_activity_type, start_at, end_at, creation_at, source_name, device,
-                duration_s, total_energy_kcal, total_distance_m, workout_hash
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT (workout_hash) DO NOTHING
-            """,
+        _insert_new_rows(
+            con,
+            "workout",
+            (
+                "workout_activity_type", "start_at", "end_at", "creation_at", "source_name",
+                "device", "duration_s", "total_energy_kcal", "total_distance_m", "workout_hash",
+            ),
             workout_rows,
+            key=("workout_hash",),
+            timestamps=_TIMESTAMPS,
         )
         workouts_inserted = len(workout_rows)
 
     metadata_inserted = 0
     if metadata:
-        meta_rows = [(m.workout_hash, m.key, m.value) for m in metadata]
-        con.executemany(
-            """
-            INSERT INTO workout_metadata(workout_hash, key, value)
-            VALUES (?, ?, ?)
-            ON CONFLICT (workout_hash, key, value) DO NOTHING
-            """,
-            meta_rows,
-        )
-        metadata_inserted = len(meta_rows)
+        columns = ("workout_hash", "key", "value")
+        _insert_new_rows(con, "workout_metadata", columns, metadata, key=columns)
+        metadata_inserted = len(metadata)
 
     return workouts_inserted, metadata_inserted
 
 
 def iter_workouts(con: duckdb.DuckDBPyConnection) -> Iterator[Workout]:
-    res = con.execute(
+    for row in _iter_rows(
+        con,
         """
         SELECT workout_activity_type, start_at, end_at, creation_at, source_name, device,
                duration_s, total_energy_kcal, total_distance_m
         FROM workout
         ORDER BY start_at
+        """,
+    ):
+        yield Workout(*row)
+
+
+def workouts_dataframe(con: duckdb.DuckDBPyConnection) -> pd.DataFrame:
+    """Fetch all workouts as a DataFrame in one columnar read."""
+    df = con.execute(
         """
-    ).fetchall()
-    
-    for row in res:
-        yield Workout(
-            workout_activity_type=row[0],
-            start_at=row[1],
-            end_at=row[2],
-            creation_at=row[3],
-            source_name=row[4],
-            device=row[5],
-            duration_s=row[6],
-            total_energy_kcal=row[7],
-            total_distance_m=row[8],
-        )
+        SELECT workout_activity_type, start_at, end_at, creation_at, source_name, device,
+               duration_s, total_energy_kcal, total_distance_m
+        FROM workout
+        """
+    ).df()
+    return _timestamps_to_utc(df, ("start_at", "end_at", "creation_at"))
 
 
 def upsert_record_metadata(con: duckdb.DuckDBPyConnection, metadata: list[tuple[str, str, str]]) -> int:
     if not metadata:
         return 0
 
-    con.executemany(
-        """
-        INSERT INTO record_metadata(record_hash, key, value)
-        VALUES (?, ?, ?)
-        ON CONFLICT (record_hash, key, value) DO NOTHING
-        """,
-        metadata,
-    )
+    columns = ("record_hash", "key", "value")
+    _insert_new_rows(con, "record_metadata", columns, metadata, key=columns)
     return len(metadata)
 
 
@@ -272,41 +448,57 @@ def upsert_activity_summaries(con: duckdb.DuckDBPyConnection, rows: list[tuple])
     if not rows:
         return 0
 
-    con.executemany(
-        """
-        INSERT INTO activity_summary(
-            day, active_energy_burned_kcal, active_energy_burned_goal_kcal,
-            apple_exercise_time_min, apple_exercise_time_goal_min,
-            apple_stand_hours, apple_stand_hours_goal
-        ) VALUES (?, ?, ?, ?, ?, ?, ?)
-        ON CONFLICT (day) DO NOTHING
-        """,
+    _insert_new_rows(
+        con,
+        "activity_summary",
+        (
+            "day", "active_energy_burned_kcal", "active_energy_burned_goal_kcal",
+            "apple_exercise_time_min", "apple_exercise_time_goal_min",
+            "apple_stand_hours", "apple_stand_hours_goal",
+        ),
         rows,
+        key=("day",),
     )
     return len(rows)
 
 
+_ACTIVITY_SUMMARY_COLUMNS = (
+    "day",
+    "active_energy_burned_kcal",
+    "active_energy_burned_goal_kcal",
+    "apple_exercise_time_min",
+    "apple_exercise_time_goal_min",
+    "apple_stand_hours",
+    "apple_stand_hours_goal",
+)
+
+
 def iter_activity_summaries(con: duckdb.DuckDBPyConnection) -> Iterator[dict]:
-    res = con.execute(
+    for row in _iter_rows(
+        con,
         """
         SELECT day, active_energy_burned_kcal, active_energy_burned_goal_kcal,
                apple_exercise_time_min, apple_exercise_time_goal_min,
                apple_stand_hours, apple_stand_hours_goal
         FROM activity_summary
         ORDER BY day
+        """,
+    ):
+        yield dict(zip(_ACTIVITY_SUMMARY_COLUMNS, row, strict=True))
+
+
+def activity_summaries_dataframe(con: duckdb.DuckDBPyConnection) -> pd.DataFrame:
+    """Fetch all activity-ring summaries as a DataFrame in one columnar read."""
+    df = con.execute(
         """
-    ).fetchall()
-    
-    for row in res:
-        yield {
-            "day": row[0],
-            "active_energy_burned_kcal": row[1],
-            "active_energy_burned_goal_kcal": row[2],
-            "apple_exercise_time_min": row[3],
-            "apple_exercise_time_goal_min": row[4],
-            "apple_stand_hours": row[5],
-            "apple_stand_hours_goal": row[6],
-        }
+        SELECT day, active_energy_burned_kcal, active_energy_burned_goal_kcal,
+               apple_exercise_time_min, apple_exercise_time_goal_min,
+               apple_stand_hours, apple_stand_hours_goal
+        FROM activity_summary
+        """
+    ).df()
+    return _timestamps_to_utc(df, ("day",))
+
 
 def count_records(
     con: duckdb.DuckDBPyConnection,
@@ -347,17 +539,33 @@ def list_record_types(con: duckdb.DuckDBPyConnection) -> list[str]:
     ).fetchall()
     return [r[0] for r in res]
 
-def query_records_page(
-    con: duckdb.DuckDBPyConnection,
+
+def record_type_span(
+    con: duckdb.DuckDBPyConnection, *, record_type: str
+) -> tuple[datetime, datetime] | None:
+    """First and last start_at stored for record_type, or None if it has no rows."""
+    row = con.execute(
+        "SELECT MIN(start_at), MAX(start_at) FROM health_record WHERE type = ?",
+        [record_type],
+    ).fetchone()
+    if row is None or row[0] is None:
+        return None
+    return row[0], row[1]
+
+
+def _records_page_sql(
     *,
-    record_type: str | None = None,
-    start_at: datetime | None = None,
-    end_at: datetime | None = None,
-    order: str = "start_at_desc",
-    limit: int = 500,
-    offset: int = 0,
-) -> list[dict]:
-    order_sql = "start_at DESC" if order == "start_at_desc" else "start_at ASC"
+    record_type: str | None,
+    start_at: datetime | None,
+    end_at: datetime | None,
+    order: str,
+    limit: int,
+    offset: int,
+    after: tuple[datetime, str] | None,
+) -> tuple[str, list[object]]:
+    descending = order == "start_at_desc"
+    direction = "DESC" if descending else "ASC"
+    order_sql = f"start_at {direction}, record_hash {direction}"
 
     where = []
     params: list[object] = []
@@ -374,19 +582,52 @@ def query_records_page(
         where.append("start_at <= ?")
         params.append(end_at)
 
+    if after is not None:
+        cmp = "<" if descending else ">"
+        where.append(f"(start_at {cmp} ? OR (start_at = ? AND record_hash {cmp} ?))")
+        params.extend([after[0], after[0], after[1]])
+
     where_sql = "" if not where else "WHERE " + " AND ".join(where)
 
-    res = con.execute(
-        f"""
+    sql = f"""
         SELECT type, start_at, end_at, creation_at, source_name, unit, value, value_str, record_hash
         FROM health_record
         {where_sql}
         ORDER BY {order_sql}
         LIMIT ? OFFSET ?
-        """,
-        [*params, limit, offset],
-    ).fetchall()
-    
+        """
+    return sql, [*params, limit, offset]
+
+
+def query_records_page(
+    con: duckdb.DuckDBPyConnection,
+    *,
+    record_type: str | None = None,
+    start_at: datetime | None = None,
+    end_at: datetime | None = None,
+    order: str = "start_at_desc",
+    limit: int = 500,
+    offset: int = 0,
+    after: tuple[datetime, str] | None = None,
+) -> list[dict]:
+    """One page of records, ordered by (start_at, record_hash).
+
+    after is the (start_at, record_hash) of the last row of the previous page.
+    Passing it (with offset=0) seeks straight past that row instead of having
+    DuckDB produce and throw away offset rows first, and the start_at bound
+    lets it skip whole row groups via their min/max statistics.
+    """
+    sql, params = _records_page_sql(
+        record_type=record_type,
+        start_at=start_at,
+        end_at=end_at,
+        order=order,
+        limit=limit,
+        offset=offset,
+        after=after,
+    )
+    res = con.execute(sql, params).fetchall()
+
     return [
         {
             "type": r[0],
@@ -401,3 +642,44 @@ def query_records_page(
         }
         for r in res
     ]
+
+
+def query_records_page_df(
+    con: duckdb.DuckDBPyConnection,
+    *,
+    record_type: str | None = None,
+    start_at: datetime | None = None,
+    end_at: datetime | None = None,
+    order: str = "start_at_desc",
+    limit: int = 500,
+    offset: int = 0,
+    after: tuple[datetime, str] | None = None,
+) -> pd.DataFrame:
+    """query_records_page as a DataFrame with UTC timestamps.
+
+    DuckDB fills the columns directly, so callers that only display or chart
+    the page skip building a dict per row for pandas to take apart again.
+    """
+    sql, params = _records_page_sql(
+        record_type=record_type,
+        start_at=start_at,
+        end_at=end_at,
+        order=order,
+        limit=limit,
+        offset=offset,
+        after=after,
+    )
+    df = con.execute(sql, params).df()
+    return _timestamps_to_utc(df, ("start_at", "end_at", "creation_at"))
+
+
+def next_page_cursor(page: pd.DataFrame) -> tuple[datetime, str] | None:
+    """The after= cursor for the page following a query_records_page_df page.
+
+    start_at goes back as naive UTC, the way the column stores it, so the
+    comparison never depends on a session time zone.
+    """
+    if page.empty:
+        return None
+    last = page.iloc[-1]
+    return last["start_at"].tz_convert(None).to_pydatetime(), last["record_hash"]
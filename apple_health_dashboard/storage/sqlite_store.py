@@ -2,21 +2,27 @@ from __future__ import annotations
 
 import sqlite3
 from collections.abc import Iterator
-from dataclasses import asdict
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 
+import pandas as pd
+
 from apple_health_dashboard.ingest.apple_health import HealthRecord
+from apple_health_dashboard.ingest.apple_health_records import stable_record_hash_str
 from apple_health_dashboard.ingest.apple_health_workouts import (
     Workout,
     WorkoutMetadata,
     stable_workout_hash,
 )
 
-_SCHEMA_SQL = """
+# journal_mode can't be changed inside a transaction, so these run on their own.
+_PRAGMA_SQL = """
 PRAGMA journal_mode=WAL;
 PRAGMA synchronous=NORMAL;
+"""
 
+_SCHEMA_SQL = """
 CREATE TABLE IF NOT EXISTS health_record (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     type TEXT NOT NULL,
@@ -87,22 +93,37 @@ CREATE INDEX IF NOT EXISTS idx_workout_metadata_hash
 """
 
 
-def _dt_to_iso(dt: datetime | None) -> str | None:
-    if dt is None:
-        return None
-    return dt.isoformat()
-
-
 def open_db(db_path: Path) -> sqlite3.Connection:
     db_path.parent.mkdir(parents=True, exist_ok=True)
-    con = sqlite3.connect(db_path)
+    # Autocommit mode: the driver never opens or commits a transaction on its
+    # own, so BEGIN/COMMIT happen exactly where bulk_import puts them.
+    con = sqlite3.connect(db_path, isolation_level=None)
     con.row_factory = sqlite3.Row
     return con
 
 
 def init_db(con: sqlite3.Connection) -> None:
-    con.executescript(_SCHEMA_SQL)
-    con.commit()
+    con.executescript(_PRAGMA_SQL)
+    con.executescript(f"BEGIN;\n{_SCHEMA_SQL}\nCOMMIT;")
+
+
+@contextmanager
+def bulk_import(con: sqlite3.Connection) -> Iterator[None]:
+    """Run a block of writes as one transaction.
+
+    Each upsert wraps itself in bulk_import too; inside an outer one it just
+    joins the open transaction, so a whole import commits (and fsyncs) once.
+    """
+    if con.in_transaction:
+        yield
+        return
+    con.execute("BEGIN")
+    try:
+        yield
+    except BaseException:
+        con.execute("ROLLBACK")
+        raise
+    con.execute("COMMIT")
 
 
 def stable_record_hash(record: HealthRecord) -> str:
@@ -111,20 +132,16 @@ def stable_record_hash(record: HealthRecord) -> str:
     Apple exports don't provide a single global ID for every record.
     This hash is good enough to avoid double-importing the same export.
     """
-    import hashlib
-
-    payload = (
+    return stable_record_hash_str(
         record.type,
         record.start_at.isoformat(),
         record.end_at.isoformat(),
-        record.creation_at.isoformat() if record.creation_at else "",
-        record.source_name or "",
-        record.unit or "",
-        "" if record.value is None else repr(record.value),
-        record.value_str or "",
+        record.creation_at.isoformat() if record.creation_at else None,
+        record.source_name,
+        record.unit,
+        record.value,
+        record.value_str,
     )
-    raw = "|".join(payload).encode("utf-8")
-    return hashlib.sha256(raw).hexdigest()
 
 
 def upsert_records(con: sqlite3.Connection, records: list[HealthRecord]) -> int:
@@ -133,34 +150,76 @@ def upsert_records(con: sqlite3.Connection, records: list[HealthRecord]) -> int:
     if not records:
         return 0
 
-    rows = []
-    for r in records:
-        d = asdict(r)
-        rows.append(
-            (
-                d["type"],
-                _dt_to_iso(d["start_at"]),
-                _dt_to_iso(d["end_at"]),
-                _dt_to_iso(d["creation_at"]),
-                d["source_name"],
-                d["unit"],
-                d["value"],
-                d["value_str"],
-                stable_record_hash(r),
-            )
+    # sqlite3 consumes the generator row by row, so no second list of rows is built.
+    rows = (
+        (
+            r.type,
+            r.start_at.isoformat(),
+            r.end_at.isoformat(),
+            r.creation_at.isoformat() if r.creation_at is not None else None,
+            r.source_name,
+            r.unit,
+            r.value,
+            r.value_str,
+            stable_record_hash(r),
+        )
+        for r in records
+    )
+
+    with bulk_import(con):
+        cur = con.cursor()
+        cur.executemany(
+            """
+            INSERT OR IGNORE INTO health_record(
+                type, start_at, end_at, creation_at, source_name, unit, value, value_str,
+                record_hash
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            rows,
         )
+    return cur.rowcount if cur.rowcount != -1 else 0
+
 
-    cur = con.cursor()
-    cur.executemany(
+def _iso_timestamps_to_utc(df: pd.DataFrame, columns: tuple[str, ...]) -> pd.DataFrame:
+    # Stored via isoformat(), with each row's own offset; parse whole columns at once.
+    for col in columns:
+        df[col] = pd.to_datetime(df[col], utc=True, format="ISO8601", errors="coerce")
+    return df
+
+
+def records_dataframe(con: sqlite3.Connection) -> pd.DataFrame:
+    """Fetch all records as a DataFrame, like duckdb_store.records_dataframe.
+
+    Timestamps are parsed per column instead of building a HealthRecord per
+    row. SQLite sorts the ISO strings textually, which isn't chronological
+    across offsets, so rows are re-sorted on the parsed start_at.
+    """
+    df = pd.read_sql_query(
         """
-        INSERT OR IGNORE INTO health_record(
-            type, start_at, end_at, creation_at, source_name, unit, value, value_str, record_hash
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        SELECT type, start_at, end_at, creation_at, source_name, unit, value, value_str
+        FROM health_record
+        ORDER BY start_at, record_hash
         """,
-        rows,
+        con,
     )
-    con.commit()
-    return cur.rowcount if cur.rowcount != -1 else 0
+    df = _iso_timestamps_to_utc(df, ("start_at", "end_at", "creation_at"))
+    df = df.sort_values("start_at", kind="stable", ignore_index=True)
+    for col in ("type", "source_name", "unit"):
+        df[col] = df[col].astype("category")
+    return df
+
+
+def workouts_dataframe(con: sqlite3.Connection) -> pd.DataFrame:
+    """Fetch all workouts as a DataFrame, like duckdb_store.workouts_dataframe."""
+    df = pd.read_sql_query(
+        """
+        SELECT workout_activity_type, start_at, end_at, creation_at, source_name, device,
+               duration_s, total_energy_kcal, total_distance_m
+        FROM workout
+        """,
+        con,
+    )
+    return _iso_timestamps_to_utc(df, ("start_at", "end_at", "creation_at"))
 
 
 def iter_records(con: sqlite3.Connection) -> Iterator[HealthRecord]:
@@ -200,59 +259,57 @@ def upsert_workouts(
     if not workouts and not metadata:
         return 0, 0
 
-    workout_rows = []
-    for w in workouts:
-        d = asdict(w)
-        workout_rows.append(
-            (
-                d["workout_activity_type"],
-                _dt_to_iso(d["start_at"]),
-                _dt_to_iso(d["end_at"]),
-                _dt_to_iso(d["creation_at"]),
-                d["source_name"],
-                d["device"],
-                d["duration_s"],
-                d["total_energy_kcal"],
-                d["total_distance_m"],
-                stable_workout_hash(w),
-            )
-        )
-
-    cur = con.cursor()
-    workouts_inserted = 0
-    if workout_rows:
-        cur.executemany(
-            """
-            INSERT OR IGNORE INTO workout(
-                workout_activity_type,
-                start_at,
-                end_at,
-                creation_at,
-                source_name,
-                device,
-                duration_s,
-                total_energy_kcal,
-                total_distance_m,
-                workout_hash
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            workout_rows,
-        )
-        workouts_inserted = cur.rowcount if cur.rowcount != -1 else 0
-
-    metadata_inserted = 0
-    if metadata:
-        meta_rows = [(m.workout_hash, m.key, m.value) for m in metadata]
-        cur.executemany(
-            """
-            INSERT OR IGNORE INTO workout_metadata(workout_hash, key, value)
-            VALUES (?, ?, ?)
-            """,
-            meta_rows,
+    workout_rows = [
+        (
+            w.workout_activity_type,
+            w.start_at.isoformat(),
+            w.end_at.isoformat(),
+            w.creation_at.isoformat() if w.creation_at is not None else None,
+            w.source_name,
+            w.device,
+            w.duration_s,
+            w.total_energy_kcal,
+            w.total_distance_m,
+            stable_workout_hash(w),
         )
-        metadata_inserted = cur.rowcount if cur.rowcount != -1 else 0
+        for w in workouts
+    ]
+
+    with bulk_import(con):
+        cur = con.cursor()
+        workouts_inserted = 0
+        if workout_rows:
+            cur.executemany(
+                """
+                INSERT OR IGNORE INTO workout(
+                    workout_activity_type,
+                    start_at,
+                    end_at,
+                    creation_at,
+                    source_name,
+                    device,
+                    duration_s,
+                    total_energy_kcal,
+                    total_distance_m,
+                    workout_hash
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                workout_rows,
+            )
+            workouts_inserted = cur.rowcount if cur.rowcount != -1 else 0
+
+        metadata_inserted = 0
+        if metadata:
+            meta_rows = [(m.workout_hash, m.key, m.value) for m in metadata]
+            cur.executemany(
+                """
+                INSERT OR IGNORE INTO workout_metadata(workout_hash, key, value)
+                VALUES (?, ?, ?)
+                """,
+                meta_rows,
+            )
+            metadata_inserted = cur.rowcount if cur.rowcount != -1 else 0
 
-    con.commit()
     return workouts_inserted, metadata_inserted
 
 
@@ -284,15 +341,15 @@ def upsert_record_metadata(con: sqlite3.Connection, metadata: list[tuple[str, st
     if not metadata:
         return 0
 
-    cur = con.cursor()
-    cur.executemany(
-        """
-        INSERT OR IGNORE INTO record_metadata(record_hash, key, value)
-        VALUES (?, ?, ?)
-        """,
-        metadata,
-    )
-    con.commit()
+    with bulk_import(con):
+        cur = con.cursor()
+        cur.executemany(
+            """
+            INSERT OR IGNORE INTO record_metadata(record_hash, key, value)
+            VALUES (?, ?, ?)
+            """,
+            metadata,
+        )
     return cur.rowcount if cur.rowcount != -1 else 0
 
 
@@ -317,22 +374,22 @@ def upsert_activity_summaries(con: sqlite3.Connection, rows: list[tuple]) -> int
     if not rows:
         return 0
 
-    cur = con.cursor()
-    cur.executemany(
-        """
-        INSERT OR IGNORE INTO activity_summary(
-            day,
-            active_energy_burned_kcal,
-            active_energy_burned_goal_kcal,
-            apple_exercise_time_min,
-            apple_exercise_time_goal_min,
-            apple_stand_hours,
-            apple_stand_hours_goal
-        ) VALUES (?, ?, ?, ?, ?, ?, ?)
-        """,
-        rows,
-    )
-    con.commit()
+    with bulk_import(con):
+        cur = con.cursor()
+        cur.executemany(
+            """
+            INSERT OR IGNORE INTO activity_summary(
+                day,
+                active_energy_burned_kcal,
+                active_energy_burned_goal_kcal,
+                apple_exercise_time_min,
+                apple_exercise_time_goal_min,
+                apple_stand_hours,
+                apple_stand_hours_goal
+            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            rows,
+        )
     return cur.rowcount if cur.rowcount != -1 else 0
 
 
@@ -3,14 +3,14 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime
 
-import pandas as pd
 import streamlit as st
 
-from apple_health_dashboard.storage.duckdb_store import (
-    count_records,
-    list_record_types,
-    open_db,
-    query_records_page,
+from apple_health_dashboard.storage.duckdb_store import next_page_cursor
+from apple_health_dashboard.web.page_utils import (
+    db_mtime,
+    load_record_count,
+    load_records_page,
+    load_stored_record_types,
 )
 
 
@@ -23,11 +23,8 @@ class ExploreParams:
 def render_explore_records(db_path, params: ExploreParams) -> None:
     """Explore/browse raw records from DuckDB without loading everything into memory."""
 
-    con = open_db(db_path)
-    try:
-        all_types = list_record_types(con)
-    finally:
-        con.close()
+    db_path_str = str(db_path)
+    all_types = load_stored_record_types(db_path_str)
 
     if not all_types:
         st.info("Geen records in database.")
@@ -50,53 +47,60 @@ def render_explore_records(db_path, params: ExploreParams) -> None:
 
     order_sql = "start_at_desc" if order == "Newest first" else "start_at_asc"
 
-    con = open_db(db_path)
-    try:
-        total = count_records(
-            con,
-            record_type=record_type,
-            start_at=params.start_at,
-            end_at=params.end_at,
-        )
-
-        page_size = st.selectbox(
-            "Rows per page",
-            [100, 250, 500, 1000, 2000],
-            index=2,
-            key="explore_all_ps",
-        )
-        pages = max(1, (total + page_size - 1) // page_size)
-        page = st.number_input(
-            "Page",
-            min_value=1,
-            max_value=pages,
-            value=1,
-            step=1,
-            key="explore_all_page",
-        )
-        offset = (page - 1) * page_size
-
-        rows = query_records_page(
-            con,
-            record_type=record_type,
-            start_at=params.start_at,
-            end_at=params.end_at,
-            order=order_sql,
-            limit=page_size,
-            offset=offset,
-        )
-    finally:
-        con.close()
+    total = load_record_count(
+        db_path_str, record_type=record_type, start_at=params.start_at, end_at=params.end_at
+    )
+
+    page_size = st.selectbox(
+        "Rows per page",
+        [100, 250, 500, 1000, 2000],
+        index=2,
+        key="explore_all_ps",
+    )
+    pages = max(1, (total + page_size - 1) // page_size)
+    page = st.number_input(
+        "Page",
+        min_value=1,
+        max_value=pages,
+        value=1,
+        step=1,
+        key="explore_all_page",
+    )
+
+    # Where each visited page starts, as the (start_at, record_hash) of the
+    # row before it. Stepping to the next page seeks past that row (keyset
+    # pagination); only a jump to a page not reached yet falls back to OFFSET.
+    cursor_key = (
+        db_mtime(db_path_str), record_type, params.start_at, params.end_at, order_sql, page_size
+    )
+    cursors = st.session_state.get("explore_all_cursors")
+    if cursors is None or cursors[0] != cursor_key:
+        cursors = (cursor_key, {1: None})
+        st.session_state["explore_all_cursors"] = cursors
+    page_starts = cursors[1]
+
+    if page in page_starts:
+        offset, after = 0, page_starts[page]
+    else:
+        offset, after = (page - 1) * page_size, None
+
+    df = load_records_page(
+        db_path_str,
+        record_type=record_type,
+        start_at=params.start_at,
+        end_at=params.end_at,
+        order=order_sql,
+        limit=page_size,
+        offset=offset,
+        after=after,
+    )
+    if not df.empty:
+        page_starts[page + 1] = next_page_cursor(df)
 
     st.caption(f"Total rows: {total:,} · Page {page}/{pages}")
 
-    if not rows:
+    if df.empty:
         st.info("Geen rijen gevonden voor deze filter.")
         return
 
-    df = pd.DataFrame(rows)
-    for col in ["start_at", "end_at", "creation_at"]:
-        if col in df.columns:
-            df[col] = pd.to_datetime(df[col], utc=True, errors="coerce")
-
     st.dataframe(df, use_container_width=True, height=520)
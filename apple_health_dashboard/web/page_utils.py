@@ -1,17 +1,25 @@
 from __future__ import annotations
 
+from datetime import datetime
 from pathlib import Path
 
 import pandas as pd
 import streamlit as st
 
-from apple_health_dashboard.services.filters import DateFilter, infer_date_filter
+from apple_health_dashboard.services.filters import DateFilter, apply_date_filter, infer_date_filter
+from apple_health_dashboard.services.sleep import sleep_duration_by_day, sleep_records
+from apple_health_dashboard.services.stats import available_record_types
+from apple_health_dashboard.services.units import normalize_units
 from apple_health_dashboard.storage.duckdb_store import (
+    activity_summaries_dataframe,
+    count_records,
     init_db,
-    iter_activity_summaries,
-    iter_records,
-    iter_workouts,
+    list_record_types,
     open_db,
+    query_records_page_df,
+    record_type_span,
+    records_dataframe,
+    workouts_dataframe,
 )
 
 # ── Global stylesheet ─────────────────────────────────────────────────────────
@@ -456,8 +464,23 @@ def page_config(title: str, icon: str = "🍎") -> None:
     st.set_page_config(page_title=f"{title} · Apple Health Dashboard", page_icon=icon, layout="wide")
 
 
-def sidebar_date_filter(df: pd.DataFrame, current: str | None = None) -> DateFilter | None:
-    """Render the date filter in the sidebar and return the selected filter."""
+# The leading underscore keeps Streamlit from hashing the whole frame; like the
+# other _cached_* loaders the entry is keyed on the database and its mtime.
+@st.cache_data(show_spinner=False, max_entries=32)
+def _cached_infer_date_filter(
+    _df: pd.DataFrame, db_path_str: str, db_mtime: float, preset: str
+) -> DateFilter | None:
+    return infer_date_filter(_df, preset=preset)
+
+
+def sidebar_date_filter(
+    df: pd.DataFrame, current: str | None = None, *, db_path_str: str | None = None
+) -> DateFilter | None:
+    """Render the date filter in the sidebar and return the selected filter.
+
+    Pass *db_path_str* when *df* is the ``load_all_records`` frame for that
+    database so the preset range is cached until the database changes.
+    """
     with st.sidebar:
         st.markdown(
             '<div class="ahd-sidebar-section" style="padding-top:16px;">📅 Date Range</div>',
@@ -469,7 +492,12 @@ def sidebar_date_filter(df: pd.DataFrame, current: str | None = None) -> DateFil
             index=3,
             label_visibility="collapsed",
         )
-        preset_filter = infer_date_filter(df, preset=preset)
+        if db_path_str is None:
+            preset_filter = infer_date_filter(df, preset=preset)
+        else:
+            preset_filter = _cached_infer_date_filter(
+                df, db_path_str, db_mtime(db_path_str), preset
+            )
         if preset_filter is None:
             return None
 
@@ -493,7 +521,9 @@ def sidebar_date_filter(df: pd.DataFrame, current: str | None = None) -> DateFil
         return preset_filter
 
 
-def setup_page_nav(current: str, df: pd.DataFrame | None = None) -> "DateFilter | None":
+def setup_page_nav(
+    current: str, df: pd.DataFrame | None = None, *, db_path_str: str | None = None
+) -> "DateFilter | None":
     """One-call sidebar setup: inject CSS, render nav, optionally add date filter.
 
     Call right after st.set_page_config().  If *df* is supplied the date filter
@@ -504,66 +534,241 @@ def setup_page_nav(current: str, df: pd.DataFrame | None = None) -> "DateFilter
         sidebar_nav(current=current)
         st.divider()
     if df is not None:
-        return sidebar_date_filter(df)
+        return sidebar_date_filter(df, db_path_str=db_path_str)
     return None
 
 
-@st.cache_data(ttl=300, show_spinner=False)
-def load_all_records(db_path_str: str) -> pd.DataFrame:
-    """Load all health records from DuckDB (cached)."""
-    db_path = Path(db_path_str)
-    con = open_db(db_path)
+def _load_frame(db_path_str: str, reader) -> pd.DataFrame:
+    con = open_db(Path(db_path_str))
     try:
         init_db(con)
         try:
-            df = con.execute("SELECT * FROM health_record").df()
-            for col in ["start_at", "end_at", "creation_at"]:
-                if col in df.columns:
-                    df[col] = pd.to_datetime(df[col], utc=True, errors="coerce")
-            return df
+            return reader(con)
         except Exception:
             return pd.DataFrame()
     finally:
         con.close()
 
 
-@st.cache_data(ttl=300, show_spinner=False)
-def load_all_workouts(db_path_str: str) -> pd.DataFrame:
-    """Load all workout records from DuckDB (cached)."""
-    db_path = Path(db_path_str)
-    con = open_db(db_path)
+def db_mtime(db_path_str: str) -> float:
+    """Modification time of the database file; 0.0 if it doesn't exist yet."""
     try:
-        init_db(con)
-        try:
-            df = con.execute("SELECT * FROM workout").df()
-            for col in ["start_at", "end_at", "creation_at"]:
-                if col in df.columns:
-                    df[col] = pd.to_datetime(df[col], utc=True, errors="coerce")
-            return df
-        except Exception:
-            return pd.DataFrame()
-    finally:
-        con.close()
+        return Path(db_path_str).stat().st_mtime
+    except OSError:
+        return 0.0
+
+
+# The cached loaders take db_mtime purely as part of the cache key, so an import
+# (which rewrites the database file) invalidates them without waiting for a TTL.
+@st.cache_data(show_spinner=False, max_entries=4)
+def _cached_records(db_path_str: str, db_mtime: float) -> pd.DataFrame:
+    return _load_frame(db_path_str, records_dataframe)
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _cached_workouts(db_path_str: str, db_mtime: float) -> pd.DataFrame:
+    return _load_frame(db_path_str, workouts_dataframe)
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _cached_activity_summaries(db_path_str: str, db_mtime: float) -> pd.DataFrame:
+    return _load_frame(db_path_str, activity_summaries_dataframe)
+
+
+def load_all_records(db_path_str: str) -> pd.DataFrame:
+    """Load all health records from DuckDB (cached until the database changes)."""
+    return _cached_records(db_path_str, db_mtime(db_path_str))
+
+
+def load_all_workouts(db_path_str: str) -> pd.DataFrame:
+    """Load all workout records from DuckDB (cached until the database changes)."""
+    return _cached_workouts(db_path_str, db_mtime(db_path_str))
 
 
-@st.cache_data(ttl=300, show_spinner=False)
 def load_all_activity_summaries(db_path_str: str) -> pd.DataFrame:
-    """Load all activity-ring summaries from DuckDB (cached)."""
-    db_path = Path(db_path_str)
-    con = open_db(db_path)
+    """Load all activity-ring summaries from DuckDB (cached until the database changes)."""
+    return _cached_activity_summaries(db_path_str, db_mtime(db_path_str))
+
+
+# Derived frames that several reruns of the same page keep asking for. They are
+# keyed on the database version plus the date range, so unrelated widget clicks
+# (tab switches, paging) don't redo the O(N) filtering of the full record table.
+@st.cache_data(show_spinner=False, max_entries=8)
+def _cached_sleep_records(
+    db_path_str: str, db_mtime: float, start: pd.Timestamp, end: pd.Timestamp
+) -> pd.DataFrame:
+    df = _cached_records(db_path_str, db_mtime)
+    return sleep_records(apply_date_filter(df, DateFilter(start=start, end=end)))
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _cached_sleep_duration_by_day(
+    db_path_str: str, db_mtime: float, start: pd.Timestamp, end: pd.Timestamp, stages: str
+) -> pd.DataFrame:
+    srec = _cached_sleep_records(db_path_str, db_mtime, start, end)
+    return sleep_duration_by_day(srec, stages=stages)
+
+
+def load_sleep_records(db_path_str: str, date_filter: DateFilter) -> pd.DataFrame:
+    """Sleep records within *date_filter* (cached until the database changes)."""
+    return _cached_sleep_records(
+        db_path_str, db_mtime(db_path_str), date_filter.start, date_filter.end
+    )
+
+
+def load_sleep_duration_by_day(
+    db_path_str: str, date_filter: DateFilter, *, stages: str = "all"
+) -> pd.DataFrame:
+    """Cached sleep_duration_by_day over load_sleep_records()."""
+    return _cached_sleep_duration_by_day(
+        db_path_str, db_mtime(db_path_str), date_filter.start, date_filter.end, stages
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _cached_record_types(
+    db_path_str: str, db_mtime: float, start: pd.Timestamp, end: pd.Timestamp
+) -> list[str]:
+    df = _cached_records(db_path_str, db_mtime)
+    return available_record_types(apply_date_filter(df, DateFilter(start=start, end=end)))
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _cached_metric_records(
+    db_path_str: str, db_mtime: float, start: pd.Timestamp, end: pd.Timestamp, record_type: str
+) -> pd.DataFrame:
+    df = _cached_records(db_path_str, db_mtime)
+    metric = apply_date_filter(df[df["type"] == record_type], DateFilter(start=start, end=end))
+    return normalize_units(metric, record_type=record_type)
+
+
+def load_record_types(db_path_str: str, date_filter: DateFilter) -> list[str]:
+    """Record types present within *date_filter* (cached until the database changes)."""
+    return _cached_record_types(
+        db_path_str, db_mtime(db_path_str), date_filter.start, date_filter.end
+    )
+
+
+def load_metric_records(
+    db_path_str: str, date_filter: DateFilter, record_type: str
+) -> pd.DataFrame:
+    """Unit-normalized records of one type within *date_filter* (cached)."""
+    return _cached_metric_records(
+        db_path_str, db_mtime(db_path_str), date_filter.start, date_filter.end, record_type
+    )
+
+
+# Database-side queries for pages that browse the store instead of loading the
+# full record table (Explorer). Same db_mtime keying as the loaders above.
+def _query_db(db_path_str: str, fn, **kwargs):
+    con = open_db(Path(db_path_str))
     try:
         init_db(con)
-        try:
-            df = con.execute("SELECT * FROM activity_summary").df()
-            if "day" in df.columns:
-                df["day"] = pd.to_datetime(df["day"], utc=True, errors="coerce")
-            return df
-        except Exception:
-            return pd.DataFrame()
+        return fn(con, **kwargs)
     finally:
         con.close()
 
 
+@st.cache_data(show_spinner=False, max_entries=4)
+def _cached_stored_record_types(db_path_str: str, db_mtime: float) -> list[str]:
+    return _query_db(db_path_str, list_record_types)
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _cached_record_count(
+    db_path_str: str,
+    db_mtime: float,
+    record_type: str | None,
+    start_at: datetime | None,
+    end_at: datetime | None,
+) -> int:
+    return _query_db(
+        db_path_str, count_records, record_type=record_type, start_at=start_at, end_at=end_at
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _cached_record_type_span(
+    db_path_str: str, db_mtime: float, record_type: str
+) -> tuple[datetime, datetime] | None:
+    return _query_db(db_path_str, record_type_span, record_type=record_type)
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _cached_records_page(
+    db_path_str: str,
+    db_mtime: float,
+    record_type: str | None,
+    start_at: datetime | None,
+    end_at: datetime | None,
+    order: str,
+    limit: int,
+    offset: int,
+    after: tuple[datetime, str] | None,
+) -> pd.DataFrame:
+    return _query_db(
+        db_path_str,
+        query_records_page_df,
+        record_type=record_type,
+        start_at=start_at,
+        end_at=end_at,
+        order=order,
+        limit=limit,
+        offset=offset,
+        after=after,
+    )
+
+
+def load_stored_record_types(db_path_str: str) -> list[str]:
+    """Every record type in the database (cached until the database changes)."""
+    return _cached_stored_record_types(db_path_str, db_mtime(db_path_str))
+
+
+def load_record_count(
+    db_path_str: str,
+    *,
+    record_type: str | None = None,
+    start_at: datetime | None = None,
+    end_at: datetime | None = None,
+) -> int:
+    """Cached count_records()."""
+    return _cached_record_count(
+        db_path_str, db_mtime(db_path_str), record_type, start_at, end_at
+    )
+
+
+def load_record_type_span(
+    db_path_str: str, record_type: str
+) -> tuple[datetime, datetime] | None:
+    """Cached record_type_span()."""
+    return _cached_record_type_span(db_path_str, db_mtime(db_path_str), record_type)
+
+
+def load_records_page(
+    db_path_str: str,
+    *,
+    record_type: str | None = None,
+    start_at: datetime | None = None,
+    end_at: datetime | None = None,
+    order: str = "start_at_desc",
+    limit: int = 500,
+    offset: int = 0,
+    after: tuple[datetime, str] | None = None,
+) -> pd.DataFrame:
+    """Cached query_records_page_df()."""
+    return _cached_records_page(
+        db_path_str,
+        db_mtime(db_path_str),
+        record_type,
+        start_at,
+        end_at,
+        order,
+        limit,
+        offset,
+        after,
+    )
+
+
 _NAV_SECTIONS = {
     "Dashboards": [
         ("🏠", "Home", "app.py"),
@@ -65,16 +65,23 @@ def info_card(title: str, body: str) -> None:
 
 
 def stat_row(items: list[tuple[str, str]]) -> None:
-    """Render a compact row of key/value stats."""
-    cols = st.columns(len(items))
-    for col, (k, v) in zip(cols, items, strict=False):
-        with col:
-            st.markdown(
-                f"""
-<div class="ahd-card">
+    """Render a compact row of key/value stats.
+
+    The tiles are laid out by a CSS grid inside one markdown element rather
+    than one st.columns cell and element per stat.
+    """
+    tiles = "".join(
+        f"""<div class="ahd-card">
   <div style="font-size: 0.85rem; opacity: 0.76;">{k}</div>
   <div style="font-size: 1.1rem; font-weight: 650;">{v}</div>
 </div>
+"""
+        for k, v in items
+    )
+    st.markdown(
+        f"""
+<div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(140px, 1fr)); gap: 12px;">
+{tiles}</div>
 """,
-                unsafe_allow_html=True,
-            )
+        unsafe_allow_html=True,
+    )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import shutil
 import time
 import zipfile
 from pathlib import Path
@@ -9,6 +10,7 @@ import streamlit as st
 
 from apple_health_dashboard.db import default_db_path
 from apple_health_dashboard.ingest.importer import import_export_xml_to_duckdb_all
+from apple_health_dashboard.ingest.xml_stream import find_export_xml_member
 from apple_health_dashboard.local_data import delete_local_data
 from apple_health_dashboard.storage.duckdb_store import (
     init_db,
@@ -29,21 +31,11 @@ def _save_uploaded_file_to_tmp(uploaded_file) -> Path:
     tmp_dir = Path(st.session_state.get("tmp_dir", Path.cwd() / ".tmp"))
     tmp_dir.mkdir(parents=True, exist_ok=True)
     dst = tmp_dir / uploaded_file.name
-    dst.write_bytes(uploaded_file.getbuffer())
+    uploaded_file.seek(0)
+    with open(dst, "wb") as out:
+        shutil.copyfileobj(uploaded_file, out, length=1 << 20)
     return dst
 
-def _extract_export_xml_from_zip(zip_path: Path) -> Path:
-    tmp_dir = Path(st.session_state.get("tmp_dir", Path.cwd() / ".tmp"))
-    tmp_dir.mkdir(parents=True, exist_ok=True)
-    with zipfile.ZipFile(zip_path) as zf:
-        candidates = [n for n in zf.namelist() if n.endswith("export.xml")]
-        if not candidates:
-            raise ValueError("No export.xml found in the zip.")
-        export_name = sorted(candidates, key=len)[0]
-        out_path = tmp_dir / "export.xml"
-        out_path.write_bytes(zf.read(export_name))
-        return out_path
-
 def _db_stats(db_path: Path) -> dict[str, int]:
     """Return basic counts from the database."""
     try:
@@ -110,7 +102,11 @@ with col_l:
         saved_path = _save_uploaded_file_to_tmp(uploaded)
         if saved_path.suffix.lower() == ".zip":
             try:
-                export_xml_path = _extract_export_xml_from_zip(saved_path)
+                # The importer streams the member straight out of the zip;
+                # only check up front that there is an export.xml inside.
+                with zipfile.ZipFile(saved_path) as zf:
+                    find_export_xml_member(zf)
+                export_xml_path = saved_path
             except ValueError as e:
                 st.error(str(e))
         else:
@@ -129,7 +125,9 @@ with col_l:
 
         def on_progress(stage: str, processed: int) -> None:
             label = "Records" if stage == "records" else "Workouts"
-            pct = min((processed % 5000) / 5000.0, 0.99)
+            # The total isn't known up front; the importer reports once per
+            # 5000-record batch, so ease towards (but never reach) 100%.
+            pct = min(processed / (processed + 50_000), 0.99)
             progress.progress(pct, text=f"{label}: {processed:,} processed")
             status.write(f"⚙️ {label}: {processed:,} processed…")
 
@@ -150,14 +148,19 @@ with col_l:
         progress.progress(1.0, text="Done ✓")
         status.empty()
 
-        st.success(
-            f"✅ Import complete in {dt:.1f}s · "
-            f"Records: **{counters['records_inserted']:,}** · "
-            f"Activity days: **{counters['activity_summaries_inserted']:,}** · "
-            f"Workouts: **{counters['workouts_inserted']:,}**"
-        )
-        st.balloons()
-        st.rerun()
+        if counters["skipped"]:
+            st.info("This export was already imported and hasn't changed, so it was skipped.")
+        else:
+            st.success(
+                f"✅ Import complete in {dt:.1f}s · "
+                f"Records: **{counters['records_inserted']:,}** · "
+                f"Activity days: **{counters['activity_summaries_inserted']:,}** · "
+                f"Workouts: **{counters['workouts_inserted']:,}**"
+            )
+            # Drop the frames cached for the pre-import database file.
+            st.cache_data.clear()
+            st.balloons()
+            st.rerun()
 
 with col_r:
     st.markdown("### 🛠️ Maintenance")
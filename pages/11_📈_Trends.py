@@ -7,6 +7,7 @@ import streamlit as st
 from apple_health_dashboard.db import default_db_path
 from apple_health_dashboard.services.filters import DateFilter
 from apple_health_dashboard.services.forecasting import forecast_metric
+from apple_health_dashboard.services.stats import week_start
 from apple_health_dashboard.web.page_utils import (
     load_all_records,
     load_all_workouts,
@@ -286,7 +287,7 @@ with tabs[5]:
         wdf2["day"] = wdf2["start_at"].dt.floor("D")
         wdf2["month"] = wdf2["start_at"].dt.to_period("M").dt.start_time
         wdf2["year"] = wdf2["start_at"].dt.year.astype(str)
-        wdf2["week"] = wdf2["start_at"].dt.to_period("W").dt.start_time
+        wdf2["week"] = week_start(wdf2["start_at"])
 
         # Year-over-year weekly workout count
         if compare_years:
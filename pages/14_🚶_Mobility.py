@@ -31,7 +31,7 @@ if df.empty:
     st.page_link("app.py", label="Go to Home →", icon="🏠")
     st.stop()
 
-date_filter = sidebar_date_filter(df)
+date_filter = sidebar_date_filter(df, db_path_str=str(db_path))
 if date_filter is None:
     st.stop()
 
@@ -84,7 +84,7 @@ if not hr_data.empty:
             st.info("Occasional spikes are normal during intense exercise or stress, but if you feel unwell, please consult a professional.")
 
 # ── Date filter ───────────────────────────────────────────────────────────────
-date_filter = sidebar_date_filter(df)
+date_filter = sidebar_date_filter(df, db_path_str=str(db_path))
 if date_filter is None:
     st.warning("Could not determine date range from the data.")
     st.stop()
@@ -98,7 +98,7 @@ with st.sidebar:
 
 # ── Step count summary ────────────────────────────────────────────────────────
 STEP_TYPE = "HKQuantityTypeIdentifierStepCount"
-steps_df = df_f[df_f["type"] == STEP_TYPE].copy() if not df_f.empty else pd.DataFrame()
+steps_df = df_f[df_f["type"] == STEP_TYPE] if not df_f.empty else pd.DataFrame()
 daily_steps = summarize_by_day_agg(steps_df, agg="sum") if not steps_df.empty else pd.DataFrame()
 
 # ── Heart summary ─────────────────────────────────────────────────────────────
@@ -113,7 +113,7 @@ body_stats = body_summary_stats(df_f)
 
 # ── Workouts in range ─────────────────────────────────────────────────────────
 if not wdf.empty and "start_at" in wdf.columns:
-    wdf_f = wdf[(wdf["start_at"] >= date_filter.start) & (wdf["start_at"] <= date_filter.end)].copy()
+    wdf_f = wdf[(wdf["start_at"] >= date_filter.start) & (wdf["start_at"] <= date_filter.end)]
 else:
     wdf_f = pd.DataFrame()
 
@@ -122,7 +122,7 @@ if not adf.empty and "day" in adf.columns:
     adf_f = adf[
         (adf["day"] >= pd.Timestamp(date_filter.start.date()))
         & (adf["day"] <= pd.Timestamp(date_filter.end.date()))
-    ].copy()
+    ]
 else:
     adf_f = pd.DataFrame()
 
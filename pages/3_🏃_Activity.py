@@ -4,15 +4,15 @@ import pandas as pd
 import streamlit as st
 
 from apple_health_dashboard.db import default_db_path
-from apple_health_dashboard.services.filters import apply_date_filter
 from apple_health_dashboard.services.stats import summarize_by_day_agg
 from apple_health_dashboard.services.streaks import daily_streak, longest_streak, personal_bests
-from apple_health_dashboard.services.units import normalize_units
 from apple_health_dashboard.web.charts import area_chart, line_chart
 from apple_health_dashboard.web.heatmaps import calendar_heatmap
 from apple_health_dashboard.web.page_utils import (
     sidebar_nav,
     load_all_records,
+    load_metric_records,
+    load_record_types,
     page_header,
     sidebar_date_filter,
 )
@@ -52,13 +52,12 @@ if df.empty:
     st.page_link("app.py", label="Go to Home →", icon="🏠")
     st.stop()
 
-date_filter = sidebar_date_filter(df)
+date_filter = sidebar_date_filter(df, db_path_str=str(db_path))
 if date_filter is None:
     st.warning("Could not determine date range.")
     st.stop()
 
-df_f = apply_date_filter(df, date_filter)
-available_types = set(df_f["type"].unique()) if not df_f.empty else set()
+available_types = set(load_record_types(str(db_path), date_filter))
 
 # Filter to only available metrics
 available_metrics = [(rt, label, unit, agg) for rt, label, unit, agg in ACTIVITY_METRICS if rt in available_types]
@@ -76,8 +75,7 @@ with st.sidebar:
     selected_rt, _, selected_unit, selected_agg = available_metrics[selected_idx]
 
 # ── Load selected metric data ─────────────────────────────────────────────────
-metric_df = df_f[df_f["type"] == selected_rt].copy()
-metric_df = normalize_units(metric_df, record_type=selected_rt)
+metric_df = load_metric_records(str(db_path), date_filter, selected_rt)
 daily = summarize_by_day_agg(metric_df, agg=selected_agg)
 
 # ── KPIs ──────────────────────────────────────────────────────────────────────
@@ -245,8 +243,7 @@ st.caption("Quick overview of all available activity metrics for the selected pe
 
 summary_rows = []
 for rt, label, unit, agg in available_metrics:
-    m_df = df_f[df_f["type"] == rt].copy()
-    m_df = normalize_units(m_df, record_type=rt)
+    m_df = load_metric_records(str(db_path), date_filter, rt)
     d = summarize_by_day_agg(m_df, agg=agg)
     if d.empty:
         continue
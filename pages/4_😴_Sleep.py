@@ -4,21 +4,21 @@ import pandas as pd
 import streamlit as st
 
 from apple_health_dashboard.db import default_db_path
-from apple_health_dashboard.services.filters import apply_date_filter
 from apple_health_dashboard.services.sleep import (
     SLEEP_RECORD_TYPE,
     sleep_consistency_stats,
-    sleep_duration_by_day,
-    sleep_records,
     sleep_stages_by_day,
     sleep_value_counts,
     SLEEP_STAGES,
     SLEEP_STAGES_ACTUAL,
 )
+from apple_health_dashboard.services.stats import week_start
 from apple_health_dashboard.web.charts import area_chart, bar_chart, stacked_bar_chart
 from apple_health_dashboard.web.page_utils import (
     sidebar_nav,
     load_all_records,
+    load_sleep_duration_by_day,
+    load_sleep_records,
     page_header,
     sidebar_date_filter,
 )
@@ -44,13 +44,12 @@ if df.empty:
     st.page_link("app.py", label="Go to Home →", icon="🏠")
     st.stop()
 
-date_filter = sidebar_date_filter(df)
+date_filter = sidebar_date_filter(df, db_path_str=str(db_path))
 if date_filter is None:
     st.warning("Could not determine date range.")
     st.stop()
 
-df_f = apply_date_filter(df, date_filter)
-srec = sleep_records(df_f)
+srec = load_sleep_records(str(db_path), date_filter)
 
 if srec.empty:
     st.info(
@@ -62,8 +61,8 @@ if srec.empty:
 
 # ── Compute summaries ─────────────────────────────────────────────────────────
 stats = sleep_consistency_stats(srec)
-dur_actual = sleep_duration_by_day(srec, stages="actual")
-dur_all = sleep_duration_by_day(srec, stages="all")
+dur_actual = load_sleep_duration_by_day(str(db_path), date_filter, stages="actual")
+dur_all = load_sleep_duration_by_day(str(db_path), date_filter, stages="all")
 # Use actual sleep if available, else fall back to all
 dur = dur_actual if not dur_actual.empty else dur_all
 
@@ -84,336 +83,358 @@ elif stats.get("avg_hours", 0) >= 8:
 
 st.divider()
 
-tabs = st.tabs(["Duration", "Sleep Stages", "Consistency", "Sleep Debt", "Bedtime Scatter", "Raw Data"])
+# Only the selected tab runs; switching tabs reruns the page.
+tabs = st.tabs(
+    ["Duration", "Sleep Stages", "Consistency", "Sleep Debt", "Bedtime Scatter", "Raw Data"],
+    key="sleep_tabs",
+    on_change="rerun",
+)
 
 # ── Duration tab ──────────────────────────────────────────────────────────────
 with tabs[0]:
-    st.subheader("Sleep Duration per Night")
-    if not dur.empty:
-        col_chart, col_stats = st.columns([3, 1])
-        with col_chart:
-            # Add 7h and 8h reference lines via Altair
-            import altair as alt
-            base = alt.Chart(dur).encode(
-                x=alt.X("day:T", axis=alt.Axis(labelAngle=-30, title="")),
-                y=alt.Y("hours:Q", axis=alt.Axis(title="Hours"), scale=alt.Scale(zero=False)),
-                tooltip=[
-                    alt.Tooltip("day:T", title="Date"),
-                    alt.Tooltip("hours:Q", title="Hours", format=".2f"),
-                ],
-            )
-            bars = base.mark_bar(color="#4A90D9", opacity=0.8)
-            line_7h = (
-                alt.Chart(pd.DataFrame({"y": [7]}))
-                .mark_rule(color="#F59E0B", strokeDash=[4, 4], strokeWidth=1.5)
-                .encode(y=alt.Y("y:Q"))
-            )
-            line_8h = (
-                alt.Chart(pd.DataFrame({"y": [8]}))
-                .mark_rule(color="#10B981", strokeDash=[4, 4], strokeWidth=1.5)
-                .encode(y=alt.Y("y:Q"))
-            )
-            chart = (bars + line_7h + line_8h).properties(
-                title="Sleep Duration (yellow = 7h, green = 8h)",
-                height=280,
-            ).interactive()
-            st.altair_chart(chart, width="stretch")
-
-        with col_stats:
-            st.markdown("**Statistics**")
-            st.metric("Average", f"{dur['hours'].mean():.2f}h")
-            st.metric("Best night", f"{dur['hours'].max():.2f}h")
-            st.metric("Shortest night", f"{dur['hours'].min():.2f}h")
-            st.metric("Std deviation", f"{dur['hours'].std():.2f}h")
-
-            if not dur_actual.empty and not dur_all.empty:
-                avg_in_bed = dur_all["hours"].mean()
-                avg_asleep = dur_actual["hours"].mean()
-                efficiency = avg_asleep / avg_in_bed * 100 if avg_in_bed > 0 else 0
-                st.metric("Sleep efficiency", f"{efficiency:.1f}%", help="Asleep / In Bed × 100")
-
-        # 30-day rolling average
-        if len(dur) >= 7:
-            st.markdown("**Rolling Average**")
-            roll_df = dur.copy()
-            roll_df["7d_avg"] = roll_df["hours"].rolling(7, min_periods=1).mean()
-            if len(roll_df) >= 30:
-                roll_df["30d_avg"] = roll_df["hours"].rolling(30, min_periods=1).mean()
-                y_cols = ["7d_avg", "30d_avg"]
-            else:
-                y_cols = ["7d_avg"]
+    if tabs[0].open:
+        st.subheader("Sleep Duration per Night")
+        if not dur.empty:
+            col_chart, col_stats = st.columns([3, 1])
+            with col_chart:
+                # Add 7h and 8h reference lines via Altair
+                import altair as alt
+                base = alt.Chart(dur).encode(
+                    x=alt.X("day:T", axis=alt.Axis(labelAngle=-30, title="")),
+                    y=alt.Y("hours:Q", axis=alt.Axis(title="Hours"), scale=alt.Scale(zero=False)),
+                    tooltip=[
+                        alt.Tooltip("day:T", title="Date"),
+                        alt.Tooltip("hours:Q", title="Hours", format=".2f"),
+                    ],
+                )
+                bars = base.mark_bar(color="#4A90D9", opacity=0.8)
+                line_7h = (
+                    alt.Chart(pd.DataFrame({"y": [7]}))
+                    .mark_rule(color="#F59E0B", strokeDash=[4, 4], strokeWidth=1.5)
+                    .encode(y=alt.Y("y:Q"))
+                )
+                line_8h = (
+                    alt.Chart(pd.DataFrame({"y": [8]}))
+                    .mark_rule(color="#10B981", strokeDash=[4, 4], strokeWidth=1.5)
+                    .encode(y=alt.Y("y:Q"))
+                )
+                chart = (bars + line_7h + line_8h).properties(
+                    title="Sleep Duration (yellow = 7h, green = 8h)",
+                    height=280,
+                ).interactive()
+                st.altair_chart(chart, width="stretch")
+
+            with col_stats:
+                st.markdown("**Statistics**")
+                st.metric("Average", f"{dur['hours'].mean():.2f}h")
+                st.metric("Best night", f"{dur['hours'].max():.2f}h")
+                st.metric("Shortest night", f"{dur['hours'].min():.2f}h")
+                st.metric("Std deviation", f"{dur['hours'].std():.2f}h")
+
+                if not dur_actual.empty and not dur_all.empty:
+                    avg_in_bed = dur_all["hours"].mean()
+                    avg_asleep = dur_actual["hours"].mean()
+                    efficiency = avg_asleep / avg_in_bed * 100 if avg_in_bed > 0 else 0
+                    st.metric(
+                        "Sleep efficiency", f"{efficiency:.1f}%", help="Asleep / In Bed × 100"
+                    )
 
-            from apple_health_dashboard.web.charts import line_chart
-            st.altair_chart(
-                line_chart(roll_df, x="day", y=y_cols, y_title="Hours", height=180),
-                width="stretch",
-            )
-    else:
-        st.info("No sleep duration data could be computed for this period.")
+            # 30-day rolling average
+            if len(dur) >= 7:
+                st.markdown("**Rolling Average**")
+                roll_df = dur.copy()
+                roll_df["7d_avg"] = roll_df["hours"].rolling(7, min_periods=1).mean()
+                if len(roll_df) >= 30:
+                    roll_df["30d_avg"] = roll_df["hours"].rolling(30, min_periods=1).mean()
+                    y_cols = ["7d_avg", "30d_avg"]
+                else:
+                    y_cols = ["7d_avg"]
+
+                from apple_health_dashboard.web.charts import line_chart
+                st.altair_chart(
+                    line_chart(roll_df, x="day", y=y_cols, y_title="Hours", height=180),
+                    width="stretch",
+                )
+        else:
+            st.info("No sleep duration data could be computed for this period.")
 
 # ── Stages tab ────────────────────────────────────────────────────────────────
 with tabs[1]:
-    st.subheader("Sleep Stages")
-    st.caption(
-        "Apple Watch (Series 4+) with watchOS 9+ records detailed sleep stages. "
-        "Older devices only record In Bed / Asleep."
-    )
+    if tabs[1].open:
+        st.subheader("Sleep Stages")
+        st.caption(
+            "Apple Watch (Series 4+) with watchOS 9+ records detailed sleep stages. "
+            "Older devices only record In Bed / Asleep."
+        )
 
-    # Stage distribution (counts)
-    stage_counts = sleep_value_counts(srec)
-    if not stage_counts.empty:
-        col_chart, col_table = st.columns([1, 1])
-        with col_chart:
-            import altair as alt
-            donut = (
-                alt.Chart(stage_counts)
-                .mark_arc(innerRadius=55)
-                .encode(
-                    theta=alt.Theta("count:Q"),
-                    color=alt.Color("stage:N", scale=alt.Scale(scheme="blues")),
-                    tooltip=[alt.Tooltip("stage:N"), alt.Tooltip("count:Q")],
+        # Stage distribution (counts)
+        stage_counts = sleep_value_counts(srec)
+        if not stage_counts.empty:
+            col_chart, col_table = st.columns([1, 1])
+            with col_chart:
+                import altair as alt
+                donut = (
+                    alt.Chart(stage_counts)
+                    .mark_arc(innerRadius=55)
+                    .encode(
+                        theta=alt.Theta("count:Q"),
+                        color=alt.Color("stage:N", scale=alt.Scale(scheme="blues")),
+                        tooltip=[alt.Tooltip("stage:N"), alt.Tooltip("count:Q")],
+                    )
+                    .properties(title="Stage Distribution (record count)", height=300)
+                )
+                st.altair_chart(donut, width="stretch")
+            with col_table:
+                st.markdown("**Stage Counts**")
+                st.dataframe(stage_counts, width="stretch", hide_index=True)
+
+        # Nightly breakdown by stage
+        if not stages_wide.empty:
+            stage_cols = [c for c in stages_wide.columns if c != "day"]
+            if len(stage_cols) >= 2:
+                st.markdown("**Nightly Stage Breakdown**")
+                st.altair_chart(
+                    stacked_bar_chart(
+                        stages_wide,
+                        x="day",
+                        y_cols=stage_cols,
+                        y_title="Hours",
+                        title="Sleep Stages per Night",
+                        height=280,
+                    ),
+                    width="stretch",
+                )
+            else:
+                st.info(
+                    "Only one sleep stage found. "
+                    "Detailed stages (Core, Deep, REM) require Apple Watch Series 4+ "
+                    "with watchOS 9+."
                 )
-                .properties(title="Stage Distribution (record count)", height=300)
-            )
-            st.altair_chart(donut, width="stretch")
-        with col_table:
-            st.markdown("**Stage Counts**")
-            st.dataframe(stage_counts, width="stretch", hide_index=True)
-
-    # Nightly breakdown by stage
-    if not stages_wide.empty:
-        stage_cols = [c for c in stages_wide.columns if c != "day"]
-        if len(stage_cols) >= 2:
-            st.markdown("**Nightly Stage Breakdown**")
-            st.altair_chart(
-                stacked_bar_chart(
-                    stages_wide,
-                    x="day",
-                    y_cols=stage_cols,
-                    y_title="Hours",
-                    title="Sleep Stages per Night",
-                    height=280,
-                ),
-                width="stretch",
-            )
         else:
-            st.info(
-                "Only one sleep stage found. "
-                "Detailed stages (Core, Deep, REM) require Apple Watch Series 4+ with watchOS 9+."
-            )
-    else:
-        st.info("No stage breakdown data available.")
+            st.info("No stage breakdown data available.")
 
 # ── Consistency tab ───────────────────────────────────────────────────────────
 with tabs[2]:
-    st.subheader("Sleep Consistency")
-    st.caption("Regular sleep timing is as important as duration.")
-
-    from apple_health_dashboard.services.sleep import sleep_timing_consistency
-    import numpy as np
-    timing_stats = sleep_timing_consistency(srec)
-    if timing_stats:
-        st.markdown("**Timing Consistency**")
-        c1, c2, c3, c4 = st.columns(4)
-        c1.metric("Consistency Score", f"{timing_stats['consistency_score']:.0f}/100", help="Based on bedtime/waketime variance. 100 = perfect consistency.")
+    if tabs[2].open:
+        st.subheader("Sleep Consistency")
+        st.caption("Regular sleep timing is as important as duration.")
+
+        from apple_health_dashboard.services.sleep import sleep_timing_consistency
+        import numpy as np
+        timing_stats = sleep_timing_consistency(srec)
+        if timing_stats:
+            st.markdown("**Timing Consistency**")
+            c1, c2, c3, c4 = st.columns(4)
+            c1.metric("Consistency Score", f"{timing_stats['consistency_score']:.0f}/100", help="Based on bedtime/waketime variance. 100 = perfect consistency.")
         
-        def fmt_time(h):
-            if pd.isna(h): return "—"
-            h = h % 24
-            hr = int(h)
-            mn = int((h - hr) * 60)
-            return f"{hr:02d}:{mn:02d}"
+            def fmt_time(h):
+                if pd.isna(h): return "—"
+                h = h % 24
+                hr = int(h)
+                mn = int((h - hr) * 60)
+                return f"{hr:02d}:{mn:02d}"
             
-        c2.metric("Avg Bedtime", fmt_time(timing_stats.get("avg_bedtime")))
-        c3.metric("Avg Waketime", fmt_time(timing_stats.get("avg_waketime")))
-        c4.metric("Bedtime Variance", f"± {timing_stats.get('bedtime_variance_h', 0) * 60:.0f} mins")
-        st.divider()
-
-    if not dur.empty:
-        col_dist, col_heat = st.columns(2)
-
-        with col_dist:
-            st.markdown("**Distribution of Sleep Duration**")
-            hist_df = dur.copy()
-            hist_df["hours_bin"] = (hist_df["hours"] * 2).round() / 2  # 30-min bins
-            bin_counts = hist_df["hours_bin"].value_counts().reset_index()
-            bin_counts.columns = ["hours", "nights"]
-            bin_counts = bin_counts.sort_values("hours")
-
-            import altair as alt
-            hist_chart = (
-                alt.Chart(bin_counts)
-                .mark_bar(color="#4A90D9", opacity=0.8)
-                .encode(
-                    x=alt.X("hours:Q", axis=alt.Axis(title="Hours")),
-                    y=alt.Y("nights:Q", axis=alt.Axis(title="Nights")),
-                    tooltip=[alt.Tooltip("hours:Q"), alt.Tooltip("nights:Q")],
-                )
-                .properties(title="Nights at Each Duration", height=260)
-            )
-            st.altair_chart(hist_chart, width="stretch")
-
-        with col_heat:
-            st.markdown("**Weekly Sleep Heatmap**")
-            if len(dur) >= 7:
-                heat_df = dur.copy()
-                heat_df["day_dt"] = pd.to_datetime(heat_df["day"])
-                heat_df["week"] = heat_df["day_dt"].dt.isocalendar().week.astype(str)
-                heat_df["weekday"] = heat_df["day_dt"].dt.day_name()
-                WEEKDAY_ORDER = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-                heat_df["weekday"] = pd.Categorical(heat_df["weekday"], categories=WEEKDAY_ORDER, ordered=True)
+            c2.metric("Avg Bedtime", fmt_time(timing_stats.get("avg_bedtime")))
+            c3.metric("Avg Waketime", fmt_time(timing_stats.get("avg_waketime")))
+            c4.metric("Bedtime Variance", f"± {timing_stats.get('bedtime_variance_h', 0) * 60:.0f} mins")
+            st.divider()
+
+        if not dur.empty:
+            col_dist, col_heat = st.columns(2)
+
+            with col_dist:
+                st.markdown("**Distribution of Sleep Duration**")
+                hist_df = dur.copy()
+                hist_df["hours_bin"] = (hist_df["hours"] * 2).round() / 2  # 30-min bins
+                bin_counts = hist_df["hours_bin"].value_counts().reset_index()
+                bin_counts.columns = ["hours", "nights"]
+                bin_counts = bin_counts.sort_values("hours")
 
                 import altair as alt
-                heat_chart = (
-                    alt.Chart(heat_df)
-                    .mark_rect()
+                hist_chart = (
+                    alt.Chart(bin_counts)
+                    .mark_bar(color="#4A90D9", opacity=0.8)
                     .encode(
-                        x=alt.X("week:O", axis=alt.Axis(title="Week")),
-                        y=alt.Y("weekday:O", sort=WEEKDAY_ORDER, axis=alt.Axis(title="")),
-                        color=alt.Color(
-                            "hours:Q",
-                            scale=alt.Scale(scheme="blues", domain=[4, 10]),
-                            legend=alt.Legend(title="Hours"),
-                        ),
-                        tooltip=[
-                            alt.Tooltip("day_dt:T", title="Date"),
-                            alt.Tooltip("hours:Q", format=".1f"),
-                        ],
+                        x=alt.X("hours:Q", axis=alt.Axis(title="Hours")),
+                        y=alt.Y("nights:Q", axis=alt.Axis(title="Nights")),
+                        tooltip=[alt.Tooltip("hours:Q"), alt.Tooltip("nights:Q")],
                     )
-                    .properties(title="Sleep by Day of Week & Week Number", height=240)
+                    .properties(title="Nights at Each Duration", height=260)
                 )
-                st.altair_chart(heat_chart, width="stretch")
-            else:
-                st.info("Need at least 7 days of data for the heatmap.")
-
-        # Weekly averages
-        st.markdown("**Weekly Average Sleep**")
-        weekly = dur.copy()
-        weekly["week"] = pd.to_datetime(weekly["day"]).dt.to_period("W").dt.start_time
-        weekly_avg = weekly.groupby("week")["hours"].mean().reset_index()
-        weekly_avg.columns = ["week", "avg_hours"]
-
-        import altair as alt
-        weekly_chart = (
-            alt.Chart(weekly_avg)
-            .mark_bar(color="#7C3AED", opacity=0.8)
-            .encode(
-                x=alt.X("week:T", axis=alt.Axis(labelAngle=-30, title="")),
-                y=alt.Y("avg_hours:Q", axis=alt.Axis(title="Avg Hours")),
-                tooltip=[alt.Tooltip("week:T", title="Week"), alt.Tooltip("avg_hours:Q", format=".2f")],
+                st.altair_chart(hist_chart, width="stretch")
+
+            with col_heat:
+                st.markdown("**Weekly Sleep Heatmap**")
+                if len(dur) >= 7:
+                    heat_df = dur.copy()
+                    heat_df["day_dt"] = pd.to_datetime(heat_df["day"])
+                    heat_df["week"] = heat_df["day_dt"].dt.isocalendar().week.astype(str)
+                    heat_df["weekday"] = heat_df["day_dt"].dt.day_name()
+                    WEEKDAY_ORDER = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+                    heat_df["weekday"] = pd.Categorical(heat_df["weekday"], categories=WEEKDAY_ORDER, ordered=True)
+
+                    import altair as alt
+                    heat_chart = (
+                        alt.Chart(heat_df)
+                        .mark_rect()
+                        .encode(
+                            x=alt.X("week:O", axis=alt.Axis(title="Week")),
+                            y=alt.Y("weekday:O", sort=WEEKDAY_ORDER, axis=alt.Axis(title="")),
+                            color=alt.Color(
+                                "hours:Q",
+                                scale=alt.Scale(scheme="blues", domain=[4, 10]),
+                                legend=alt.Legend(title="Hours"),
+                            ),
+                            tooltip=[
+                                alt.Tooltip("day_dt:T", title="Date"),
+                                alt.Tooltip("hours:Q", format=".1f"),
+                            ],
+                        )
+                        .properties(title="Sleep by Day of Week & Week Number", height=240)
+                    )
+                    st.altair_chart(heat_chart, width="stretch")
+                else:
+                    st.info("Need at least 7 days of data for the heatmap.")
+
+            # Weekly averages
+            st.markdown("**Weekly Average Sleep**")
+            weekly = dur.copy()
+            weekly["week"] = week_start(pd.to_datetime(weekly["day"]))
+            weekly_avg = weekly.groupby("week")["hours"].mean().reset_index()
+            weekly_avg.columns = ["week", "avg_hours"]
+
+            import altair as alt
+            weekly_chart = (
+                alt.Chart(weekly_avg)
+                .mark_bar(color="#7C3AED", opacity=0.8)
+                .encode(
+                    x=alt.X("week:T", axis=alt.Axis(labelAngle=-30, title="")),
+                    y=alt.Y("avg_hours:Q", axis=alt.Axis(title="Avg Hours")),
+                    tooltip=[alt.Tooltip("week:T", title="Week"), alt.Tooltip("avg_hours:Q", format=".2f")],
+                )
+                .properties(title="Weekly Average Sleep Duration", height=220)
+                .interactive()
             )
-            .properties(title="Weekly Average Sleep Duration", height=220)
-            .interactive()
-        )
-        st.altair_chart(weekly_chart, width="stretch")
+            st.altair_chart(weekly_chart, width="stretch")
 
 # ── Sleep Debt tab ────────────────────────────────────────────────────────────
 with tabs[3]:
-    st.subheader("Sleep Debt Tracker")
-    sleep_goal_h = st.slider("Sleep goal (hours/night)", 6.0, 10.0, 8.0, 0.5, key="sleep_debt_goal")
-    if not dur.empty:
-        import altair as alt
-        debt_df = dur.copy()
-        debt_df["deficit"] = sleep_goal_h - debt_df["hours"]
-        debt_df["cumulative_debt"] = debt_df["deficit"].cumsum()
-        total_debt = float(debt_df["cumulative_debt"].iloc[-1])
-        col_d1, col_d2, col_d3 = st.columns(3)
-        col_d1.metric("Cumulative sleep debt", f"{total_debt:+.1f}h")
-        col_d2.metric("Avg nightly deficit", f"{debt_df['deficit'].mean():+.2f}h")
-        col_d3.metric("Goal", f"{sleep_goal_h}h/night")
-        if total_debt > 5:
-            st.error(f"🚨 Sleep debt: **{total_debt:.1f}h**. Recovery takes several nights of extended sleep.")
-        elif total_debt > 0:
-            st.warning(f"⚠️ Sleep debt: **{total_debt:.1f}h**. Try adding 30–60 extra minutes this week.")
-        else:
-            st.success(f"✅ No sleep debt! Surplus of **{abs(total_debt):.1f}h**.")
-        debt_chart = (
-            alt.Chart(debt_df)
-            .mark_area(line={"color": "#EF4444", "strokeWidth": 2},
-                       color=alt.Gradient(gradient="linear",
-                           stops=[alt.GradientStop(color="rgba(239,68,68,0.35)", offset=0),
-                                  alt.GradientStop(color="rgba(239,68,68,0.02)", offset=1)],
-                           x1=1, x2=1, y1=0, y2=1))
-            .encode(
-                x=alt.X("day:T", axis=alt.Axis(labelAngle=-30, title="")),
-                y=alt.Y("cumulative_debt:Q", axis=alt.Axis(title="Cumulative debt (hours)")),
-                tooltip=[alt.Tooltip("day:T", title="Date"),
-                         alt.Tooltip("cumulative_debt:Q", title="Debt (h)", format=".2f"),
-                         alt.Tooltip("hours:Q", title="Slept (h)", format=".1f")],
-            )
-            .properties(title=f"Cumulative Sleep Debt vs {sleep_goal_h}h Goal", height=280)
-            .interactive()
+    if tabs[3].open:
+        st.subheader("Sleep Debt Tracker")
+        sleep_goal_h = st.slider(
+            "Sleep goal (hours/night)", 6.0, 10.0, 8.0, 0.5, key="sleep_debt_goal"
         )
-        zero_line = (
-            alt.Chart(pd.DataFrame({"y": [0]}))
-            .mark_rule(strokeDash=[4, 3], color="#10B981", strokeWidth=2)
-            .encode(y=alt.Y("y:Q"))
-        )
-        st.altair_chart((debt_chart + zero_line), width="stretch")
-        st.caption("Above green line = in debt · Below = surplus.")
-    else:
-        st.info("No sleep duration data available.")
-
-# ── Bedtime Scatter tab ────────────────────────────────────────────────────────
-with tabs[4]:
-    st.subheader("Bedtime & Wake-time Patterns")
-    st.caption("How consistent is your sleep schedule? Tight clusters = good routine.")
-    from apple_health_dashboard.services.sleep import sleep_timing_consistency
-    timing = sleep_timing_consistency(srec)
-    if timing:
-        c_t1, c_t2, c_t3, c_t4 = st.columns(4)
-        c_t1.metric("Consistency score", f"{timing['consistency_score']:.0f}/100")
-        def _fmt_h(h):
-            if h is None: return "—"
-            h = h % 24; return f"{int(h):02d}:{int((h % 1)*60):02d}"
-        c_t2.metric("Avg bedtime", _fmt_h(timing.get("avg_bedtime")))
-        c_t3.metric("Avg wake time", _fmt_h(timing.get("avg_waketime")))
-        c_t4.metric("Bedtime variance", f"±{timing.get('bedtime_variance_h', 0)*60:.0f} min")
-    if "start_at" in srec.columns and "end_at" in srec.columns and not srec.empty:
-        import altair as alt
-        scat_df = srec.copy()
-        scat_df["night"] = scat_df["start_at"].dt.floor("D").dt.strftime("%Y-%m-%d")
-        nightly_bed = scat_df.groupby("night")["start_at"].min().reset_index()
-        nightly_wake = scat_df.groupby("night")["end_at"].max().reset_index()
-        nightly = nightly_bed.merge(nightly_wake, on="night")
-        nightly["bed_h"] = nightly["start_at"].dt.hour + nightly["start_at"].dt.minute / 60
-        nightly["wake_h"] = nightly["end_at"].dt.hour + nightly["end_at"].dt.minute / 60
-        nightly["date"] = pd.to_datetime(nightly["night"])
-        if not nightly.empty:
-            chart = (
-                alt.Chart(nightly)
-                .mark_circle(size=55, opacity=0.7)
+        if not dur.empty:
+            import altair as alt
+            debt_df = dur.copy()
+            debt_df["deficit"] = sleep_goal_h - debt_df["hours"]
+            debt_df["cumulative_debt"] = debt_df["deficit"].cumsum()
+            total_debt = float(debt_df["cumulative_debt"].iloc[-1])
+            col_d1, col_d2, col_d3 = st.columns(3)
+            col_d1.metric("Cumulative sleep debt", f"{total_debt:+.1f}h")
+            col_d2.metric("Avg nightly deficit", f"{debt_df['deficit'].mean():+.2f}h")
+            col_d3.metric("Goal", f"{sleep_goal_h}h/night")
+            if total_debt > 5:
+                st.error(f"🚨 Sleep debt: **{total_debt:.1f}h**. Recovery takes several nights of extended sleep.")
+            elif total_debt > 0:
+                st.warning(f"⚠️ Sleep debt: **{total_debt:.1f}h**. Try adding 30–60 extra minutes this week.")
+            else:
+                st.success(f"✅ No sleep debt! Surplus of **{abs(total_debt):.1f}h**.")
+            debt_chart = (
+                alt.Chart(debt_df)
+                .mark_area(line={"color": "#EF4444", "strokeWidth": 2},
+                           color=alt.Gradient(gradient="linear",
+                               stops=[alt.GradientStop(color="rgba(239,68,68,0.35)", offset=0),
+                                      alt.GradientStop(color="rgba(239,68,68,0.02)", offset=1)],
+                               x1=1, x2=1, y1=0, y2=1))
                 .encode(
-                    x=alt.X("wake_h:Q", axis=alt.Axis(title="Wake time (hour)")),
-                    y=alt.Y("bed_h:Q", axis=alt.Axis(title="Bedtime (hour)")),
-                    color=alt.Color("date:T", scale=alt.Scale(scheme="viridis"), legend=None),
-                    tooltip=[alt.Tooltip("night:N", title="Night"),
-                             alt.Tooltip("bed_h:Q", title="Bedtime h", format=".1f"),
-                             alt.Tooltip("wake_h:Q", title="Wake h", format=".1f")],
+                    x=alt.X("day:T", axis=alt.Axis(labelAngle=-30, title="")),
+                    y=alt.Y("cumulative_debt:Q", axis=alt.Axis(title="Cumulative debt (hours)")),
+                    tooltip=[alt.Tooltip("day:T", title="Date"),
+                             alt.Tooltip("cumulative_debt:Q", title="Debt (h)", format=".2f"),
+                             alt.Tooltip("hours:Q", title="Slept (h)", format=".1f")],
                 )
-                .properties(title="Bedtime vs Wake time (colour = chronological order)", height=300)
+                .properties(title=f"Cumulative Sleep Debt vs {sleep_goal_h}h Goal", height=280)
                 .interactive()
             )
-            st.altair_chart(chart, width="stretch")
-            st.caption("Tight cluster = consistent schedule. Colour: dark=early dates → light=recent.")
-    else:
-        st.info("Need sleep start/end times for this chart.")
+            zero_line = (
+                alt.Chart(pd.DataFrame({"y": [0]}))
+                .mark_rule(strokeDash=[4, 3], color="#10B981", strokeWidth=2)
+                .encode(y=alt.Y("y:Q"))
+            )
+            st.altair_chart((debt_chart + zero_line), width="stretch")
+            st.caption("Above green line = in debt · Below = surplus.")
+        else:
+            st.info("No sleep duration data available.")
+
+# ── Bedtime Scatter tab ────────────────────────────────────────────────────────
+with tabs[4]:
+    if tabs[4].open:
+        st.subheader("Bedtime & Wake-time Patterns")
+        st.caption("How consistent is your sleep schedule? Tight clusters = good routine.")
+        from apple_health_dashboard.services.sleep import sleep_timing_consistency
+        timing = sleep_timing_consistency(srec)
+        if timing:
+            c_t1, c_t2, c_t3, c_t4 = st.columns(4)
+            c_t1.metric("Consistency score", f"{timing['consistency_score']:.0f}/100")
+            def _fmt_h(h):
+                if h is None: return "—"
+                h = h % 24; return f"{int(h):02d}:{int((h % 1)*60):02d}"
+            c_t2.metric("Avg bedtime", _fmt_h(timing.get("avg_bedtime")))
+            c_t3.metric("Avg wake time", _fmt_h(timing.get("avg_waketime")))
+            c_t4.metric("Bedtime variance", f"±{timing.get('bedtime_variance_h', 0)*60:.0f} min")
+        if "start_at" in srec.columns and "end_at" in srec.columns and not srec.empty:
+            import altair as alt
+            scat_df = srec.copy()
+            scat_df["night"] = scat_df["start_at"].dt.floor("D").dt.strftime("%Y-%m-%d")
+            nightly_bed = scat_df.groupby("night")["start_at"].min().reset_index()
+            nightly_wake = scat_df.groupby("night")["end_at"].max().reset_index()
+            nightly = nightly_bed.merge(nightly_wake, on="night")
+            nightly["bed_h"] = nightly["start_at"].dt.hour + nightly["start_at"].dt.minute / 60
+            nightly["wake_h"] = nightly["end_at"].dt.hour + nightly["end_at"].dt.minute / 60
+            nightly["date"] = pd.to_datetime(nightly["night"])
+            if not nightly.empty:
+                chart = (
+                    alt.Chart(nightly)
+                    .mark_circle(size=55, opacity=0.7)
+                    .encode(
+                        x=alt.X("wake_h:Q", axis=alt.Axis(title="Wake time (hour)")),
+                        y=alt.Y("bed_h:Q", axis=alt.Axis(title="Bedtime (hour)")),
+                        color=alt.Color("date:T", scale=alt.Scale(scheme="viridis"), legend=None),
+                        tooltip=[alt.Tooltip("night:N", title="Night"),
+                                 alt.Tooltip("bed_h:Q", title="Bedtime h", format=".1f"),
+                                 alt.Tooltip("wake_h:Q", title="Wake h", format=".1f")],
+                    )
+                    .properties(
+                        title="Bedtime vs Wake time (colour = chronological order)", height=300
+                    )
+                    .interactive()
+                )
+                st.altair_chart(chart, width="stretch")
+                st.caption("Tight cluster = consistent schedule. Colour: dark=early dates → light=recent.")
+        else:
+            st.info("Need sleep start/end times for this chart.")
 
 # ── Raw data tab ──────────────────────────────────────────────────────────────
 with tabs[5]:
-    st.subheader("Raw Sleep Records")
-    display_cols = ["start_at", "end_at", "value_str", "source_name"]
-    display_cols = [c for c in display_cols if c in srec.columns]
-    display_df = srec[display_cols].copy()
-    if "value_str" in display_df.columns:
-        display_df["stage"] = display_df["value_str"].map(lambda v: SLEEP_STAGES.get(v, v))
-        display_df = display_df.drop(columns=["value_str"])
-    display_df = display_df.sort_values("start_at", ascending=False)
-
-    page_size = st.selectbox("Rows per page", [100, 250, 500], index=0, key="sleep_ps")
-    total = len(display_df)
-    pages = max(1, (total + page_size - 1) // page_size)
-    page = st.number_input("Page", min_value=1, max_value=pages, value=1, step=1, key="sleep_page")
-    start = (page - 1) * page_size
-    st.caption(f"Showing {start + 1}–{min(start + page_size, total)} of {total:,} records")
-    st.dataframe(display_df.iloc[start : start + page_size], width="stretch")
+    if tabs[5].open:
+        st.subheader("Raw Sleep Records")
+        display_cols = ["start_at", "end_at", "value_str", "source_name"]
+        display_cols = [c for c in display_cols if c in srec.columns]
+        display_df = srec[display_cols].sort_values("start_at", ascending=False)
+
+        page_size = st.selectbox("Rows per page", [100, 250, 500], index=0, key="sleep_ps")
+        total = len(display_df)
+        pages = max(1, (total + page_size - 1) // page_size)
+        page = st.number_input(
+            "Page", min_value=1, max_value=pages, value=1, step=1, key="sleep_page"
+        )
+        start = (page - 1) * page_size
+        st.caption(f"Showing {start + 1}–{min(start + page_size, total)} of {total:,} records")
+
+        # Only label the rows we actually render.
+        page_df = display_df.iloc[start : start + page_size]
+        if "value_str" in page_df.columns:
+            stage = page_df["value_str"].map(SLEEP_STAGES).fillna(page_df["value_str"])
+            page_df = page_df.assign(stage=stage).drop(columns=["value_str"])
+        st.dataframe(page_df, width="stretch")
@@ -70,7 +70,7 @@ with st.sidebar:
 adf_f = adf[
     (adf["day"] >= pd.Timestamp(date_filter.start.date()))
     & (adf["day"] <= pd.Timestamp(date_filter.end.date()))
-].copy()
+]
 
 with st.sidebar:
     st.caption(f"{date_filter.start.date()} → {date_filter.end.date()}")
@@ -297,6 +297,17 @@ with tabs[2]:
 # ── Raw Data tab ───────────────────────────────────────────────────────────────
 with tabs[3]:
     st.subheader("Raw Activity Summary Data")
-    raw = adf_f.drop(columns=["month"], errors="ignore")
-    st.dataframe(raw.sort_values("day", ascending=False), width="stretch", hide_index=True)
-    st.caption(f"Total rows: {len(raw):,}")
+    raw = adf_f.drop(columns=["month"], errors="ignore").sort_values("day", ascending=False)
+
+    total = len(raw)
+    if total == 0:
+        st.info("No ring data in the selected period.")
+    else:
+        page_size = st.selectbox("Rows per page", [100, 250, 500], index=0, key="rings_ps")
+        pages = max(1, (total + page_size - 1) // page_size)
+        page = st.number_input(
+            "Page", min_value=1, max_value=pages, value=1, step=1, key="rings_page"
+        )
+        start = (page - 1) * page_size
+        st.dataframe(raw.iloc[start : start + page_size], width="stretch", hide_index=True)
+        st.caption(f"Showing {start + 1}–{min(start + page_size, total)} of {total:,} rows")
@@ -47,7 +47,7 @@ if df.empty:
     st.page_link("app.py", label="Go to Home →", icon="🏠")
     st.stop()
 
-date_filter = sidebar_date_filter(df, current="Body")
+date_filter = sidebar_date_filter(df, current="Body", db_path_str=str(db_path))
 if date_filter is None:
     st.warning("Could not determine date range.")
     st.stop()
@@ -179,7 +179,7 @@ with tabs[1]:
     if b_trend.empty:
         # Try to compute from weight if we have height
         from apple_health_dashboard.services.body import HEIGHT_TYPE, WEIGHT_TYPE
-        height_df = df_f[df_f["type"] == HEIGHT_TYPE].copy()
+        height_df = df_f[df_f["type"] == HEIGHT_TYPE]
         if not height_df.empty and not w_trend.empty:
             latest_height_m = height_df["value"].dropna().iloc[-1]
             # Normalize height if in cm
@@ -199,7 +199,7 @@ with tabs[1]:
 
         with col_chart:
             import altair as alt
-            bmi_chart_df = b_trend.copy()
+            bmi_chart_df = b_trend
             bmi_line = (
                 alt.Chart(bmi_chart_df)
                 .mark_line(color="#7C3AED", strokeWidth=2)
@@ -17,15 +17,17 @@ from apple_health_dashboard.services.metrics import (
 )
 from apple_health_dashboard.services.stats import summarize_by_day_agg
 from apple_health_dashboard.services.units import normalize_units
-from apple_health_dashboard.storage.duckdb_store import (
-    count_records,
-    init_db,
-    list_record_types,
-    open_db,
-    query_records_page,
-)
+from apple_health_dashboard.storage.duckdb_store import next_page_cursor, open_db
 from apple_health_dashboard.web.charts import area_chart, bar_chart, line_chart
-from apple_health_dashboard.web.page_utils import page_header, sidebar_nav
+from apple_health_dashboard.web.page_utils import (
+    db_mtime,
+    load_record_count,
+    load_record_type_span,
+    load_records_page,
+    load_stored_record_types,
+    page_header,
+    sidebar_nav,
+)
 
 st.set_page_config(
     page_title="Explorer · Apple Health Dashboard",
@@ -39,13 +41,8 @@ db_path = default_db_path()
 
 # ── Load available record types ───────────────────────────────────────────────
 with st.spinner("Loading record catalogue…"):
-    con = open_db(db_path)
-    try:
-        init_db(con)
-        all_types = list_record_types(con)
-        total_records = con.execute("SELECT COUNT(*) FROM health_record").fetchone()[0]
-    finally:
-        con.close()
+    all_types = load_stored_record_types(str(db_path))
+    total_records = load_record_count(str(db_path))
 
 if not all_types:
     st.warning("No data found. Please import your Apple Health export on the Home page.")
@@ -111,24 +108,12 @@ with st.sidebar:
     use_custom = st.checkbox("Custom range", value=False, key="exp_custom")
 
 # ── Determine date range from this record type's full history ─────────────────
-con = open_db(db_path)
-try:
-    type_total = count_records(con, record_type=selected_rt)
-    # Sample first/last for date range
-    first_row = con.execute(
-        "SELECT start_at FROM health_record WHERE type=? ORDER BY start_at ASC LIMIT 1",
-        (selected_rt,),
-    ).fetchone()
-    last_row = con.execute(
-        "SELECT start_at FROM health_record WHERE type=? ORDER BY start_at DESC LIMIT 1",
-        (selected_rt,),
-    ).fetchone()
-finally:
-    con.close()
-
-if first_row and last_row:
-    type_start = pd.Timestamp(first_row[0], tz="UTC")
-    type_end = pd.Timestamp(last_row[0], tz="UTC")
+type_total = load_record_count(str(db_path), record_type=selected_rt)
+type_span = load_record_type_span(str(db_path), selected_rt)
+
+if type_span:
+    type_start = pd.Timestamp(type_span[0], tz="UTC")
+    type_end = pd.Timestamp(type_span[1], tz="UTC")
 else:
     type_start = pd.Timestamp.now(tz="UTC") - pd.Timedelta(days=90)
     type_end = pd.Timestamp.now(tz="UTC")
@@ -164,16 +149,12 @@ with st.sidebar:
 order_sql = "start_at_desc" if order == "Newest first" else "start_at_asc"
 
 # ── Load count and page ───────────────────────────────────────────────────────
-con = open_db(db_path)
-try:
-    filtered_count = count_records(
-        con,
-        record_type=selected_rt,
-        start_at=filter_start.to_pydatetime(),
-        end_at=filter_end.to_pydatetime(),
-    )
-finally:
-    con.close()
+filtered_count = load_record_count(
+    str(db_path),
+    record_type=selected_rt,
+    start_at=filter_start.to_pydatetime(),
+    end_at=filter_end.to_pydatetime(),
+)
 
 # ── Header info ───────────────────────────────────────────────────────────────
 m = _METRIC_DICT.get(selected_rt)
@@ -197,26 +178,17 @@ st.divider()
 if filtered_count > 0:
     # Pull data for chart (up to 10k records)
     sample_limit = min(filtered_count, 10000)
-    con = open_db(db_path)
-    try:
-        rows = query_records_page(
-            con,
-            record_type=selected_rt,
-            start_at=filter_start.to_pydatetime(),
-            end_at=filter_end.to_pydatetime(),
-            order="start_at_asc",
-            limit=sample_limit,
-            offset=0,
-        )
-    finally:
-        con.close()
+    chart_df = load_records_page(
+        str(db_path),
+        record_type=selected_rt,
+        start_at=filter_start.to_pydatetime(),
+        end_at=filter_end.to_pydatetime(),
+        order="start_at_asc",
+        limit=sample_limit,
+        offset=0,
+    )
 
-    chart_df = pd.DataFrame(rows)
     if not chart_df.empty:
-        for col in ["start_at", "end_at", "creation_at"]:
-            if col in chart_df.columns:
-                chart_df[col] = pd.to_datetime(chart_df[col], utc=True, errors="coerce")
-
         # Check if numeric
         is_numeric = (
             "value" in chart_df.columns
@@ -298,31 +270,37 @@ if filtered_count > 0:
     page = st.number_input("Page", min_value=1, max_value=pages, value=1, step=1, key="exp_page")
     offset = (page - 1) * page_size
 
-    con = open_db(db_path)
-    try:
-        page_rows = query_records_page(
-            con,
-            record_type=selected_rt,
-            start_at=filter_start.to_pydatetime(),
-            end_at=filter_end.to_pydatetime(),
-            order=order_sql,
-            limit=page_size,
-            offset=offset,
-        )
-    finally:
-        con.close()
+    # Where each visited page starts, as the (start_at, record_hash) of the
+    # row before it. Stepping to the next page seeks past that row (keyset
+    # pagination); only a jump to a page not reached yet falls back to OFFSET.
+    cursor_key = (
+        db_mtime(str(db_path)), selected_rt, filter_start, filter_end, order_sql, page_size
+    )
+    cursors = st.session_state.get("exp_cursors")
+    if cursors is None or cursors[0] != cursor_key:
+        cursors = (cursor_key, {1: None})
+        st.session_state["exp_cursors"] = cursors
+    page_starts = cursors[1]
+
+    page_df = load_records_page(
+        str(db_path),
+        record_type=selected_rt,
+        start_at=filter_start.to_pydatetime(),
+        end_at=filter_end.to_pydatetime(),
+        order=order_sql,
+        limit=page_size,
+        offset=0 if page in page_starts else offset,
+        after=page_starts.get(page),
+    )
+    if not page_df.empty:
+        page_starts[page + 1] = next_page_cursor(page_df)
 
     st.caption(
         f"Records {offset + 1}–{min(offset + page_size, filtered_count):,} "
         f"of {filtered_count:,} · Page {page}/{pages}"
     )
 
-    if page_rows:
-        page_df = pd.DataFrame(page_rows)
-        for col in ["start_at", "end_at", "creation_at"]:
-            if col in page_df.columns:
-                page_df[col] = pd.to_datetime(page_df[col], utc=True, errors="coerce")
-
+    if not page_df.empty:
         # Drop record_hash from display (technical field)
         display_df = page_df.drop(columns=["record_hash"], errors="ignore")
         st.dataframe(
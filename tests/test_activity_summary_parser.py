@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+from datetime import date
 from pathlib import Path
 
 from apple_health_dashboard.ingest.apple_health_activity_summary import (
     iter_activity_summaries_from_export_xml,
 )
+from apple_health_dashboard.services.activity_summary import activity_summaries_to_dataframe
 
 
 def test_activity_summary_fixture(tmp_path: Path) -> None:
@@ -24,3 +26,16 @@ def test_activity_summary_fixture(tmp_path: Path) -> None:
     assert len(rows) == 1
     assert rows[0].day.isoformat() == "2020-01-01"
     assert rows[0].active_energy_burned_kcal == 500
+
+
+def test_activity_summaries_to_dataframe_parses_dates_and_strings() -> None:
+    from_dates = activity_summaries_to_dataframe(
+        [{"day": date(2020, 1, 2)}, {"day": date(2020, 1, 1)}, {"day": None}]
+    )
+    from_strings = activity_summaries_to_dataframe(
+        [{"day": "2020-01-02"}, {"day": "2020-01-01"}, {"day": None}]
+    )
+
+    assert from_dates["day"].dt.strftime("%Y-%m-%d").tolist()[:2] == ["2020-01-01", "2020-01-02"]
+    assert from_dates["day"].isna().sum() == 1
+    assert from_dates["day"].equals(from_strings["day"])
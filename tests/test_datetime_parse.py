@@ -1,8 +1,49 @@
 from __future__ import annotations
 
-from apple_health_dashboard.ingest.apple_health import _parse_apple_datetime
+from datetime import datetime
+
+import pytest
+
+from apple_health_dashboard.ingest.apple_health import (
+    _apple_datetime_isoformat,
+    _parse_apple_datetime,
+)
 
 
 def test_parse_apple_datetime_has_tzinfo() -> None:
     dt = _parse_apple_datetime("2020-01-01 12:34:56 +0100")
     assert dt.tzinfo is not None
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2020-01-01 12:34:56 +0100",
+        "2021-07-15 23:59:59 -0430",
+        "2019-03-31 02:00:00 +0000",
+    ],
+)
+def test_parse_apple_datetime_matches_strptime(value: str) -> None:
+    expected = datetime.strptime(value, "%Y-%m-%d %H:%M:%S %z")
+    got = _parse_apple_datetime(value)
+    assert got == expected
+    assert got.utcoffset() == expected.utcoffset()
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2020-01-01 12:34:56 +0100",
+        "2021-07-15 23:59:59 -0430",
+        "2019-03-31 02:00:00 +0000",
+        "2019-03-31 02:00:00 -0000",
+        "2022-11-02 08:15:00 +0530",
+    ],
+)
+def test_apple_datetime_isoformat_matches_datetime(value: str) -> None:
+    assert _apple_datetime_isoformat(value) == _parse_apple_datetime(value).isoformat()
+
+
+def test_parse_apple_datetime_rejects_missing_offset() -> None:
+    with pytest.raises(ValueError):
+        _parse_apple_datetime("2020-01-01 12:34:56")
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+from apple_health_dashboard.ingest.importer import import_export_xml_to_duckdb_all
+from apple_health_dashboard.web import page_utils
+
+EXPLORER_PAGE = Path(__file__).resolve().parents[1] / "pages" / "8_🔬_Explorer.py"
+
+# Raised by page code this test doesn't cover: the chart theme registration and
+# the database overview's pandas.read_sql_query on a DuckDB connection.
+pytestmark = [
+    pytest.mark.filterwarnings("ignore::altair.utils.deprecation.AltairDeprecationWarning"),
+    pytest.mark.filterwarnings("ignore:pandas only supports SQLAlchemy:UserWarning"),
+]
+
+
+def test_explorer_reruns_are_served_from_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    records = "\n".join(
+        f"""  <Record type=\"HKQuantityTypeIdentifierStepCount\" sourceName=\"iPhone\"
+          unit=\"count\" value=\"{i}\"
+          startDate=\"2020-01-0{i + 1} 10:00:00 +0000\"
+          endDate=\"2020-01-0{i + 1} 10:05:00 +0000\"/>"""
+        for i in range(5)
+    )
+    export_xml = tmp_path / "export.xml"
+    export_xml.write_text(
+        f'<?xml version="1.0" encoding="UTF-8"?>\n<HealthData>\n{records}\n</HealthData>\n',
+        encoding="utf-8",
+    )
+    # The page reads the database from default_db_path(), i.e. the working directory.
+    import_export_xml_to_duckdb_all(export_xml, tmp_path / "health.duckdb")
+    monkeypatch.chdir(tmp_path)
+    # Page links need the multipage app around them, which AppTest doesn't provide.
+    monkeypatch.setattr(st, "page_link", lambda *args, **kwargs: None)
+    # AppTest installs the page as __main__; put ours back so later spawn-based
+    # tests don't re-run the page in their workers.
+    monkeypatch.setitem(sys.modules, "__main__", sys.modules["__main__"])
+    st.cache_data.clear()
+
+    queries: list[str] = []
+    for name in ("list_record_types", "count_records", "record_type_span",
+                 "query_records_page_df"):
+        query = getattr(page_utils, name)
+
+        def counted(*args, _name=name, _query=query, **kwargs):
+            queries.append(_name)
+            return _query(*args, **kwargs)
+
+        monkeypatch.setattr(page_utils, name, counted)
+
+    at = AppTest.from_file(str(EXPLORER_PAGE), default_timeout=60).run()
+    assert not at.exception
+    assert {"list_record_types", "count_records", "record_type_span"} <= set(queries)
+    assert [m.value for m in at.metric][:2] == ["5", "5"]
+
+    queries.clear()
+    at.run()
+    assert not at.exception
+    assert queries == []
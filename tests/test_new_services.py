@@ -7,6 +7,7 @@ from apple_health_dashboard.services.sleep import (
     sleep_duration_by_day,
     sleep_consistency_stats,
     sleep_stages_by_day,
+    sleep_value_counts,
     SLEEP_STAGES_ACTUAL,
 )
 from apple_health_dashboard.services.heart import (
@@ -32,7 +33,14 @@ from apple_health_dashboard.services.workouts import (
     workout_label,
     summarize_by_type,
     personal_records_by_type,
+    summarize_workouts_by_week,
 )
+from apple_health_dashboard.services.filters import DateFilter, apply_date_filter
+from apple_health_dashboard.services.records_view import (
+    split_numeric_categorical,
+    top_value_counts,
+)
+from apple_health_dashboard.services.units import normalize_units
 from apple_health_dashboard.services.metrics import (
     metric_label,
     metric_aggregation,
@@ -126,6 +134,22 @@ class TestSleepDurationByDay:
         assert "avg_hours" in stats
         assert stats["avg_hours"] == pytest.approx(8.0)
 
+    def test_value_counts_merges_labels_and_nulls(self) -> None:
+        df = pd.DataFrame({
+            "value_str": [
+                "HKCategoryValueSleepAnalysisAsleepCore",
+                "Core Sleep",
+                None,
+                "HKCategoryValueSleepAnalysisInBed",
+                "HKCategoryValueSleepAnalysisAsleepCore",
+            ],
+        })
+        result = sleep_value_counts(df, limit=2)
+        assert result.to_dict("records") == [
+            {"stage": "Core Sleep", "count": 3},
+            {"stage": "(null)", "count": 1},
+        ]
+
 
 # ── Heart tests ────────────────────────────────────────────────────────────────
 
@@ -262,6 +286,21 @@ class TestWorkouts:
         assert run_row["longest_h"] == pytest.approx(2.0)
         assert run_row["farthest_km"] == pytest.approx(20.0)
 
+    def test_summarize_workouts_by_week_starts_on_monday(self) -> None:
+        df = pd.DataFrame(
+            {
+                "workout_activity_type": ["HKWorkoutActivityTypeRunning"] * 3,
+                "start_at": pd.to_datetime(
+                    ["2024-01-07 10:00", "2024-01-08 10:00", "2024-01-14 23:00"], utc=True
+                ),
+                "duration_s": [3600.0, 3600.0, 1800.0],
+                "total_energy_kcal": [300.0, 300.0, 150.0],
+            }
+        )
+        result = summarize_workouts_by_week(df)
+        assert list(result["week"]) == list(pd.to_datetime(["2024-01-01", "2024-01-08"]))
+        assert list(result["count"]) == [1, 2]
+
 
 # ── Metrics catalogue tests ───────────────────────────────────────────────────
 
@@ -286,3 +325,87 @@ class TestMetrics:
         assert len(by_cat) >= 5
         assert "Activity" in by_cat
         assert "Heart" in by_cat
+
+
+# ── Units tests ───────────────────────────────────────────────────────────────
+
+class TestUnits:
+    DISTANCE = "HKQuantityTypeIdentifierDistanceWalkingRunning"
+
+    def _distance_df(self, units: list[str | None], *, categorical: bool) -> pd.DataFrame:
+        df = pd.DataFrame({"value": [1000.0] * len(units), "unit": units})
+        if categorical:
+            # Extra unused category, as in a type-filtered slice of the full table.
+            df["unit"] = pd.Categorical(df["unit"], categories=["count", "km", "m"])
+        return df
+
+    @pytest.mark.parametrize("categorical", [False, True])
+    def test_metres_converted_to_km(self, categorical: bool) -> None:
+        out = normalize_units(self._distance_df(["m", "m", None], categorical=categorical),
+                              record_type=self.DISTANCE)
+        assert out["value"].tolist() == [1.0, 1.0, 1.0]
+        assert (out["unit"] == "km").all()
+
+    @pytest.mark.parametrize("categorical", [False, True])
+    def test_mixed_units_left_alone(self, categorical: bool) -> None:
+        out = normalize_units(self._distance_df(["m", "km"], categorical=categorical),
+                              record_type=self.DISTANCE)
+        assert out["value"].tolist() == [1000.0, 1000.0]
+
+    def test_no_conversion_returns_input(self) -> None:
+        df = self._distance_df(["m"], categorical=False)
+        assert normalize_units(df, record_type="HKQuantityTypeIdentifierHeartRate") is df
+
+
+# ── Date filter tests ─────────────────────────────────────────────────────────
+
+class TestApplyDateFilter:
+    FILTER = DateFilter(
+        start=pd.Timestamp("2024-01-02", tz="UTC"),
+        end=pd.Timestamp("2024-01-04", tz="UTC"),
+    )
+
+    @pytest.mark.parametrize("days", [[1, 2, 3, 4, 5], [5, 3, 1, 4, 2]])
+    def test_bounds_are_inclusive_sorted_or_not(self, days: list[int]) -> None:
+        df = pd.DataFrame({
+            "start_at": pd.to_datetime([f"2024-01-0{d}" for d in days], utc=True),
+            "value": days,
+        })
+        out = apply_date_filter(df, self.FILTER)
+        assert sorted(out["value"].tolist()) == [2, 3, 4]
+
+
+# ── Records view tests ────────────────────────────────────────────────────────
+
+class TestSplitNumericCategorical:
+    def test_float_values_and_value_str(self) -> None:
+        df = pd.DataFrame({
+            "type": ["a", "b", "c"],
+            "value": [1.0, None, None],
+            "value_str": [None, "X", "Y"],
+        })
+        numeric, categorical = split_numeric_categorical(df)
+        assert numeric["value_num"].tolist() == [1.0]
+        assert categorical["value_str"].tolist() == ["X", "Y"]
+
+    def test_unparseable_object_values_become_categorical(self) -> None:
+        df = pd.DataFrame({
+            "type": ["a", "b", "c"],
+            "value": ["1", "HKCat", "2.5"],
+            "value_str": [None, None, None],
+        }, dtype=object)
+        numeric, categorical = split_numeric_categorical(df)
+        assert numeric["value_num"].tolist() == [1.0, 2.5]
+        assert categorical["value_str"].tolist() == ["HKCat"]
+
+
+class TestTopValueCounts:
+    def test_labels_are_strings_and_nulls_are_counted(self) -> None:
+        df = pd.DataFrame({"value_str": pd.Series([1, "1", "a", None, 2.5], dtype=object)})
+        out = top_value_counts(df)
+        assert out.to_dict("records") == [
+            {"value": "1", "count": 2},
+            {"value": "a", "count": 1},
+            {"value": "(null)", "count": 1},
+            {"value": "2.5", "count": 1},
+        ]
@@ -1,8 +1,31 @@
 from __future__ import annotations
 
+import os
+import xml.etree.ElementTree as StdET
+import zipfile
+from datetime import UTC, datetime
 from pathlib import Path
 
+import pandas as pd
+import pytest
+
+from apple_health_dashboard.ingest import importer, xml_stream
 from apple_health_dashboard.ingest.apple_health import iter_health_records_from_export_xml
+from apple_health_dashboard.ingest.apple_health_export import iter_export_items_from_export_xml
+from apple_health_dashboard.ingest.importer import import_export_xml_to_duckdb_all
+from apple_health_dashboard.ingest.xml_shards import iter_export_items_sharded, shard_ranges
+from apple_health_dashboard.ingest.xml_stream import open_export_xml
+from apple_health_dashboard.services.stats import records_frame_from_export_xml, to_dataframe
+from apple_health_dashboard.storage import duckdb_store
+from apple_health_dashboard.storage.duckdb_store import (
+    count_records,
+    iter_records,
+    next_page_cursor,
+    open_db,
+    query_records_page,
+    query_records_page_df,
+    records_dataframe,
+)
 
 
 def test_iterparse_small_fixture(tmp_path: Path) -> None:
@@ -26,3 +49,377 @@ def test_iterparse_small_fixture(tmp_path: Path) -> None:
     assert len(records) == 2
     assert records[0].type == "HKQuantityTypeIdentifierStepCount"
     assert records[0].value == 42.0
+    assert records_frame_from_export_xml(export_xml).equals(to_dataframe(records))
+
+
+@pytest.mark.parametrize("use_lxml", [True, False])
+def test_single_pass_dispatches_all_entity_types(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, use_lxml: bool
+) -> None:
+    if not use_lxml:
+        monkeypatch.setattr(xml_stream, "HAVE_LXML", False)
+        monkeypatch.setattr(xml_stream, "ET", StdET)
+
+    xml = """<?xml version=\"1.0\" encoding=\"UTF-8\"?>
+<HealthData locale=\"en_US\">
+  <Record type=\"HKQuantityTypeIdentifierStepCount\" sourceName=\"iPhone\"
+          unit=\"count\" value=\"42\"
+          startDate=\"2020-01-01 10:00:00 +0100\" endDate=\"2020-01-01 10:05:00 +0100\">
+    <MetadataEntry key=\"HKWasUserEntered\" value=\"1\"/>
+  </Record>
+  <Workout workoutActivityType=\"HKWorkoutActivityTypeRunning\" duration=\"30\"
+           startDate=\"2020-01-01 12:00:00 +0100\" endDate=\"2020-01-01 12:30:00 +0100\">
+    <MetadataEntry key=\"HKIndoorWorkout\" value=\"0\"/>
+  </Workout>
+  <Correlation type=\"HKCorrelationTypeIdentifierBloodPressure\"
+               startDate=\"2020-01-01 13:00:00 +0100\" endDate=\"2020-01-01 13:00:00 +0100\">
+    <Record type=\"HKQuantityTypeIdentifierBloodPressureSystolic\" unit=\"mmHg\" value=\"120\"
+            startDate=\"2020-01-01 13:00:00 +0100\" endDate=\"2020-01-01 13:00:00 +0100\"/>
+  </Correlation>
+  <Record type=\"HKQuantityTypeIdentifierStepCount\" value=\"1\"/>
+  <ActivitySummary dateComponents=\"2020-01-01\" activeEnergyBurned=\"350.5\"
+                   appleStandHours=\"10\"/>
+</HealthData>
+"""
+
+    export_xml = tmp_path / "export.xml"
+    export_xml.write_text(xml, encoding="utf-8")
+
+    items = list(iter_export_items_from_export_xml(export_xml))
+    assert [tag for tag, _item in items] == ["Record", "Workout", "Record", "ActivitySummary"]
+
+    record, r_hash, record_meta = items[0][1]
+    assert record.value == 42.0
+    assert [(m.record_hash, m.key) for m in record_meta] == [(r_hash, "HKWasUserEntered")]
+
+    workout, workout_meta = items[1][1]
+    assert workout.duration_s == 30.0
+    assert [m.key for m in workout_meta] == ["HKIndoorWorkout"]
+
+    assert items[2][1][0].record_type == "HKQuantityTypeIdentifierBloodPressureSystolic"
+    assert items[3][1].active_energy_burned_kcal == 350
+
+
+def test_open_export_xml_reads_zip_member(tmp_path: Path) -> None:
+    xml = """<?xml version=\"1.0\" encoding=\"UTF-8\"?>
+<HealthData locale=\"en_US\">
+  <Record type=\"HKQuantityTypeIdentifierStepCount\" sourceName=\"iPhone\"
+          unit=\"count\" value=\"42\"
+          startDate=\"2020-01-01 10:00:00 +0100\" endDate=\"2020-01-01 10:05:00 +0100\"
+          creationDate=\"2020-01-01 10:06:00 +0100\"/>
+</HealthData>
+"""
+
+    export_zip = tmp_path / "export.zip"
+    with zipfile.ZipFile(export_zip, "w") as zf:
+        zf.writestr("apple_health_export/export.xml", xml)
+
+    with open_export_xml(export_zip) as fh:
+        records = list(iter_health_records_from_export_xml(fh))
+    assert len(records) == 1
+    assert records[0].value == 42.0
+
+
+def test_iter_records_roundtrip_through_duckdb(tmp_path: Path) -> None:
+    xml = """<?xml version=\"1.0\" encoding=\"UTF-8\"?>
+<HealthData locale=\"en_US\">
+  <Record type=\"HKQuantityTypeIdentifierStepCount\" sourceName=\"iPhone\"
+          unit=\"count\" value=\"42\"
+          startDate=\"2020-01-01 10:00:00 +0100\" endDate=\"2020-01-01 10:05:00 +0100\"
+          creationDate=\"2020-01-01 10:06:00 +0100\"/>
+  <Record type=\"HKQuantityTypeIdentifierHeartRate\" sourceName=\"Watch\"
+          unit=\"count/min\" value=\"60\"
+          startDate=\"2020-01-01 11:00:00 +0100\" endDate=\"2020-01-01 11:00:05 +0100\"
+          creationDate=\"2020-01-01 11:00:06 +0100\"/>
+</HealthData>
+"""
+
+    export_xml = tmp_path / "export.xml"
+    export_xml.write_text(xml, encoding="utf-8")
+    db_path = tmp_path / "health.duckdb"
+    import_export_xml_to_duckdb_all(export_xml, db_path)
+
+    con = open_db(db_path)
+    try:
+        records = list(iter_records(con))
+        frame = records_dataframe(con)
+    finally:
+        con.close()
+
+    assert [r.value for r in records] == [42.0, 60.0]
+    from_records = to_dataframe(records)
+    from_tuples = to_dataframe(
+        (r.type, r.start_at, r.end_at, r.creation_at, r.source_name, r.unit, r.value, r.value_str)
+        for r in records
+    )
+    assert from_records.equals(from_tuples)
+    assert isinstance(from_records["type"].dtype, pd.CategoricalDtype)
+
+    assert isinstance(frame["type"].dtype, pd.CategoricalDtype)
+    assert set(frame["type"]) == {r.type for r in records}
+    # Loaded frames hold only the stored columns, so tables and CSV exports built
+    # from them show nothing extra.
+    assert "day" not in frame.columns
+    assert "day" not in from_records.columns
+
+
+def test_category_values_land_in_value_str(tmp_path: Path) -> None:
+    xml = """<?xml version=\"1.0\" encoding=\"UTF-8\"?>
+<HealthData locale=\"en_US\">
+  <Record type=\"HKCategoryTypeIdentifierSleepAnalysis\" sourceName=\"Watch\"
+          value=\"HKCategoryValueSleepAnalysisAsleepCore\"
+          startDate=\"2020-01-01 23:00:00 +0100\" endDate=\"2020-01-02 01:00:00 +0100\"/>
+  <Record type=\"HKQuantityTypeIdentifierBodyMass\" sourceName=\"iPhone\"
+          unit=\"kg\" value=\"-1.5e1\"
+          startDate=\"2020-01-02 07:00:00 +0100\" endDate=\"2020-01-02 07:00:00 +0100\"/>
+</HealthData>
+"""
+
+    export_xml = tmp_path / "export.xml"
+    export_xml.write_text(xml, encoding="utf-8")
+
+    sleep, mass = list(iter_health_records_from_export_xml(export_xml))
+    assert sleep.value is None
+    assert sleep.value_str == "HKCategoryValueSleepAnalysisAsleepCore"
+    assert mass.value == -15.0
+    assert mass.value_str is None
+    # No creationDate: the column-wise date parse must leave NaT, like the per-row one.
+    assert records_frame_from_export_xml(export_xml).equals(to_dataframe([sleep, mass]))
+
+
+def test_unchanged_export_is_not_reparsed(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    xml = """<?xml version=\"1.0\" encoding=\"UTF-8\"?>
+<HealthData locale=\"en_US\">
+  <Record type=\"HKQuantityTypeIdentifierStepCount\" sourceName=\"iPhone\"
+          unit=\"count\" value=\"42\"
+          startDate=\"2020-01-01 10:00:00 +0100\" endDate=\"2020-01-01 10:05:00 +0100\"/>
+</HealthData>
+"""
+
+    export_xml = tmp_path / "export.xml"
+    export_xml.write_text(xml, encoding="utf-8")
+    db_path = tmp_path / "health.duckdb"
+    first = import_export_xml_to_duckdb_all(export_xml, db_path)
+    assert first["records_inserted"] == 1
+    assert first["skipped"] is False
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("export.xml was parsed again")
+
+    monkeypatch.setattr(importer, "iter_export_items_from_export_xml", _fail)
+    second = import_export_xml_to_duckdb_all(export_xml, db_path)
+    assert second == {**dict.fromkeys(first, 0), "skipped": True}
+    assert second["records_inserted"] == 0
+
+    with pytest.raises(AssertionError):
+        import_export_xml_to_duckdb_all(export_xml, db_path, force=True)
+
+    stat = export_xml.stat()
+    os.utime(export_xml, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    with pytest.raises(AssertionError):
+        import_export_xml_to_duckdb_all(export_xml, db_path)
+
+
+_SHARDED_XML = """<?xml version=\"1.0\" encoding=\"UTF-8\"?>
+<!DOCTYPE HealthData [
+<!ATTLIST HealthData locale CDATA #REQUIRED>
+]>
+<HealthData locale=\"en_US\">
+ <ExportDate value=\"2020-01-02 00:00:00 +0100\"/>
+ <Record type=\"HKQuantityTypeIdentifierStepCount\" unit=\"count\" value=\"1\"
+         startDate=\"2020-01-01 10:00:00 +0100\" endDate=\"2020-01-01 10:05:00 +0100\"/>
+ <Correlation type=\"HKCorrelationTypeIdentifierBloodPressure\"
+              startDate=\"2020-01-01 13:00:00 +0100\" endDate=\"2020-01-01 13:00:00 +0100\">
+  <Record type=\"HKQuantityTypeIdentifierBloodPressureSystolic\" unit=\"mmHg\" value=\"120\"
+          startDate=\"2020-01-01 13:00:00 +0100\" endDate=\"2020-01-01 13:00:00 +0100\"/>
+  <Record type=\"HKQuantityTypeIdentifierBloodPressureDiastolic\" unit=\"mmHg\" value=\"80\"
+          startDate=\"2020-01-01 13:00:00 +0100\" endDate=\"2020-01-01 13:00:00 +0100\"/>
+ </Correlation>
+ <Workout workoutActivityType=\"HKWorkoutActivityTypeRunning\" duration=\"30\"
+          startDate=\"2020-01-01 12:00:00 +0100\" endDate=\"2020-01-01 12:30:00 +0100\">
+  <MetadataEntry key=\"HKIndoorWorkout\" value=\"0\"/>
+ </Workout>
+ <ActivitySummary dateComponents=\"2020-01-01\" activeEnergyBurned=\"350\"/>
+ <Record type=\"HKQuantityTypeIdentifierStepCount\" unit=\"count\" value=\"2\"
+         startDate=\"2020-01-01 11:00:00 +0100\" endDate=\"2020-01-01 11:05:00 +0100\"/>
+</HealthData>
+"""
+
+
+def test_shard_ranges_never_cut_inside_a_correlation() -> None:
+    buf = _SHARDED_XML.encode("utf-8")
+    ranges = shard_ranges(buf, shard_size=1)
+
+    assert len(ranges) == 5
+    assert ranges[0][0] == buf.index(b">", buf.index(b"<HealthData ")) + 1
+    assert ranges[-1][1] == buf.rindex(b"</HealthData>")
+    for lo, hi in ranges:
+        fragment = buf[lo:hi]
+        assert fragment.count(b"<Correlation") == fragment.count(b"</Correlation>")
+
+
+def test_sharded_parse_matches_serial(tmp_path: Path) -> None:
+    export_xml = tmp_path / "export.xml"
+    export_xml.write_text(_SHARDED_XML, encoding="utf-8")
+
+    serial = list(iter_export_items_from_export_xml(export_xml))
+    sharded = list(iter_export_items_sharded(export_xml, workers=2, shard_size=1))
+    assert [tag for tag, _item in serial].count("Record") == 4
+    assert sharded == serial
+
+
+def test_failed_import_leaves_database_untouched(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    xml = """<?xml version=\"1.0\" encoding=\"UTF-8\"?>
+<HealthData locale=\"en_US\">
+  <Record type=\"HKQuantityTypeIdentifierStepCount\" sourceName=\"iPhone\"
+          unit=\"count\" value=\"42\"
+          startDate=\"2020-01-01 10:00:00 +0100\" endDate=\"2020-01-01 10:05:00 +0100\"/>
+  <Workout workoutActivityType=\"HKWorkoutActivityTypeRunning\" duration=\"30\"
+           startDate=\"2020-01-01 12:00:00 +0100\" endDate=\"2020-01-01 12:30:00 +0100\"/>
+</HealthData>
+"""
+
+    export_xml = tmp_path / "export.xml"
+    export_xml.write_text(xml, encoding="utf-8")
+    db_path = tmp_path / "health.duckdb"
+
+    def _boom(*_args, **_kwargs):
+        raise RuntimeError("disk full")
+
+    # Records are flushed first; the workout flush then fails.
+    monkeypatch.setattr(importer, "upsert_workouts", _boom)
+    with pytest.raises(RuntimeError):
+        import_export_xml_to_duckdb_all(export_xml, db_path, record_batch_size=1)
+
+    con = open_db(db_path)
+    try:
+        assert con.execute("SELECT COUNT(*) FROM health_record").fetchone()[0] == 0
+        assert con.execute("SELECT COUNT(*) FROM ingest_log").fetchone()[0] == 0
+    finally:
+        con.close()
+
+
+@pytest.mark.parametrize("order", ["start_at_desc", "start_at_asc"])
+def test_keyset_pages_match_offset_pages(tmp_path: Path, order: str) -> None:
+    # Three records share a start_at, so the cursor has to break ties on record_hash.
+    records = "\n".join(
+        f"""  <Record type=\"HKQuantityTypeIdentifierStepCount\" sourceName=\"iPhone\"
+          unit=\"count\" value=\"{i}\"
+          startDate=\"2020-01-01 10:0{i // 3}:00 +0100\" endDate=\"2020-01-01 10:09:00 +0100\"/>"""
+        for i in range(7)
+    )
+    export_xml = tmp_path / "export.xml"
+    export_xml.write_text(
+        f'<?xml version="1.0" encoding="UTF-8"?>\n<HealthData>\n{records}\n</HealthData>\n',
+        encoding="utf-8",
+    )
+    db_path = tmp_path / "health.duckdb"
+    import_export_xml_to_duckdb_all(export_xml, db_path)
+
+    con = open_db(db_path)
+    try:
+        by_offset = [
+            query_records_page(con, order=order, limit=2, offset=o) for o in range(0, 8, 2)
+        ]
+        by_keyset = []
+        after = None
+        for _ in range(4):
+            page = query_records_page(con, order=order, limit=2, after=after)
+            by_keyset.append(page)
+            if page:
+                after = (page[-1]["start_at"], page[-1]["record_hash"])
+        page_df = query_records_page_df(con, order=order, limit=2, offset=2)
+    finally:
+        con.close()
+
+    assert by_keyset == by_offset
+    assert sum(len(p) for p in by_keyset) == 7
+    assert list(page_df["record_hash"]) == [r["record_hash"] for r in by_offset[1]]
+    assert str(page_df["start_at"].dt.tz) == "UTC"
+
+
+@pytest.mark.parametrize("order", ["start_at_desc", "start_at_asc"])
+def test_dataframe_keyset_pages_on_non_utc_host(
+    tmp_path: Path, new_york_host: None, order: str
+) -> None:
+    records = "\n".join(
+        f"""  <Record type=\"HKQuantityTypeIdentifierStepCount\" sourceName=\"iPhone\"
+          unit=\"count\" value=\"{i}\"
+          startDate=\"2020-01-01 10:0{i // 3}:00 +0100\" endDate=\"2020-01-01 10:09:00 +0100\"/>"""
+        for i in range(7)
+    )
+    export_xml = tmp_path / "export.xml"
+    export_xml.write_text(
+        f'<?xml version="1.0" encoding="UTF-8"?>\n<HealthData>\n{records}\n</HealthData>\n',
+        encoding="utf-8",
+    )
+    db_path = tmp_path / "health.duckdb"
+    import_export_xml_to_duckdb_all(export_xml, db_path)
+
+    con = open_db(db_path)
+    try:
+        by_offset = [
+            list(query_records_page_df(con, order=order, limit=2, offset=o)["record_hash"])
+            for o in range(0, 8, 2)
+        ]
+        # As the Explorer page does: each page seeks past next_page_cursor of the last.
+        by_keyset = []
+        after = None
+        for _ in range(4):
+            page = query_records_page_df(con, order=order, limit=2, after=after)
+            by_keyset.append(list(page["record_hash"]))
+            if not page.empty:
+                after = next_page_cursor(page)
+    finally:
+        con.close()
+
+    assert by_keyset == by_offset
+    assert sum(len(p) for p in by_keyset) == 7
+
+
+@pytest.fixture
+def new_york_host(monkeypatch: pytest.MonkeyPatch) -> None:
+    # DuckDB reads the host time zone once per process, so fake a non-UTC host
+    # by starting every connection in New York time.
+    connect = duckdb_store.duckdb.connect
+
+    def connect_in_new_york(*args, **kwargs):
+        con = connect(*args, **kwargs)
+        con.execute("SET TimeZone = 'America/New_York'")
+        return con
+
+    monkeypatch.setattr(duckdb_store.duckdb, "connect", connect_in_new_york)
+
+
+def test_timestamps_store_as_utc_on_non_utc_host(tmp_path: Path, new_york_host: None) -> None:
+    export_xml = tmp_path / "export.xml"
+    export_xml.write_text(
+        """<?xml version=\"1.0\" encoding=\"UTF-8\"?>
+<HealthData>
+  <Record type=\"HKQuantityTypeIdentifierStepCount\" sourceName=\"iPhone\"
+          unit=\"count\" value=\"42\"
+          startDate=\"2020-01-01 10:00:00 +0100\" endDate=\"2020-01-01 10:05:00 +0100\"/>
+</HealthData>
+""",
+        encoding="utf-8",
+    )
+    db_path = tmp_path / "health.duckdb"
+    import_export_xml_to_duckdb_all(export_xml, db_path)
+
+    con = open_db(db_path)
+    try:
+        stored = con.execute("SELECT CAST(start_at AS VARCHAR) FROM health_record").fetchone()[0]
+        frame = records_dataframe(con)
+        # Bound tz-aware filters have to be compared in UTC too.
+        from_nine = count_records(con, start_at=datetime(2020, 1, 1, 9, tzinfo=UTC))
+        after_nine = count_records(con, start_at=datetime(2020, 1, 1, 9, 1, tzinfo=UTC))
+    finally:
+        con.close()
+
+    assert stored == "2020-01-01 09:00:00"
+    assert (from_nine, after_nine) == (1, 0)
+    assert frame["start_at"].iloc[0] == pd.Timestamp("2020-01-01 09:00", tz="UTC")
@@ -2,7 +2,12 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from apple_health_dashboard.ingest.apple_health_records import iter_records_from_export_xml
+from apple_health_dashboard.ingest.apple_health_records import (
+    iter_records_from_export_xml,
+    stable_record_hash,
+    stable_record_hash_str,
+)
+from apple_health_dashboard.ingest.apple_health_workouts import stable_workout_hash_str
 
 
 def test_record_metadata_fixture(tmp_path: Path) -> None:
@@ -27,3 +32,57 @@ def test_record_metadata_fixture(tmp_path: Path) -> None:
     assert len(meta) == 1
     assert meta[0].key == "HKMetadataKeySyncIdentifier"
     assert meta[0].value == "abc"
+
+
+def test_stable_record_hash_str_matches_record_hash(tmp_path: Path) -> None:
+    xml = """<?xml version=\"1.0\" encoding=\"UTF-8\"?>
+<HealthData locale=\"en_US\">
+  <Record type=\"HKQuantityTypeIdentifierStepCount\" sourceName=\"iPhone\"
+          unit=\"count\" value=\"42\"
+          startDate=\"2020-01-01 10:00:00 +0100\" endDate=\"2020-01-01 10:05:00 +0100\">
+    <MetadataEntry key=\"HKMetadataKeySyncIdentifier\" value=\"abc\"/>
+  </Record>
+</HealthData>
+"""
+
+    export_xml = tmp_path / "export.xml"
+    export_xml.write_text(xml, encoding="utf-8")
+
+    rec, meta = next(iter_records_from_export_xml(export_xml))
+    expected = stable_record_hash_str(
+        rec.record_type,
+        rec.start_at.isoformat(),
+        rec.end_at.isoformat(),
+        None,
+        rec.source_name,
+        rec.unit,
+        rec.value,
+        rec.value_str,
+    )
+    assert stable_record_hash(rec) == expected
+    assert meta[0].record_hash == expected
+
+
+def test_stable_hashes_are_pinned() -> None:
+    # These are the stored dedupe keys; changing them duplicates every row on re-import.
+    assert stable_record_hash_str(
+        "HKQuantityTypeIdentifierHeartRate",
+        "2020-01-01T10:00:00+01:00",
+        "2020-01-01T10:00:05+01:00",
+        None,
+        "Watch",
+        "count/min",
+        61.0,
+        None,
+    ) == "5f440420c0d08d101339111cc0187d69d54d79f7cfb310e9f3b1d2dbd2bf6d91"
+    assert stable_workout_hash_str(
+        "HKWorkoutActivityTypeRunning",
+        "2020-01-01T12:00:00+01:00",
+        "2020-01-01T12:30:00+01:00",
+        None,
+        None,
+        None,
+        30.0,
+        None,
+        None,
+    ) == "e846250ef50875f6a95d2a703a24cf8e71d9baab213fcb8b9c3f3a8444d18bdd"
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta, timezone
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from apple_health_dashboard.ingest.apple_health import HealthRecord
+from apple_health_dashboard.ingest.apple_health_workouts import Workout
+from apple_health_dashboard.services.stats import to_dataframe
+from apple_health_dashboard.services.workouts import workouts_to_dataframe
+from apple_health_dashboard.storage.sqlite_store import (
+    bulk_import,
+    count_records,
+    init_db,
+    iter_records,
+    iter_workouts,
+    open_db,
+    records_dataframe,
+    upsert_records,
+    upsert_workouts,
+    workouts_dataframe,
+)
+
+_PLUS_ONE = timezone(timedelta(hours=1))
+
+
+def _record(start_at: datetime, value: float, type_: str = "HKQuantityTypeIdentifierStepCount"):
+    return HealthRecord(
+        type=type_,
+        start_at=start_at,
+        end_at=start_at + timedelta(minutes=5),
+        creation_at=None,
+        source_name="iPhone",
+        unit="count",
+        value=value,
+        value_str=None,
+    )
+
+
+def test_records_dataframe_is_chronological_and_matches_to_dataframe(tmp_path: Path) -> None:
+    con = open_db(tmp_path / "health.sqlite")
+    init_db(con)
+    # Textually "09:30+00:00" sorts before "10:00+01:00", but 10:00+01:00 is 09:00 UTC.
+    upsert_records(
+        con,
+        [
+            _record(datetime(2020, 1, 1, 9, 30, tzinfo=UTC), 2.0),
+            _record(datetime(2020, 1, 1, 10, 0, tzinfo=_PLUS_ONE), 1.0),
+            _record(datetime(2020, 1, 2, 8, 0, tzinfo=UTC), 3.0, "HKQuantityTypeIdentifierHeight"),
+        ],
+    )
+
+    df = records_dataframe(con)
+
+    assert df["value"].tolist() == [1.0, 2.0, 3.0]
+    assert str(df["start_at"].dtype) == "datetime64[ns, UTC]"
+    assert df["start_at"].iloc[0] == pd.Timestamp("2020-01-01 09:00", tz="UTC")
+    assert isinstance(df["type"].dtype, pd.CategoricalDtype)
+    expected = to_dataframe(sorted(iter_records(con), key=lambda r: r.start_at))
+    pd.testing.assert_frame_equal(df, expected)
+    con.close()
+
+
+def test_workouts_dataframe_matches_workouts_to_dataframe(tmp_path: Path) -> None:
+    con = open_db(tmp_path / "health.sqlite")
+    init_db(con)
+    workout = Workout(
+        workout_activity_type="HKWorkoutActivityTypeRunning",
+        start_at=datetime(2020, 1, 1, 7, 0, tzinfo=_PLUS_ONE),
+        end_at=datetime(2020, 1, 1, 7, 30, tzinfo=_PLUS_ONE),
+        creation_at=None,
+        source_name="Watch",
+        device=None,
+        duration_s=1800.0,
+        total_energy_kcal=300.0,
+        total_distance_m=5000.0,
+    )
+    assert upsert_workouts(con, [workout], []) == (1, 0)
+
+    df = workouts_dataframe(con)
+
+    assert str(df["start_at"].dtype) == "datetime64[ns, UTC]"
+    assert df["start_at"].iloc[0] == pd.Timestamp("2020-01-01 06:00", tz="UTC")
+    assert df["creation_at"].isna().all()
+    expected = workouts_to_dataframe(list(iter_workouts(con)))
+    pd.testing.assert_frame_equal(df, expected[df.columns.tolist()])
+    con.close()
+
+
+def test_bulk_import_rolls_back_the_whole_block_on_error(tmp_path: Path) -> None:
+    con = open_db(tmp_path / "health.sqlite")
+    init_db(con)
+
+    with pytest.raises(RuntimeError):
+        with bulk_import(con):
+            # The upsert joins the outer transaction instead of committing on its own.
+            assert upsert_records(con, [_record(datetime(2020, 1, 1, tzinfo=UTC), 1.0)]) == 1
+            assert con.in_transaction
+            raise RuntimeError("import failed")
+
+    assert not con.in_transaction
+    assert count_records(con) == 0
+
+    with bulk_import(con):
+        upsert_records(con, [_record(datetime(2020, 1, 1, tzinfo=UTC), 1.0)])
+    assert count_records(con) == 1
+    con.close()
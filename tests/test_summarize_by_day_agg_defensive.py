@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
 from apple_health_dashboard.services.stats import summarize_by_day_agg
@@ -26,3 +27,42 @@ def test_summarize_by_day_agg_value_as_dataframe_is_handled() -> None:
     out = summarize_by_day_agg(df, agg="sum")
     assert not out.empty
     assert out.iloc[0]["value"] == 1.0
+
+
+def test_summarize_by_day_agg_ignores_a_callers_day_column() -> None:
+    df = pd.DataFrame(
+        {
+            "start_at": pd.to_datetime(
+                ["2020-01-02 09:00", "2020-01-01 08:00", "2020-01-01 20:00", None], utc=True
+            ),
+            "value": [5.0, 1.0, 2.0, 9.0],
+        }
+    )
+    # Keyed on the next day (like sleep on end_at), and as plain date objects.
+    next_day = df.assign(day=df["start_at"].dt.floor("D") + pd.Timedelta(days=1))
+    as_dates = df.assign(day=[ts.date() if pd.notna(ts) else None for ts in df["start_at"]])
+
+    for agg in ("sum", "mean", "last"):
+        expected = summarize_by_day_agg(df, agg=agg)
+        assert summarize_by_day_agg(next_day, agg=agg).equals(expected)
+        assert summarize_by_day_agg(as_dates, agg=agg).equals(expected)
+    assert summarize_by_day_agg(df, agg="last")["value"].tolist() == [2.0, 5.0]
+
+
+def test_summarize_by_day_agg_sums_match_groupby_exactly() -> None:
+    rng = np.random.default_rng(0)
+    n = 50_000
+    start_at = pd.Series(
+        pd.Timestamp("2020-01-01", tz="UTC") + pd.to_timedelta(rng.integers(0, 400 * 86400, n), "s")
+    )
+    # Values over ~12 orders of magnitude: plain float accumulation drifts from
+    # pandas' compensated sums in the last bits here.
+    values = rng.random(n) * 10.0 ** rng.integers(-6, 7, n)
+    df = pd.DataFrame({"start_at": start_at, "value": values})
+    grouped = df.groupby(df["start_at"].dt.floor("D").rename("day"))["value"]
+
+    for agg in ("sum", "mean"):
+        expected = grouped.agg(value=agg, count="count").reset_index()
+        pd.testing.assert_frame_equal(
+            summarize_by_day_agg(df, agg=agg), expected, check_exact=True
+        )